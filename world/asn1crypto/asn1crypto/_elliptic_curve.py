@@ -16,9 +16,11 @@ Exports the following items:
  - SECP384R1_BASE_POINT
  - SECP521R1_CURVE
  - SECP521R1_BASE_POINT
+ - NAMED_CURVES
 
 The curve constants are all PrimeCurve() objects and the base point constants
-are all PrimePoint() objects.
+are all PrimePoint() objects. NAMED_CURVES maps unicode string curve names to
+the curve constants.
 
 Some of the following source code is derived from
 http://webpages.charter.net/curryfans/peter/downloads.html, but has been heavily
@@ -74,6 +76,38 @@ class PrimeCurve():
         self.p = p
         self.a = a
         self.b = b
+        self.byte_size = (p.bit_length() + 7) // 8
+
+    def decompress(self, x, y_is_odd):
+        """
+        Recovers the y coordinate of a point from its x coordinate and the
+        parity of y, as encoded in a compressed point
+
+        :param x:
+            The x coordinate of the point as an integer
+
+        :param y_is_odd:
+            A boolean - if y is an odd integer
+
+        :raises:
+            ValueError - when x is not the x coordinate of a point on the curve
+
+        :return:
+            The y coordinate of the point as an integer
+        """
+
+        p = self.p
+        if not 0 <= x < p:
+            raise ValueError('Invalid EC point - x coordinate is not a field element')
+
+        y2 = (x * x * x + self.a * x + self.b) % p
+        y = _sqrt_mod(y2, p)
+        if y is None:
+            raise ValueError('Invalid EC point - x coordinate is not on the curve')
+
+        if (y & 1) != bool(y_is_odd):
+            y = (p - y) % p
+        return y
 
     def contains(self, point):
         """
@@ -89,6 +123,62 @@ class PrimeCurve():
         return (y2 - (x3 + self.a * point.x + self.b)) % self.p == 0
 
 
+def _sqrt_mod(value, p):
+    """
+    Finds a square root modulo an odd prime
+
+    :param value:
+        An integer in the range [0, p)
+
+    :param p:
+        The odd prime modulus as an integer
+
+    :return:
+        None if value is not a quadratic residue, otherwise an integer square
+        root of value
+    """
+
+    if value == 0:
+        return 0
+
+    # All of the NIST curves other than P-224 have p = 3 mod 4, where the
+    # square root is a single exponentiation
+    if p % 4 == 3:
+        root = pow(value, (p + 1) // 4, p)
+        return root if (root * root) % p == value else None
+
+    if pow(value, (p - 1) // 2, p) != 1:
+        return None
+
+    # Tonelli-Shanks, with p - 1 = q * 2^s and q odd
+    q = p - 1
+    s = 0
+    while q % 2 == 0:
+        q //= 2
+        s += 1
+
+    z = 2
+    while pow(z, (p - 1) // 2, p) != p - 1:
+        z += 1
+
+    m = s
+    c = pow(z, q, p)
+    t = pow(value, q, p)
+    root = pow(value, (q + 1) // 2, p)
+    while t != 1:
+        i = 1
+        t2 = (t * t) % p
+        while t2 != 1:
+            t2 = (t2 * t2) % p
+            i += 1
+        b = pow(c, 1 << (m - i - 1), p)
+        m = i
+        c = (b * b) % p
+        t = (t * c) % p
+        root = (root * b) % p
+    return root
+
+
 class PrimePoint():
     """
     A point on a prime-field elliptic curve
@@ -312,3 +402,12 @@ SECP521R1_BASE_POINT = PrimePoint(
     0x11839296a789a3bc0045c8a5fb42c7d1bd998f54449579b446817afbd17273e662c97ee72995ef42640c550b9013fad0761353c7086a272c24088be94769fd16650,  # noqa
     6864797660130609714981900799081393217269435300143305409394463459185543183397655394245057746333217197532963996371363321113864768612440380340372808892707005449  # noqa
 )
+
+
+NAMED_CURVES = {
+    'secp192r1': SECP192R1_CURVE,
+    'secp224r1': SECP224R1_CURVE,
+    'secp256r1': SECP256R1_CURVE,
+    'secp384r1': SECP384R1_CURVE,
+    'secp521r1': SECP521R1_CURVE,
+}
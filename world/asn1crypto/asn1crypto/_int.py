@@ -88,6 +88,6 @@ def fill_width(bytes_, width):
         A byte string of the width specified
     """
 
-    while len(bytes_) < width:
-        bytes_ = b'\x00' + bytes_
-    return bytes_
+    if len(bytes_) >= width:
+        return bytes_
+    return (b'\x00' * (width - len(bytes_))) + bytes_
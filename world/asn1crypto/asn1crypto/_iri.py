@@ -34,6 +34,32 @@ else:
     )
 
 
+# Conversions are cached, since the same CRL distribution point and authority
+# information access URLs are compared over and over during path validation
+_CACHE_SIZE = 1024
+_IRI_TO_URI_CACHE = {}
+_URI_TO_IRI_CACHE = {}
+
+
+def _cache_value(cache, key, value):
+    """
+    Stores a converted value, flushing the cache once it reaches its size limit
+
+    :param cache:
+        The dict to store the value in
+
+    :param key:
+        The value that was converted
+
+    :param value:
+        The converted value
+    """
+
+    if len(cache) >= _CACHE_SIZE:
+        cache.clear()
+    cache[key] = value
+
+
 def iri_to_uri(value):
     """
     Normalizes and encodes a unicode IRI into an ASCII byte string URI
@@ -53,6 +79,24 @@ def iri_to_uri(value):
             type_name(value)
         ))
 
+    output = _IRI_TO_URI_CACHE.get(value)
+    if output is None:
+        output = _iri_to_uri(value)
+        _cache_value(_IRI_TO_URI_CACHE, value, output)
+    return output
+
+
+def _iri_to_uri(value):
+    """
+    Performs the conversion for iri_to_uri()
+
+    :param value:
+        A unicode string of an IRI
+
+    :return:
+        A byte string of the ASCII-encoded URI
+    """
+
     scheme = None
     # Python 2.6 doesn't split properly is the URL doesn't start with http:// or https://
     if sys.version_info < (2, 7) and not value.startswith('http://') and not value.startswith('https://'):
@@ -133,6 +177,24 @@ def uri_to_iri(value):
             type_name(value)
         ))
 
+    output = _URI_TO_IRI_CACHE.get(value)
+    if output is None:
+        output = _uri_to_iri(value)
+        _cache_value(_URI_TO_IRI_CACHE, value, output)
+    return output
+
+
+def _uri_to_iri(value):
+    """
+    Performs the conversion for uri_to_iri()
+
+    :param value:
+        An ASCII-encoded byte string of the URI
+
+    :return:
+        A unicode string of the IRI
+    """
+
     parsed = urlsplit(value)
 
     scheme = parsed.scheme
@@ -143,7 +205,11 @@ def uri_to_iri(value):
     password = _urlunquote(parsed.password, remap=[':', '@'])
     hostname = parsed.hostname
     if hostname:
-        hostname = hostname.decode('idna')
+        # Only labels with the ACE prefix are changed by IDNA decoding
+        if hostname.find(b'xn--') == -1:
+            hostname = hostname.decode('ascii')
+        else:
+            hostname = hostname.decode('idna')
     port = parsed.port
     if port and not isinstance(port, int_types):
         port = port.decode('ascii')
@@ -207,7 +273,7 @@ def _urlquote(string, safe=''):
     # Anything already hex quoted is pulled out of the URL and unquoted if
     # possible
     escapes = []
-    if re.search('%[0-9a-fA-F]{2}', string):
+    if string.find('%') != -1 and re.search('%[0-9a-fA-F]{2}', string):
         # Try to unquote any percent values, restoring them if they are not
         # valid UTF-8. Also, requote any safe chars since encoded versions of
         # those are functionally different than the unquoted ones.
@@ -239,6 +305,10 @@ def _urlquote(string, safe=''):
     return output
 
 
+# Bytes that make _urlunquote() do more than decode a value
+_UNQUOTE_NEEDED = re.compile(b'[%\x1A\x1C-\x1F]')
+
+
 def _urlunquote(byte_string, remap=None, preserve=None):
     """
     Unquotes a URI portion from a byte string into unicode using UTF-8
@@ -265,6 +335,19 @@ def _urlunquote(byte_string, remap=None, preserve=None):
     if byte_string == b'':
         return ''
 
+    # Without any %XX escapes, or characters to remap or that are used as
+    # placeholders when preserving, the value only needs to be decoded
+    if not _UNQUOTE_NEEDED.search(byte_string):
+        if preserve or not remap:
+            return byte_string.decode('utf-8', 'iriutf8')
+        plain = True
+        for char in remap:
+            if byte_string.find(char.encode('ascii')) != -1:
+                plain = False
+                break
+        if plain:
+            return byte_string.decode('utf-8', 'iriutf8')
+
     if preserve:
         replacements = ['\x1A', '\x1C', '\x1D', '\x1E', '\x1F']
         preserve_unmap = {}
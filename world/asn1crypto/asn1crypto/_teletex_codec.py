@@ -4,6 +4,7 @@
 Implementation of the teletex T.61 codec. Exports the following items:
 
  - register()
+ - decode()
 """
 
 from __future__ import unicode_literals, division, absolute_import, print_function
@@ -69,6 +70,20 @@ def register():
     codecs.register(teletex_search_function)
 
 
+def decode(input_):
+    """
+    Decodes a teletex byte string without going through the codec registry
+
+    :param input_:
+        A byte string
+
+    :return:
+        A unicode string
+    """
+
+    return codecs.charmap_decode(input_, 'strict', DECODING_TABLE)[0]
+
+
 # http://en.wikipedia.org/wiki/ITU_T.61
 DECODING_TABLE = (
     '\u0000'
@@ -0,0 +1,261 @@
+# coding: utf-8
+
+"""
+ASN.1 type classes for X.400 addresses, as used by the x400_address
+alternative of x509.GeneralName. These are kept separate from
+asn1crypto.x509 so they are only imported when such an address is parsed.
+Exports the following items:
+
+ - ORAddress()
+
+Other type classes are defined that help compose the types listed above.
+"""
+
+from __future__ import unicode_literals, division, absolute_import, print_function
+
+from .core import (
+    Any,
+    Choice,
+    Integer,
+    NumericString,
+    OctetString,
+    PrintableString,
+    Sequence,
+    SequenceOf,
+    Set,
+    SetOf,
+    TeletexString,
+)
+
+
+class CountryName(Choice):
+    class_ = 1
+    tag = 1
+
+    _alternatives = [
+        ('x121_dcc_code', NumericString),
+        ('iso_3166_alpha2_code', PrintableString),
+    ]
+
+
+class AdministrationDomainName(Choice):
+    class_ = 1
+    tag = 2
+
+    _alternatives = [
+        ('numeric', NumericString),
+        ('printable', PrintableString),
+    ]
+
+
+class PrivateDomainName(Choice):
+    _alternatives = [
+        ('numeric', NumericString),
+        ('printable', PrintableString),
+    ]
+
+
+class PersonalName(Set):
+    _fields = [
+        ('surname', PrintableString, {'tag_type': 'implicit', 'tag': 0}),
+        ('given_name', PrintableString, {'tag_type': 'implicit', 'tag': 1, 'optional': True}),
+        ('initials', PrintableString, {'tag_type': 'implicit', 'tag': 2, 'optional': True}),
+        ('generation_qualifier', PrintableString, {'tag_type': 'implicit', 'tag': 3, 'optional': True}),
+    ]
+
+
+class TeletexPersonalName(Set):
+    _fields = [
+        ('surname', TeletexString, {'tag_type': 'implicit', 'tag': 0}),
+        ('given_name', TeletexString, {'tag_type': 'implicit', 'tag': 1, 'optional': True}),
+        ('initials', TeletexString, {'tag_type': 'implicit', 'tag': 2, 'optional': True}),
+        ('generation_qualifier', TeletexString, {'tag_type': 'implicit', 'tag': 3, 'optional': True}),
+    ]
+
+
+class OrganizationalUnitNames(SequenceOf):
+    _child_spec = PrintableString
+
+
+class TeletexOrganizationalUnitNames(SequenceOf):
+    _child_spec = TeletexString
+
+
+class BuiltInStandardAttributes(Sequence):
+    _fields = [
+        ('country_name', CountryName, {'optional': True}),
+        ('administration_domain_name', AdministrationDomainName, {'optional': True}),
+        ('network_address', NumericString, {'tag_type': 'implicit', 'tag': 0, 'optional': True}),
+        ('terminal_identifier', PrintableString, {'tag_type': 'implicit', 'tag': 1, 'optional': True}),
+        ('private_domain_name', PrivateDomainName, {'tag_type': 'explicit', 'tag': 2, 'optional': True}),
+        ('organization_name', PrintableString, {'tag_type': 'implicit', 'tag': 3, 'optional': True}),
+        ('numeric_user_identifier', NumericString, {'tag_type': 'implicit', 'tag': 4, 'optional': True}),
+        ('personal_name', PersonalName, {'tag_type': 'implicit', 'tag': 5, 'optional': True}),
+        ('organizational_unit_names', OrganizationalUnitNames, {'tag_type': 'implicit', 'tag': 6, 'optional': True}),
+    ]
+
+
+class BuiltInDomainDefinedAttribute(Sequence):
+    _fields = [
+        ('type', PrintableString),
+        ('value', PrintableString),
+    ]
+
+
+class BuiltInDomainDefinedAttributes(SequenceOf):
+    _child_spec = BuiltInDomainDefinedAttribute
+
+
+class TeletexDomainDefinedAttribute(Sequence):
+    _fields = [
+        ('type', TeletexString),
+        ('value', TeletexString),
+    ]
+
+
+class TeletexDomainDefinedAttributes(SequenceOf):
+    _child_spec = TeletexDomainDefinedAttribute
+
+
+class PhysicalDeliveryCountryName(Choice):
+    _alternatives = [
+        ('x121_dcc_code', NumericString),
+        ('iso_3166_alpha2_code', PrintableString),
+    ]
+
+
+class PostalCode(Choice):
+    _alternatives = [
+        ('numeric_code', NumericString),
+        ('printable_code', PrintableString),
+    ]
+
+
+class PDSParameter(Set):
+    _fields = [
+        ('printable_string', PrintableString, {'optional': True}),
+        ('teletex_string', TeletexString, {'optional': True}),
+    ]
+
+
+class PrintableAddress(SequenceOf):
+    _child_spec = PrintableString
+
+
+class UnformattedPostalAddress(Set):
+    _fields = [
+        ('printable_address', PrintableAddress, {'optional': True}),
+        ('teletex_string', TeletexString, {'optional': True}),
+    ]
+
+
+class E1634Address(Sequence):
+    _fields = [
+        ('number', NumericString, {'tag_type': 'implicit', 'tag': 0}),
+        ('sub_address', NumericString, {'tag_type': 'implicit', 'tag': 1, 'optional': True}),
+    ]
+
+
+class NAddresses(SetOf):
+    _child_spec = OctetString
+
+
+class PresentationAddress(Sequence):
+    _fields = [
+        ('p_selector', OctetString, {'tag_type': 'explicit', 'tag': 0, 'optional': True}),
+        ('s_selector', OctetString, {'tag_type': 'explicit', 'tag': 1, 'optional': True}),
+        ('t_selector', OctetString, {'tag_type': 'explicit', 'tag': 2, 'optional': True}),
+        ('n_addresses', NAddresses, {'tag_type': 'explicit', 'tag': 3}),
+    ]
+
+
+class ExtendedNetworkAddress(Choice):
+    _alternatives = [
+        ('e163_4_address', E1634Address),
+        ('psap_address', PresentationAddress, {'tag_type': 'implicit', 'tag': 0})
+    ]
+
+
+class TerminalType(Integer):
+    _map = {
+        3: 'telex',
+        4: 'teletex',
+        5: 'g3_facsimile',
+        6: 'g4_facsimile',
+        7: 'ia5_terminal',
+        8: 'videotex',
+    }
+
+
+class ExtensionAttributeType(Integer):
+    _map = {
+        1: 'common_name',
+        2: 'teletex_common_name',
+        3: 'teletex_organization_name',
+        4: 'teletex_personal_name',
+        5: 'teletex_organization_unit_names',
+        6: 'teletex_domain_defined_attributes',
+        7: 'pds_name',
+        8: 'physical_delivery_country_name',
+        9: 'postal_code',
+        10: 'physical_delivery_office_name',
+        11: 'physical_delivery_office_number',
+        12: 'extension_of_address_components',
+        13: 'physical_delivery_personal_name',
+        14: 'physical_delivery_organization_name',
+        15: 'extension_physical_delivery_address_components',
+        16: 'unformatted_postal_address',
+        17: 'street_address',
+        18: 'post_office_box_address',
+        19: 'poste_restante_address',
+        20: 'unique_postal_name',
+        21: 'local_postal_attributes',
+        22: 'extended_network_address',
+        23: 'terminal_type',
+    }
+
+
+class ExtensionAttribute(Sequence):
+    _fields = [
+        ('extension_attribute_type', ExtensionAttributeType, {'tag_type': 'implicit', 'tag': 0}),
+        ('extension_attribute_value', Any, {'tag_type': 'explicit', 'tag': 1}),
+    ]
+
+    _oid_pair = ('extension_attribute_type', 'extension_attribute_value')
+    _oid_specs = {
+        'common_name': PrintableString,
+        'teletex_common_name': TeletexString,
+        'teletex_organization_name': TeletexString,
+        'teletex_personal_name': TeletexPersonalName,
+        'teletex_organization_unit_names': TeletexOrganizationalUnitNames,
+        'teletex_domain_defined_attributes': TeletexDomainDefinedAttributes,
+        'pds_name': PrintableString,
+        'physical_delivery_country_name': PhysicalDeliveryCountryName,
+        'postal_code': PostalCode,
+        'physical_delivery_office_name': PDSParameter,
+        'physical_delivery_office_number': PDSParameter,
+        'extension_of_address_components': PDSParameter,
+        'physical_delivery_personal_name': PDSParameter,
+        'physical_delivery_organization_name': PDSParameter,
+        'extension_physical_delivery_address_components': PDSParameter,
+        'unformatted_postal_address': UnformattedPostalAddress,
+        'street_address': PDSParameter,
+        'post_office_box_address': PDSParameter,
+        'poste_restante_address': PDSParameter,
+        'unique_postal_name': PDSParameter,
+        'local_postal_attributes': PDSParameter,
+        'extended_network_address': ExtendedNetworkAddress,
+        'terminal_type': TerminalType,
+    }
+
+
+class ExtensionAttributes(SequenceOf):
+    _child_spec = ExtensionAttribute
+
+
+class ORAddress(Sequence):
+    _fields = [
+        ('built_in_standard_attributes', BuiltInStandardAttributes),
+        ('built_in_domain_defined_attributes', BuiltInDomainDefinedAttributes, {'optional': True}),
+        ('extension_attributes', ExtensionAttributes, {'optional': True}),
+    ]
@@ -20,8 +20,7 @@ Other type classes are defined that help compose the types listed above.
 from __future__ import unicode_literals, division, absolute_import, print_function
 
 from ._errors import unwrap
-from ._int import fill_width
-from .util import int_from_bytes, int_to_bytes
+from .util import int_from_bytes, int_to_bytes, ints_from_bytes, ints_to_bytes
 from .core import (
     Any,
     Choice,
@@ -541,8 +540,13 @@ class DSASignature(Sequence):
             A DSASignature object
         """
 
-        r = int_from_bytes(data[0:len(data) // 2])
-        s = int_from_bytes(data[len(data) // 2:])
+        half = len(data) // 2
+        if half and len(data) % 2 == 0:
+            r, s = ints_from_bytes(data, half)
+        else:
+            # Malformed lengths split unevenly, as the halves are read apart
+            r = int_from_bytes(data[0:half])
+            s = int_from_bytes(data[half:])
         return cls({'r': r, 's': s})
 
     def to_p1363(self):
@@ -554,14 +558,237 @@ class DSASignature(Sequence):
             A byte string compatible with BCryptVerifySignature()
         """
 
-        r_bytes = int_to_bytes(self['r'].native)
-        s_bytes = int_to_bytes(self['s'].native)
+        r = self['r'].native
+        s = self['s'].native
 
-        int_byte_length = max(len(r_bytes), len(s_bytes))
-        r_bytes = fill_width(r_bytes, int_byte_length)
-        s_bytes = fill_width(s_bytes, int_byte_length)
+        int_byte_length = ((max(r.bit_length(), s.bit_length()) + 7) // 8) or 1
+        return ints_to_bytes([r, s], int_byte_length)
 
-        return r_bytes + s_bytes
+    @classmethod
+    def from_p1363_many(cls, data, signature_size=None):
+        """
+        Converts a batch of IEEE P1363 signatures to DER-encoded DSS-Sig-Value
+        structures. The encoding is written directly from the signature
+        octets, so no integers or DSASignature objects are created.
+
+        :param data:
+            A list of byte strings, each containing the r and s values of a
+            signature, or a byte string of signatures concatenated together
+
+        :param signature_size:
+            An integer byte length of each signature - required when data is a
+            byte string of concatenated signatures
+
+        :raises:
+            ValueError - when the signatures can not be split into r and s
+
+        :return:
+            A list of byte strings of DER-encoded signatures
+        """
+
+        if isinstance(data, (list, tuple)):
+            ranges = []
+            buffers = []
+            for signature in data:
+                buffers.append(bytearray(signature))
+                ranges.append((0, len(signature)))
+        else:
+            if not signature_size:
+                raise ValueError(unwrap(
+                    '''
+                    signature_size must be specified when data is a byte
+                    string of concatenated signatures
+                    '''
+                ))
+            if len(data) % signature_size != 0:
+                raise ValueError(unwrap(
+                    '''
+                    data length, %s, is not a multiple of signature_size, %s
+                    ''',
+                    len(data),
+                    signature_size
+                ))
+            buffer = bytearray(data)
+            ranges = [(start, start + signature_size) for start in range(0, len(data), signature_size)]
+            buffers = [buffer] * len(ranges)
+
+        output = []
+        for buffer, (start, end) in zip(buffers, ranges):
+            size = end - start
+            if size == 0 or size % 2 != 0:
+                raise ValueError(unwrap(
+                    '''
+                    P1363 signatures must be a non-zero, even number of bytes
+                    long, not %s
+                    ''',
+                    size
+                ))
+            middle = start + size // 2
+            contents = _der_unsigned_integer(buffer, start, middle) + _der_unsigned_integer(buffer, middle, end)
+            output.append(b'\x30' + _der_length(len(contents)) + contents)
+        return output
+
+    @classmethod
+    def to_p1363_many(cls, signatures, int_byte_length=None):
+        """
+        Converts a batch of DER-encoded DSS-Sig-Value structures to IEEE P1363
+        signatures. The r and s octets are copied directly from the encoding,
+        so no integers or DSASignature objects are created.
+
+        :param signatures:
+            A list of byte strings of DER-encoded signatures
+
+        :param int_byte_length:
+            An integer byte length to pad r and s to, e.g. 32 for P-256. If
+            None, each signature is padded to the longer of its own r and s,
+            matching to_p1363().
+
+        :raises:
+            ValueError - when a signature is not a valid DER-encoded DSS-Sig-Value
+
+        :return:
+            A list of byte strings - b''.join() the result to produce a
+            buffer of fixed-width signatures
+        """
+
+        output = []
+        for signature in signatures:
+            encoded = bytearray(signature)
+            end = len(encoded)
+            if end < 2 or encoded[0] != 0x30:
+                raise ValueError('Signature is not a DER-encoded SEQUENCE')
+            pointer, contents_end = _der_read_length(encoded, 1)
+            if contents_end != end:
+                raise ValueError('Signature SEQUENCE length does not match the data length')
+
+            r_start, r_end = _der_read_integer(encoded, pointer, end)
+            s_start, s_end = _der_read_integer(encoded, r_end, end)
+            if s_end != end:
+                raise ValueError('Signature contains data after the s INTEGER')
+
+            r_bytes = encoded[r_start:r_end]
+            s_bytes = encoded[s_start:s_end]
+            width = int_byte_length
+            if width is None:
+                width = max(len(r_bytes), len(s_bytes))
+            elif len(r_bytes) > width or len(s_bytes) > width:
+                raise ValueError(unwrap(
+                    '''
+                    Signature integers do not fit in %s bytes
+                    ''',
+                    width
+                ))
+            output.append(
+                bytes(bytearray(width - len(r_bytes)) + r_bytes + bytearray(width - len(s_bytes)) + s_bytes)
+            )
+        return output
+
+
+def _der_length(length):
+    """
+    Encodes the length octets of a DER value
+
+    :param length:
+        An integer of the number of contents bytes
+
+    :return:
+        A byte string
+    """
+
+    if length < 128:
+        return bytes(bytearray([length]))
+    length_bytes = int_to_bytes(length)
+    return bytes(bytearray([0x80 | len(length_bytes)])) + length_bytes
+
+
+def _der_unsigned_integer(buffer, start, end):
+    """
+    Encodes a big-endian unsigned integer as a DER INTEGER, stripping
+    leading zero bytes and adding one if the high bit is set
+
+    :param buffer:
+        A bytearray containing the integer
+
+    :param start:
+        The integer offset of the first byte of the integer
+
+    :param end:
+        The integer offset after the last byte of the integer
+
+    :return:
+        A byte string of the encoded INTEGER
+    """
+
+    while start < end - 1 and buffer[start] == 0:
+        start += 1
+    contents = bytes(buffer[start:end])
+    if buffer[start] & 0x80:
+        contents = b'\x00' + contents
+    return b'\x02' + _der_length(len(contents)) + contents
+
+
+def _der_read_length(encoded, pointer):
+    """
+    Reads the length octets of a DER value
+
+    :param encoded:
+        A bytearray of the encoded data
+
+    :param pointer:
+        The integer offset of the first length octet
+
+    :raises:
+        ValueError - when the length is indefinite or truncated
+
+    :return:
+        A 2-element tuple of the integer offset of the contents and the
+        integer offset of the end of the contents
+    """
+
+    if pointer >= len(encoded):
+        raise ValueError('Signature is truncated')
+    length = encoded[pointer]
+    pointer += 1
+    if length & 0x80:
+        num_octets = length & 0x7F
+        if num_octets == 0 or pointer + num_octets > len(encoded):
+            raise ValueError('Signature contains an invalid length')
+        length = int_from_bytes(bytes(encoded[pointer:pointer + num_octets]))
+        pointer += num_octets
+    return (pointer, pointer + length)
+
+
+def _der_read_integer(encoded, pointer, end):
+    """
+    Locates the magnitude of a non-negative DER INTEGER
+
+    :param encoded:
+        A bytearray of the encoded data
+
+    :param pointer:
+        The integer offset of the INTEGER tag
+
+    :param end:
+        The integer offset the INTEGER must end by
+
+    :raises:
+        ValueError - when the value is not a non-negative INTEGER
+
+    :return:
+        A 2-element tuple of the integer offset of the first byte, after any
+        leading zero bytes, and the integer offset of the end of the contents
+    """
+
+    if pointer >= end or encoded[pointer] != 0x02:
+        raise ValueError('Signature does not contain an INTEGER')
+    start, contents_end = _der_read_length(encoded, pointer + 1)
+    if contents_end > end or contents_end == start:
+        raise ValueError('Signature contains an invalid INTEGER')
+    if encoded[start] & 0x80:
+        raise ValueError('Signature contains a negative INTEGER')
+    while start < contents_end - 1 and encoded[start] == 0:
+        start += 1
+    return (start, contents_end)
 
 
 class EncryptionAlgorithmId(ObjectIdentifier):
@@ -13,17 +13,27 @@ compatible with PKCS#7. Exports the following items:
  - EnvelopedData()
  - SignedAndEnvelopedData()
  - SignedData()
+ - digest_signed_data()
+ - iter_decompressed_data()
 
 Other type classes are defined that help compose the types listed above.
 """
 
 from __future__ import unicode_literals, division, absolute_import, print_function
 
+import hashlib
+import sys
+
 try:
     import zlib
 except (ImportError):
     zlib = None
 
+if sys.version_info < (3,):
+    _PY2 = True
+else:
+    _PY2 = False
+
 from .algos import (
     _ForceNullParameters,
     DigestAlgorithm,
@@ -49,9 +59,8 @@ from .core import (
     UTCTime,
     UTF8String,
 )
-from .crl import CertificateList
 from .keys import PublicKeyInfo
-from .ocsp import OCSPResponse
+from .parser import _StreamReader, emit
 from .x509 import Attributes, Certificate, Extensions, GeneralName, GeneralNames, Name
 
 
@@ -531,7 +540,7 @@ class DigestAlgorithms(SetOf):
 
 
 class CertificateRevocationLists(SetOf):
-    _child_spec = CertificateList
+    _child_spec = '.crl.CertificateList'
 
 
 class SCVPReqRes(Sequence):
@@ -556,14 +565,14 @@ class OtherRevocationInfoFormat(Sequence):
 
     _oid_pair = ('other_rev_info_format', 'other_rev_info')
     _oid_specs = {
-        'ocsp_response': OCSPResponse,
+        'ocsp_response': '.ocsp.OCSPResponse',
         'scvp': SCVPReqRes,
     }
 
 
 class RevocationInfoChoice(Choice):
     _alternatives = [
-        ('crl', CertificateList),
+        ('crl', '.crl.CertificateList'),
         ('other', OtherRevocationInfoFormat, {'tag_type': 'implciit', 'tag': 1}),
     ]
 
@@ -863,6 +872,47 @@ class CompressionAlgorithm(Sequence):
     ]
 
 
+def _inflate(chunks, chunk_size):
+    """
+    Decompresses zlib data while bounding the size of each output chunk
+
+    :param chunks:
+        An iterable of byte strings of compressed data
+
+    :param chunk_size:
+        An integer of the maximum number of bytes to yield at once
+
+    :raises:
+        zlib.error - when the compressed data is invalid or truncated
+
+    :return:
+        A generator yielding byte strings
+    """
+
+    if zlib is None:
+        raise SystemError('The zlib module is not available')
+
+    decompressor = zlib.decompressobj()
+    for chunk in chunks:
+        if _PY2 and isinstance(chunk, memoryview):
+            # The Python 2 decompressor does not accept memoryview objects
+            chunk = chunk.tobytes()
+        while chunk:
+            data = decompressor.decompress(chunk, chunk_size)
+            chunk = decompressor.unconsumed_tail
+            if data:
+                yield data
+            # Like zlib.decompress(), ignore anything after the end of the
+            # stream. Python 2 has no .eof, but sets .unused_data instead.
+            if getattr(decompressor, 'eof', False) or decompressor.unused_data:
+                return
+    data = decompressor.flush()
+    if data:
+        yield data
+    if not getattr(decompressor, 'eof', True):
+        raise zlib.error('Error -5 while decompressing data: incomplete or truncated stream')
+
+
 class CompressedData(Sequence):
     _fields = [
         ('version', CMSVersion),
@@ -880,6 +930,21 @@ class CompressedData(Sequence):
             self._decompressed = zlib.decompress(self['encap_content_info']['content'].native)
         return self._decompressed
 
+    def decompressed_chunks(self, chunk_size=65536):
+        """
+        Decompresses the content incrementally, feeding each chunk of a
+        possibly-constructed octet string to the decompressor in turn
+
+        :param chunk_size:
+            An integer of the maximum number of decompressed bytes to yield
+            at once
+
+        :return:
+            A generator yielding byte strings of the decompressed content
+        """
+
+        return _inflate(self['encap_content_info']['content']._iter_chunks(), chunk_size)
+
 
 ContentInfo._oid_specs = {
     'data': OctetString,
@@ -913,3 +978,215 @@ CMSAttribute._oid_specs = {
     'counter_signature': SignerInfos,
     'signature_time_stamp_token': SetOfContentInfo,
 }
+
+
+def _end_of_container(reader, info, end):
+    """
+    Reads the header of the next value inside a container, detecting the end
+    of both definite and indefinite length containers
+
+    :param reader:
+        An asn1crypto.parser._StreamReader object
+
+    :param info:
+        The 5-element header tuple of the container
+
+    :param end:
+        The integer offset the container ends at, or None if indefinite
+
+    :return:
+        None if the container has ended, otherwise the 5-element header tuple
+        of the next value
+    """
+
+    if end is not None:
+        if reader.offset >= end:
+            return None
+        return reader.read_header()
+    sub_info = reader.read_header()
+    if sub_info[3] == b'\x00\x00':
+        return None
+    return sub_info
+
+
+def _expect(info, class_, method, tag, description, structure='SignedData'):
+    """
+    Raises a ValueError if a header does not match the expected identifier
+    """
+
+    if info is None or info[0:3] != (class_, method, tag):
+        raise ValueError('Unable to find %s in %s structure' % (description, structure))
+
+
+def digest_signed_data(source, content=None, chunk_size=65536):
+    """
+    Hashes the encapsulated content of a ContentInfo containing SignedData
+    in a single pass, without loading the content into memory. The content
+    bytes, including every chunk of a BER constructed octet string, are fed
+    directly into a hash object for each algorithm listed in the
+    digest_algorithms field.
+
+    :param source:
+        A byte string, mmap.mmap object or file-like object of the
+        BER/DER-encoded ContentInfo
+
+    :param content:
+        A file-like object of the external content to hash, used for
+        detached signatures where eContent is absent
+
+    :param chunk_size:
+        An integer of the maximum number of bytes to read at once
+
+    :raises:
+        ValueError - when the source is not a ContentInfo containing SignedData,
+        or a digest algorithm is an extendable-output function such as SHAKE
+
+    :return:
+        A 2-element tuple:
+         - 0: A SignedData object, with the eContent omitted from the
+           encap_content_info field
+         - 1: A dict mapping digest algorithm names (from
+           algos.DigestAlgorithmId) to byte string digests of the content
+    """
+
+    reader = _StreamReader(source)
+
+    info = reader.read_header()
+    _expect(info, 0, 1, 16, 'ContentInfo')
+    content_type = ContentType.load(reader.read_value())
+    if content_type.native != 'signed_data':
+        raise ValueError('ContentInfo contains %s, not signed_data' % content_type.native)
+    _expect(reader.read_header(), 2, 1, 0, 'explicit content tag')
+
+    signed_data_info = reader.read_header()
+    _expect(signed_data_info, 0, 1, 16, 'SignedData')
+    signed_data_end = None
+    if signed_data_info[4] is not None:
+        signed_data_end = reader.offset + signed_data_info[4]
+
+    version = reader.read_value()
+    digest_algorithms = reader.read_value()
+    hashers = {}
+    for digest_algorithm in DigestAlgorithms.load(digest_algorithms):
+        name = digest_algorithm['algorithm'].native
+        if name not in hashers:
+            hasher = hashlib.new(name)
+            # SHAKE hashes need an output length to finalize, which
+            # SignedData does not provide, and report a digest size of 0
+            if hasher.digest_size == 0:
+                raise ValueError('Digest algorithm %s is an extendable-output function, which is not supported' % name)
+            hashers[name] = hasher
+    hash_updates = [hasher.update for hasher in hashers.values()]
+
+    encap_info = reader.read_header()
+    _expect(encap_info, 0, 1, 16, 'EncapsulatedContentInfo')
+    encap_end = None
+    if encap_info[4] is not None:
+        encap_end = reader.offset + encap_info[4]
+    econtent_type = reader.read_value()
+
+    chunks = None
+    explicit_info = _end_of_container(reader, encap_info, encap_end)
+    if explicit_info is not None:
+        _expect(explicit_info, 2, 1, 0, 'explicit eContent tag')
+        explicit_end = None
+        if explicit_info[4] is not None:
+            explicit_end = reader.offset + explicit_info[4]
+        econtent_info = reader.read_header()
+        if econtent_info[0:3] == (0, 0, 4) or econtent_info[0:3] == (0, 1, 4):
+            chunks = reader.iter_octets(econtent_info, chunk_size)
+        else:
+            # PKCS#7 allows any type, in which case the value octets are hashed
+            chunks = [reader.read_contents(econtent_info)[0]]
+        for chunk in chunks:
+            for update in hash_updates:
+                update(chunk)
+        if explicit_end is None and _end_of_container(reader, explicit_info, None) is not None:
+            raise ValueError('Unexpected data after eContent in explicit tag')
+        if _end_of_container(reader, encap_info, encap_end) is not None:
+            raise ValueError('Unexpected data after eContent in EncapsulatedContentInfo')
+
+    elif content is not None:
+        while True:
+            chunk = content.read(chunk_size)
+            if not chunk:
+                break
+            for update in hash_updates:
+                update(chunk)
+
+    remaining = []
+    while True:
+        sub_info = _end_of_container(reader, signed_data_info, signed_data_end)
+        if sub_info is None:
+            break
+        remaining.append(sub_info[3])
+        remaining.extend(reader.read_contents(sub_info))
+
+    signed_data = SignedData.load(emit(
+        0,
+        1,
+        16,
+        version + digest_algorithms + emit(0, 1, 16, econtent_type) + b''.join(remaining)
+    ))
+    digests = dict((name, hasher.digest()) for name, hasher in hashers.items())
+    return (signed_data, digests)
+
+
+def iter_decompressed_data(source, chunk_size=65536):
+    """
+    Decompresses the content of a ContentInfo containing CompressedData in a
+    single pass, holding at most one compressed and one decompressed chunk in
+    memory at a time
+
+    :param source:
+        A byte string, mmap.mmap object or file-like object of the
+        BER/DER-encoded ContentInfo
+
+    :param chunk_size:
+        An integer of the maximum number of bytes to read or yield at once
+
+    :raises:
+        ValueError - when the source is not a ContentInfo containing zlib CompressedData
+        zlib.error - when the compressed data is invalid or truncated
+
+    :return:
+        A generator yielding byte strings of the decompressed content
+    """
+
+    reader = _StreamReader(source)
+
+    _expect(reader.read_header(), 0, 1, 16, 'ContentInfo', 'CompressedData')
+    content_type = ContentType.load(reader.read_value())
+    if content_type.native != 'compressed_data':
+        raise ValueError('ContentInfo contains %s, not compressed_data' % content_type.native)
+    _expect(reader.read_header(), 2, 1, 0, 'explicit content tag', 'CompressedData')
+    _expect(reader.read_header(), 0, 1, 16, 'CompressedData', 'CompressedData')
+
+    reader.read_value()
+    compression_algorithm = CompressionAlgorithm.load(reader.read_value())
+    if compression_algorithm['algorithm'].native != 'zlib':
+        raise ValueError('Unsupported compression algorithm %s' % compression_algorithm['algorithm'].native)
+
+    encap_info = reader.read_header()
+    _expect(encap_info, 0, 1, 16, 'EncapsulatedContentInfo', 'CompressedData')
+    reader.read_value()
+    _expect(reader.read_header(), 2, 1, 0, 'explicit eContent tag', 'CompressedData')
+    econtent_info = reader.read_header()
+    _expect(econtent_info, 0, econtent_info[1], 4, 'eContent', 'CompressedData')
+
+    return _inflate(reader.iter_octets(econtent_info, chunk_size), chunk_size)
+
+
+# CertificateList and OCSPResponse are referenced by spec so that .crl and
+# .ocsp are only imported once used, but remain reachable from this module
+# on Python 3.7+, which supports module-level __getattr__()
+def __getattr__(name):
+    if name == 'CertificateList':
+        from .crl import CertificateList
+
+        return CertificateList
+    if name == 'OCSPResponse':
+        from .ocsp import OCSPResponse
+
+        return OCSPResponse
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
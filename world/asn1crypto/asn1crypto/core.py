@@ -50,7 +50,9 @@ from __future__ import unicode_literals, division, absolute_import, print_functi
 
 from datetime import datetime, timedelta
 import binascii
+import codecs
 import copy
+import importlib
 import math
 import re
 import sys
@@ -62,6 +64,7 @@ from ._types import type_name, str_cls, byte_cls, int_types, chr_cls
 from .parser import _parse, _dump_header
 from .util import int_to_bytes, int_from_bytes, timezone, extended_datetime
 
+
 if sys.version_info <= (3,):
     from cStringIO import StringIO as BytesIO
 
@@ -102,6 +105,7 @@ METHOD_NUM_TO_NAME_MAP = {
 
 
 _OID_RE = re.compile('^\d+(\.\d+)*$')
+_DIGITS_RE = re.compile('^[0-9]+\\Z')
 
 
 # A global tracker to ensure that _setup() is called for every class, even
@@ -110,6 +114,12 @@ _OID_RE = re.compile('^\d+(\.\d+)*$')
 # would just see the parent class attributes and would use them.
 _SETUP_CLASSES = {}
 
+# A dict mapping unicode string spec references, as may be used in place of a
+# class in _fields, _alternatives, _child_spec and _oid_specs, to the class
+# they refer to. This allows rarely-used modules to be imported only when a
+# value that uses them is first constructed.
+_SPEC_REGISTRY = {}
+
 
 def load(encoded_data, strict=False):
     """
@@ -660,6 +670,33 @@ class Constructable(object):
 
         return output
 
+    def _iter_chunks(self):
+        """
+        Walks the contained chunks without combining them, so that large
+        constructed values can be processed piece by piece
+
+        :return:
+            A generator yielding the native value of each contained chunk
+        """
+
+        if not self._indefinite:
+            yield self._as_chunk()
+            return
+
+        pointer = self._chunks_offset
+        contents_len = len(self.contents)
+        found = False
+
+        while pointer < contents_len:
+            # We pass the current class as the spec so content semantics are preserved
+            sub_value, pointer = _parse_build(self.contents, pointer, spec=self.__class__)
+            for chunk in sub_value._iter_chunks():
+                yield chunk
+            found = True
+
+        if not found:
+            yield self._as_chunk()
+
     def _as_chunk(self):
         """
         A method to return a chunk of data that can be combined for
@@ -959,7 +996,11 @@ class Choice(Asn1Value):
         for index, info in enumerate(cls._alternatives):
             if len(info) < 3:
                 info = info + ({},)
-                cls._alternatives[index] = info
+            # A lazy spec reference is only resolved once the alternative is
+            # chosen, unless the class is needed to determine the tag
+            if isinstance(info[1], str_cls) and 'tag_type' not in info[2]:
+                info = (info[0], _resolve_spec(info[1])) + info[2:]
+            cls._alternatives[index] = info
             id_ = _build_id_tuple(info[2], info[1])
             cls._id_map[id_] = index
             cls._name_map[info[0]] = index
@@ -1038,6 +1079,7 @@ class Choice(Asn1Value):
 
                 self._choice = self._name_map[name]
                 _, spec, params = self._alternatives[self._choice]
+                spec = _resolve_spec(spec)
 
                 if not isinstance(value, spec):
                     value = spec(value, **params)
@@ -1073,7 +1115,7 @@ class Choice(Asn1Value):
 
         try:
             _, spec, params = self._alternatives[self._choice]
-            self._parsed, _ = _parse_build(self.contents, spec=spec, spec_params=params)
+            self._parsed, _ = _parse_build(self.contents, spec=_resolve_spec(spec), spec_params=params)
         except (ValueError, TypeError) as e:
             args = e.args[1:]
             e.args = (e.args[0] + '\n    while parsing %s' % type_name(self),) + args
@@ -1621,6 +1663,59 @@ class Primitive(Asn1Value):
         return self.dump() == other.dump()
 
 
+# Decoders for the encodings used by the string classes that call the codec
+# functions directly, instead of looking the codec up by name each time
+_STRING_DECODERS = {
+    'latin1': lambda data: codecs.latin_1_decode(data)[0],
+    'ascii': lambda data: codecs.ascii_decode(data)[0],
+    'utf-8': lambda data: codecs.utf_8_decode(data, 'strict', True)[0],
+    'utf-16-be': lambda data: codecs.utf_16_be_decode(data, 'strict', True)[0],
+    'utf-32-be': lambda data: codecs.utf_32_be_decode(data, 'strict', True)[0],
+    'teletex': _teletex_codec.decode,
+}
+
+# Decoded strings are cached by encoding and encoded contents, since the same
+# attribute values, e.g. organization and country names, are repeated across
+# many certificates. Long values are not cached.
+_STRING_CACHE_SIZE = 4096
+_STRING_CACHE_MAX_LENGTH = 256
+_STRING_CACHE = {}
+
+
+def _decode_string(encoding, data):
+    """
+    Decodes the contents of a string value
+
+    :param encoding:
+        A unicode string of the name of the encoding
+
+    :param data:
+        A byte string of the encoded contents
+
+    :return:
+        A unicode string
+    """
+
+    cache_key = None
+    if len(data) <= _STRING_CACHE_MAX_LENGTH:
+        cache_key = (encoding, data)
+        value = _STRING_CACHE.get(cache_key)
+        if value is not None:
+            return value
+
+    decoder = _STRING_DECODERS.get(encoding)
+    if decoder is None:
+        value = data.decode(encoding)
+    else:
+        value = decoder(data)
+
+    if cache_key is not None:
+        if len(_STRING_CACHE) >= _STRING_CACHE_SIZE:
+            _STRING_CACHE.clear()
+        _STRING_CACHE[cache_key] = value
+    return value
+
+
 class AbstractString(Constructable, Primitive):
     """
     A base class for all strings that have a known encoding. In general, we do
@@ -1669,7 +1764,7 @@ class AbstractString(Constructable, Primitive):
         if self.contents is None:
             return ''
         if self._unicode is None:
-            self._unicode = self._merge_chunks().decode(self._encoding)
+            self._unicode = _decode_string(self._encoding, self._merge_chunks())
         return self._unicode
 
     def _copy(self, other, copy_func):
@@ -2825,24 +2920,7 @@ class ObjectIdentifier(Primitive, ValueMap):
         """
 
         if self._dotted is None:
-            output = []
-
-            part = 0
-            for byte in self.contents:
-                if _PY2:
-                    byte = ord(byte)
-                part = part * 128
-                part += byte & 127
-                # Last byte in subidentifier has the eighth bit set to 0
-                if byte & 0x80 == 0:
-                    if len(output) == 0:
-                        output.append(str_cls(part // 40))
-                        output.append(str_cls(part % 40))
-                    else:
-                        output.append(str_cls(part))
-                    part = 0
-
-            self._dotted = '.'.join(output)
+            self._dotted = _oid_dotted(self.contents)
         return self._dotted
 
     @property
@@ -2997,6 +3075,15 @@ class Sequence(Asn1Value):
     # Variable to track if the object has been mutated
     _mutated = False
 
+    # A list, parallel to children, of the integer offset of the start of each
+    # child's encoding within _contents, or None for children that have been
+    # replaced since _contents was set - see _splice_children()
+    _child_origins = None
+
+    # If the contents have been re-encoded since the parent last encoded this
+    # value as one of its children
+    _reencoded = False
+
     # A list of tuples in one of the following forms.
     #
     # Option 1, a unicode string field name and a value class
@@ -3121,6 +3208,7 @@ class Sequence(Asn1Value):
         """
 
         self._contents = value
+        self._child_origins = None
 
     def _is_mutated(self):
         """
@@ -3132,8 +3220,12 @@ class Sequence(Asn1Value):
         mutated = self._mutated
         if self.children is not None:
             for child in self.children:
+                if mutated:
+                    break
+                if isinstance(child, (Choice, Any)):
+                    child = _wrapped_value(child)
                 if isinstance(child, Sequence) or isinstance(child, SequenceOf):
-                    mutated = mutated or child._is_mutated()
+                    mutated = child._reencoded or child._is_mutated()
 
         return mutated
 
@@ -3256,6 +3348,8 @@ class Sequence(Asn1Value):
             ))
 
         self.children[key] = new_value
+        if self._child_origins is not None:
+            self._child_origins[key] = None
 
         if self._native is not None:
             self._native[self._fields[key][0]] = self.children[key].native
@@ -3300,6 +3394,8 @@ class Sequence(Asn1Value):
 
         if 'optional' in params:
             self.children[key] = VOID
+            if self._child_origins is not None:
+                self._child_origins[key] = None
             if self._native is not None:
                 self._native[name] = None
         else:
@@ -3328,6 +3424,10 @@ class Sequence(Asn1Value):
         if self.children is None:
             self._parse_children()
 
+        if not force:
+            _splice_children(self, self._fields)
+            return
+
         contents = BytesIO()
         for index, info in enumerate(self._fields):
             child = self.children[index]
@@ -3340,6 +3440,7 @@ class Sequence(Asn1Value):
                     child_dump = child[3] + child[4] + child[5]
             else:
                 child_dump = child.dump(force=force)
+            _clear_reencoded(self.children[index])
             # Skip values that are the same as the default
             if info[2] and 'default' in info[2]:
                 default_value = info[1](**info[2])
@@ -3347,6 +3448,9 @@ class Sequence(Asn1Value):
                     continue
             contents.write(child_dump)
         self._contents = contents.getvalue()
+        self._child_origins = None
+        self._mutated = False
+        self._reencoded = True
 
         self._header = None
         if self._trailer != b'':
@@ -3364,7 +3468,9 @@ class Sequence(Asn1Value):
         for index, field in enumerate(cls._fields):
             if len(field) < 3:
                 field = field + ({},)
-                cls._fields[index] = field
+            if isinstance(field[1], str_cls):
+                field = (field[0], _resolve_spec(field[1])) + field[2:]
+            cls._fields[index] = field
             cls._field_map[field[0]] = index
             cls._field_ids.append(_build_id_tuple(field[2], field[1]))
 
@@ -3421,7 +3527,7 @@ class Sequence(Asn1Value):
         elif self._oid_nums is not None and self._oid_nums[1] == index:
             oid = self._lazy_child(self._oid_nums[0]).native
             if oid in self._oid_specs:
-                spec_override = self._oid_specs[oid]
+                spec_override = _resolve_spec(self._oid_specs[oid])
                 value_spec = spec_override
 
         return (name, field_spec, value_spec, field_params, spec_override)
@@ -3527,6 +3633,8 @@ class Sequence(Asn1Value):
 
         try:
             self.children = []
+            origins = []
+            self._child_origins = origins
             contents_length = len(self._contents)
             child_pointer = 0
             field = 0
@@ -3535,6 +3643,7 @@ class Sequence(Asn1Value):
             again = child_pointer < contents_length
             while again:
                 if parts is None:
+                    parts_start = child_pointer
                     parts, child_pointer = _parse(self._contents, contents_length, pointer=child_pointer)
                 again = child_pointer < contents_length
 
@@ -3562,6 +3671,7 @@ class Sequence(Asn1Value):
                                     self.children.append(VOID)
                                 else:
                                     self.children.append(field_spec(**field_params))
+                                origins.append(None)
                                 field += 1
                                 again = True
                                 continue
@@ -3610,12 +3720,14 @@ class Sequence(Asn1Value):
                         child._parse_children(recurse=True)
 
                 self.children.append(child)
+                origins.append(parts_start)
                 field += 1
                 parts = None
 
             index = len(self.children)
             while index < field_len:
                 name, field_spec, field_params = self._fields[index]
+                origins.append(None)
                 if 'default' in field_params:
                     self.children.append(field_spec(**field_params))
                 elif 'optional' in field_params:
@@ -3693,8 +3805,7 @@ class Sequence(Asn1Value):
                 self._native = OrderedDict()
                 for index, child in enumerate(self.children):
                     if child.__class__ == tuple:
-                        child = _build(*child)
-                        self.children[index] = child
+                        child = self._lazy_child(index)
                     try:
                         name = self._fields[index][0]
                     except (IndexError):
@@ -3726,6 +3837,7 @@ class Sequence(Asn1Value):
                     self.children.append(child)
                 else:
                     self.children.append(child.copy())
+        self._child_origins = None
 
     def debug(self, nest_level=1):
         """
@@ -3782,9 +3894,27 @@ class SequenceOf(Asn1Value):
     # Variable to track if the object has been mutated
     _mutated = False
 
+    # A list, parallel to children, of the integer offset of the start of each
+    # child's encoding within _contents, or None for children that have been
+    # replaced since _contents was set - see _splice_children()
+    _child_origins = None
+
+    # If the contents have been re-encoded since the parent last encoded this
+    # value as one of its children
+    _reencoded = False
+
     # An Asn1Value class to use when parsing children
     _child_spec = None
 
+    def _setup(self):
+        """
+        Resolves _child_spec if it is a lazy spec reference
+        """
+
+        cls = self.__class__
+        if isinstance(cls._child_spec, str_cls):
+            cls._child_spec = _resolve_spec(cls._child_spec)
+
     def __init__(self, value=None, default=None, contents=None, spec=None, **kwargs):
         """
         Allows setting child objects and the _child_spec via the spec parameter
@@ -3804,7 +3934,7 @@ class SequenceOf(Asn1Value):
         """
 
         if spec:
-            self._child_spec = spec
+            self._child_spec = _resolve_spec(spec)
 
         Asn1Value.__init__(self, **kwargs)
 
@@ -3851,6 +3981,7 @@ class SequenceOf(Asn1Value):
         """
 
         self._contents = value
+        self._child_origins = None
 
     def _is_mutated(self):
         """
@@ -3862,8 +3993,12 @@ class SequenceOf(Asn1Value):
         mutated = self._mutated
         if self.children is not None:
             for child in self.children:
+                if mutated:
+                    break
+                if isinstance(child, (Choice, Any)):
+                    child = _wrapped_value(child)
                 if isinstance(child, Sequence) or isinstance(child, SequenceOf):
-                    mutated = mutated or child._is_mutated()
+                    mutated = child._reencoded or child._is_mutated()
 
         return mutated
 
@@ -3982,10 +4117,14 @@ class SequenceOf(Asn1Value):
         # If adding at the end, create a space for the new value
         if key == len(self.children):
             self.children.append(None)
+            if self._child_origins is not None:
+                self._child_origins.append(None)
             if self._native is not None:
                 self._native.append(None)
 
         self.children[key] = new_value
+        if self._child_origins is not None:
+            self._child_origins[key] = None
 
         if self._native is not None:
             self._native[key] = self.children[key].native
@@ -4005,6 +4144,8 @@ class SequenceOf(Asn1Value):
             self._parse_children()
 
         self.children.pop(key)
+        if self._child_origins is not None:
+            self._child_origins.pop(key)
         if self._native is not None:
             self._native.pop(key)
 
@@ -4066,6 +4207,8 @@ class SequenceOf(Asn1Value):
             self._parse_children()
 
         self.children.append(self._make_value(value))
+        if self._child_origins is not None:
+            self._child_origins.append(None)
 
         if self._native is not None:
             self._native.append(self.children[-1].native)
@@ -4084,10 +4227,18 @@ class SequenceOf(Asn1Value):
         if self.children is None:
             self._parse_children()
 
+        if not force:
+            _splice_children(self, None)
+            return
+
         contents = BytesIO()
         for child in self:
             contents.write(child.dump(force=force))
+            _clear_reencoded(child)
         self._contents = contents.getvalue()
+        self._child_origins = None
+        self._mutated = False
+        self._reencoded = True
         self._header = None
         if self._trailer != b'':
             self._trailer = b''
@@ -4107,11 +4258,14 @@ class SequenceOf(Asn1Value):
 
         try:
             self.children = []
+            origins = []
+            self._child_origins = origins
             if self._contents is None:
                 return
             contents_length = len(self._contents)
             child_pointer = 0
             while child_pointer < contents_length:
+                child_start = child_pointer
                 parts, child_pointer = _parse(self._contents, contents_length, pointer=child_pointer)
                 if self._child_spec:
                     child = parts + (self._child_spec,)
@@ -4122,6 +4276,7 @@ class SequenceOf(Asn1Value):
                     if isinstance(child, (Sequence, SequenceOf)):
                         child._parse_children(recurse=True)
                 self.children.append(child)
+                origins.append(child_start)
         except (ValueError, TypeError) as e:
             args = e.args[1:]
             e.args = (e.args[0] + '\n    while parsing %s' % type_name(self),) + args
@@ -4182,6 +4337,7 @@ class SequenceOf(Asn1Value):
                     self.children.append(child)
                 else:
                     self.children.append(child.copy())
+        self._child_origins = None
 
     def debug(self, nest_level=1):
         """
@@ -4240,7 +4396,9 @@ class Set(Sequence):
         for index, field in enumerate(cls._fields):
             if len(field) < 3:
                 field = field + ({},)
-                cls._fields[index] = field
+            if isinstance(field[1], str_cls):
+                field = (field[0], _resolve_spec(field[1])) + field[2:]
+            cls._fields[index] = field
             cls._field_map[field[0]] = index
             cls._field_ids[_build_id_tuple(field[2], field[1])] = index
 
@@ -4384,6 +4542,7 @@ class Set(Sequence):
         child_tag_encodings = []
         for index, child in enumerate(self.children):
             child_encoding = child.dump(force=force)
+            _clear_reencoded(child)
 
             # Skip encoding defaulted children
             name, spec, field_params = self._fields[index]
@@ -4395,6 +4554,9 @@ class Set(Sequence):
         child_tag_encodings.sort(key=lambda ct: ct[0])
 
         self._contents = b''.join([ct[1] for ct in child_tag_encodings])
+        self._child_origins = None
+        self._mutated = False
+        self._reencoded = True
         self._header = None
         if self._trailer != b'':
             self._trailer = b''
@@ -4426,8 +4588,12 @@ class SetOf(SequenceOf):
         child_encodings = []
         for child in self:
             child_encodings.append(child.dump(force=force))
+            _clear_reencoded(child)
 
         self._contents = b''.join(sorted(child_encodings))
+        self._child_origins = None
+        self._mutated = False
+        self._reencoded = True
         self._header = None
         if self._trailer != b'':
             self._trailer = b''
@@ -4485,11 +4651,102 @@ class IA5String(AbstractString):
     _encoding = 'ascii'
 
 
+# Decoded time values are cached by class and encoded contents, since the same
+# instant is frequently repeated, e.g. identical this_update and next_update
+# values across a batch of CRLs and OCSP responses
+_TIME_CACHE_SIZE = 1024
+_TIME_CACHE = {}
+_TIMESTAMP_CACHE = {}
+
+_DAYS_PER_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _is_leap_year(year):
+    """
+    :param year:
+        An integer of the (proleptic Gregorian) year
+
+    :return:
+        A boolean - if the year is a leap year
+    """
+
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def _epoch_seconds(year, month, day, hour, minute, second):
+    """
+    Converts date and time fields into the number of seconds since the UNIX
+    epoch without constructing a datetime object
+
+    :raises:
+        ValueError - when one of the fields is out of range
+
+    :return:
+        An integer
+    """
+
+    if month < 1 or month > 12:
+        raise ValueError('month is out of range')
+    days_in_month = _DAYS_PER_MONTH[month - 1]
+    if month == 2 and _is_leap_year(year):
+        days_in_month = 29
+    if day < 1 or day > days_in_month:
+        raise ValueError('day is out of range')
+    if hour > 23:
+        raise ValueError('hour is out of range')
+    if minute > 59:
+        raise ValueError('minute is out of range')
+    if second > 59:
+        raise ValueError('second is out of range')
+
+    # Days from civil algorithm, using eras of 400 years starting on March 1st
+    if month <= 2:
+        year -= 1
+        month += 9
+    else:
+        month -= 3
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * month + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    days = era * 146097 + day_of_era - 719468
+
+    return days * 86400 + hour * 3600 + minute * 60 + second
+
+
+def _cache_time_value(cache, key, value):
+    """
+    Stores a decoded time value, flushing the cache once it reaches its size
+    limit
+
+    :param cache:
+        The dict to store the value in
+
+    :param key:
+        A 2-element tuple of the class and encoded contents
+
+    :param value:
+        The decoded value
+    """
+
+    if len(cache) >= _TIME_CACHE_SIZE:
+        cache.clear()
+    cache[key] = value
+
+
 class AbstractTime(AbstractString):
     """
     Represents a time from ASN.1 as a Python datetime.datetime object
     """
 
+    # A dict mapping the length of a time string, without timezone, to the
+    # (start, end) offsets of its year, month, day, hour, minute, second and
+    # fractional second digits. Fields past the end of the tuple are 0.
+    _field_offsets = {}
+
+    # If the year is encoded with two digits, 1950 through 2049
+    _two_digit_year = False
+
     @property
     def native(self):
         """
@@ -4503,32 +4760,134 @@ class AbstractTime(AbstractString):
             return None
 
         if self._native is None:
-            string = str_cls(self)
-            has_timezone = re.search('[-\\+]', string)
+            cache_key = (self.__class__, self.contents)
+            native = _TIME_CACHE.get(cache_key)
+            if native is None:
+                native = self._parse_native()
+                _cache_time_value(_TIME_CACHE, cache_key, native)
+            self._native = native
 
-            # We don't know what timezone it is in, or it is UTC because of a Z
-            # suffix, so we just assume UTC
-            if not has_timezone:
-                string = string.rstrip('Z')
-                date = self._date_by_len(string)
-                self._native = date.replace(tzinfo=timezone.utc)
+        return self._native
 
-            else:
-                # Python 2 doesn't support the %z format code, so we have to manually
-                # process the timezone offset.
-                date = self._date_by_len(string[0:-5])
-
-                hours = int(string[-4:-2])
-                minutes = int(string[-2:])
-                delta = timedelta(hours=abs(hours), minutes=minutes)
-                if hours < 0:
-                    date -= delta
-                else:
-                    date += delta
+    @property
+    def timestamp(self):
+        """
+        The value as the number of seconds since the UNIX epoch. When possible
+        this is computed directly from the encoded digits, without building
+        a datetime object. Fractional seconds are truncated.
 
-                self._native = date.replace(tzinfo=timezone.utc)
+        :raises:
+            ValueError - when the value is not in a supported format
 
-        return self._native
+        :return:
+            An integer or None
+        """
+
+        if self.contents is None:
+            return None
+
+        cache_key = (self.__class__, self.contents)
+        timestamp = _TIMESTAMP_CACHE.get(cache_key)
+        if timestamp is None:
+            string, offset = self._split_offset(str_cls(self))
+            fields = self._fields_by_len(string)
+            if fields is None:
+                native = self.native
+                fields = (native.year, native.month, native.day, native.hour, native.minute, native.second)
+                offset = 0
+            timestamp = _epoch_seconds(*fields[0:6]) + offset
+            _cache_time_value(_TIMESTAMP_CACHE, cache_key, timestamp)
+
+        return timestamp
+
+    def _split_offset(self, string):
+        """
+        Separates the timezone offset from a time string
+
+        :param string:
+            A unicode string of the time
+
+        :return:
+            A 2-element tuple of (unicode string without the offset, integer
+            number of seconds the offset adds to the time)
+        """
+
+        # We don't know what timezone it is in, or it is UTC because of a Z
+        # suffix, so we just assume UTC
+        if '-' not in string and '+' not in string:
+            return (string.rstrip('Z'), 0)
+
+        # Python 2 doesn't support the %z format code, so we have to manually
+        # process the timezone offset.
+        hours = int(string[-4:-2])
+        minutes = int(string[-2:])
+        offset = abs(hours) * 3600 + minutes * 60
+        if hours < 0:
+            offset = -offset
+        return (string[0:-5], offset)
+
+    def _parse_native(self):
+        """
+        Converts the encoded contents into a datetime object
+
+        :raises:
+            ValueError - when the value is not in a supported format
+
+        :return:
+            A datetime.datetime object in the UTC timezone
+        """
+
+        string, offset = self._split_offset(str_cls(self))
+        date = self._date_by_len(string)
+        if isinstance(date, str_cls):
+            raise ValueError(unwrap(
+                '''
+                %s value %s is not in a supported format
+                ''',
+                type_name(self),
+                repr(str_cls(self))
+            ))
+        if offset:
+            date += timedelta(seconds=offset)
+        return date.replace(tzinfo=timezone.utc)
+
+    def _fields_by_len(self, string):
+        """
+        Parses the fixed-width digits of a time string
+
+        :param string:
+            A unicode string to parse, without timezone information
+
+        :return:
+            None if the string is not in a recognized format, otherwise a
+            7-element tuple of integers (year, month, day, hour, minute,
+            second, microsecond)
+        """
+
+        offsets = self._field_offsets.get(len(string))
+        if offsets is None:
+            return None
+
+        fields = [0, 0, 0, 0, 0, 0, 0]
+        for index, (start, end) in enumerate(offsets):
+            digits = string[start:end]
+            if not _DIGITS_RE.match(digits):
+                return None
+            fields[index] = int(digits)
+
+        if len(offsets) == 7:
+            # Fractional seconds follow the seconds after a period
+            if string[offsets[5][1]] != '.':
+                return None
+            fields[6] *= 10 ** (6 - (offsets[6][1] - offsets[6][0]))
+
+        if self._two_digit_year:
+            if fields[0] < 50:
+                fields[0] += 2000
+            else:
+                fields[0] += 1900
+
+        return tuple(fields)
 
 
 class UTCTime(AbstractTime):
@@ -4538,6 +4897,12 @@ class UTCTime(AbstractTime):
 
     tag = 23
 
+    _field_offsets = {
+        10: ((0, 2), (2, 4), (4, 6), (6, 8), (8, 10)),
+        12: ((0, 2), (2, 4), (4, 6), (6, 8), (8, 10), (10, 12)),
+    }
+    _two_digit_year = True
+
     def set(self, value):
         """
         Sets the value of the object
@@ -4570,6 +4935,10 @@ class UTCTime(AbstractTime):
             A datetime.datetime object or a unicode string
         """
 
+        fields = self._fields_by_len(string)
+        if fields is not None:
+            return datetime(*fields)
+
         strlen = len(string)
 
         year_num = int(string[0:2])
@@ -4595,6 +4964,18 @@ class GeneralizedTime(AbstractTime):
 
     tag = 24
 
+    _field_offsets = {
+        10: ((0, 4), (4, 6), (6, 8), (8, 10)),
+        12: ((0, 4), (4, 6), (6, 8), (8, 10), (10, 12)),
+        14: ((0, 4), (4, 6), (6, 8), (8, 10), (10, 12), (12, 14)),
+        16: ((0, 4), (4, 6), (6, 8), (8, 10), (10, 12), (12, 14), (15, 16)),
+        17: ((0, 4), (4, 6), (6, 8), (8, 10), (10, 12), (12, 14), (15, 17)),
+        18: ((0, 4), (4, 6), (6, 8), (8, 10), (10, 12), (12, 14), (15, 18)),
+        19: ((0, 4), (4, 6), (6, 8), (8, 10), (10, 12), (12, 14), (15, 19)),
+        20: ((0, 4), (4, 6), (6, 8), (8, 10), (10, 12), (12, 14), (15, 20)),
+        21: ((0, 4), (4, 6), (6, 8), (8, 10), (10, 12), (12, 14), (15, 21)),
+    }
+
     def set(self, value):
         """
         Sets the value of the object
@@ -4629,6 +5010,13 @@ class GeneralizedTime(AbstractTime):
             a unicode string
         """
 
+        fields = self._fields_by_len(string)
+        if fields is not None:
+            if fields[0] == 0:
+                # Year 0 is not supported by datetime.datetime
+                return extended_datetime(*fields)
+            return datetime(*fields)
+
         strlen = len(string)
 
         date_format = None
@@ -4638,7 +5026,7 @@ class GeneralizedTime(AbstractTime):
             date_format = '%Y%m%d%H%M'
         elif strlen == 14:
             date_format = '%Y%m%d%H%M%S'
-        elif strlen == 18:
+        elif 16 <= strlen <= 21:
             date_format = '%Y%m%d%H%M%S.%f'
 
         if date_format:
@@ -4798,6 +5186,165 @@ def _fix_tagging(value, params):
     return value
 
 
+def _splice_children(value, fields):
+    """
+    Re-encodes the contents of a Sequence or SequenceOf after a mutation. The
+    encoding of every child that is unchanged since _contents was set is
+    copied from the previous contents, with runs of adjacent unchanged
+    children copied as a single slice, so only the modified children are
+    re-encoded.
+
+    :param value:
+        A Sequence or SequenceOf object
+
+    :param fields:
+        None, or the _fields of a Sequence, used to omit children that are
+        equal to their default value
+    """
+
+    original = value._contents
+    origins = value._child_origins
+    if origins is None:
+        origins = [None] * len(value.children)
+    new_origins = []
+    parts = []
+    run_start = None
+    run_end = None
+    pointer = 0
+
+    for index, child in enumerate(value.children):
+        start = origins[index]
+        params = None
+        if fields is not None and index < len(fields):
+            params = fields[index][2]
+        has_default = params is not None and 'default' in params
+
+        if child is None:
+            child_dump = b''
+        elif child.__class__ == tuple:
+            if start is not None and not has_default:
+                child_dump = None
+                end = start + len(child[3]) + len(child[4]) + len(child[5])
+            else:
+                child_dump = child[3] + child[4] + child[5]
+        elif isinstance(child, (Sequence, SequenceOf)):
+            if start is not None and not has_default and child._header is not None \
+                    and not child._reencoded and not child._is_mutated():
+                child_dump = None
+                end = start + len(child._header) + len(child._contents) + len(child._trailer)
+            else:
+                child_dump = child.dump()
+                # The new encoding of the child is now part of this value
+                child._reencoded = False
+        else:
+            child_dump = child.dump()
+            _clear_reencoded(child)
+            if start is not None and not has_default and original.startswith(child_dump, start):
+                end = start + len(child_dump)
+                child_dump = None
+
+        if child_dump is None:
+            if run_end != start:
+                if run_start is not None:
+                    parts.append(original[run_start:run_end])
+                run_start = start
+            run_end = end
+            new_origins.append(pointer)
+            pointer += end - start
+            continue
+
+        if run_start is not None:
+            parts.append(original[run_start:run_end])
+            run_start = None
+            run_end = None
+
+        # Skip values that are the same as the default
+        if has_default:
+            default_value = fields[index][1](**params)
+            if default_value.dump() == child_dump:
+                new_origins.append(None)
+                continue
+
+        parts.append(child_dump)
+        new_origins.append(pointer)
+        pointer += len(child_dump)
+
+    if run_start is not None:
+        parts.append(original[run_start:run_end])
+
+    value._contents = b''.join(parts)
+    value._child_origins = new_origins
+    value._header = None
+    if value._trailer != b'':
+        value._trailer = b''
+    value._mutated = False
+    value._reencoded = True
+
+
+def _wrapped_value(value):
+    """
+    Looks through Choice and Any objects for the value they contain, so that
+    changes made inside of it can be tracked by the parent
+
+    :param value:
+        A Choice or Any object
+
+    :return:
+        None if the value has not been parsed, otherwise the innermost
+        Asn1Value object that is not a Choice or Any
+    """
+
+    while True:
+        parsed = value._parsed
+        if parsed is None:
+            return None
+        if parsed.__class__ is tuple:
+            # Any stores a tuple of the parsed value, spec and spec params
+            parsed = parsed[0]
+        if not isinstance(parsed, (Choice, Any)):
+            return parsed
+        value = parsed
+
+
+def _clear_reencoded(child):
+    """
+    Records that the current encoding of a child has been taken by its parent,
+    so the parent does not consider itself mutated by it again
+
+    :param child:
+        A child value of a Sequence or SequenceOf
+    """
+
+    if isinstance(child, (Choice, Any)):
+        child = _wrapped_value(child)
+    if isinstance(child, Sequence) or isinstance(child, SequenceOf):
+        child._reencoded = False
+
+
+def _resolve_spec(spec):
+    """
+    Resolves a lazy spec reference into the class it names
+
+    :param spec:
+        An Asn1Value class, or a unicode string in the form "module.Class". A
+        module name starting with "." is relative to the asn1crypto package.
+
+    :return:
+        An Asn1Value class
+    """
+
+    if not isinstance(spec, str_cls):
+        return spec
+
+    cls = _SPEC_REGISTRY.get(spec)
+    if cls is None:
+        module_name, _, class_name = spec.rpartition('.')
+        module = importlib.import_module(module_name, __package__)
+        cls = getattr(module, class_name)
+        _SPEC_REGISTRY[spec] = cls
+    return cls
+
+
 def _build_id_tuple(params, spec):
     """
     Builds a 2-element tuple used to identify fields by grabbing the class_
@@ -4817,6 +5364,11 @@ def _build_id_tuple(params, spec):
     if spec is None:
         return (None, None)
 
+    # A lazy spec reference is only left unresolved when the params contain
+    # the tagging, so the class does not need to be imported
+    if isinstance(spec, str_cls):
+        return (params.get('class_', 2), params['tag'])
+
     required_class = spec.class_
     required_tag = spec.tag
 
@@ -5061,6 +5613,47 @@ def _build(class_, method, tag, header, contents, trailer, spec=None, spec_param
     return value
 
 
+def _py_oid_dotted(contents):
+    """
+    Converts the encoded contents of an object identifier to dotted notation
+
+    :param contents:
+        A byte string of the encoded subidentifiers
+
+    :return:
+        A unicode string of dotted integers
+    """
+
+    output = []
+
+    part = 0
+    for byte in contents:
+        if _PY2:
+            byte = ord(byte)
+        part = part * 128
+        part += byte & 127
+        # Last byte in subidentifier has the eighth bit set to 0
+        if byte & 0x80 == 0:
+            if len(output) == 0:
+                output.append(str_cls(part // 40))
+                output.append(str_cls(part % 40))
+            else:
+                output.append(str_cls(part))
+            part = 0
+
+    return '.'.join(output)
+
+
+# The pure-Python implementation is kept available so results can be compared
+# against the optional compiled version, which replaces it when installed
+_oid_dotted = _py_oid_dotted
+
+try:
+    from _asn1crypto_speedups import oid_dotted as _oid_dotted  # noqa
+except (ImportError):
+    pass
+
+
 def _parse_build(encoded_data, pointer=0, spec=None, spec_params=None, strict=False):
     """
     Parses a byte string generically, or using a spec with optional params
@@ -25,6 +25,7 @@ from ._elliptic_curve import (
     SECP256R1_BASE_POINT,
     SECP384R1_BASE_POINT,
     SECP521R1_BASE_POINT,
+    NAMED_CURVES,
     PrimeCurve,
     PrimePoint,
 )
@@ -48,7 +49,7 @@ from .core import (
     SequenceOf,
     SetOf,
 )
-from .util import int_from_bytes, int_to_bytes
+from .util import int_from_bytes, ints_from_bytes, ints_to_bytes
 
 
 class OtherPrimeInfo(Sequence):
@@ -141,8 +142,12 @@ class _ECPoint():
     that are the X and Y coordinates.
     """
 
+    # A 2-element tuple of the contents the coordinates were decoded from and
+    # a 2-element tuple of the integer coordinates
+    _coords = None
+
     @classmethod
-    def from_coords(cls, x, y):
+    def from_coords(cls, x, y, curve=None):
         """
         Creates an ECPoint object from the X and Y integer coordinates of the
         point
@@ -153,30 +158,45 @@ class _ECPoint():
         :param y:
             The Y coordinate, as an integer
 
+        :param curve:
+            None, a unicode string of a named curve, e.g. "secp256r1", or a
+            PrimeCurve object. When specified, the coordinates are encoded
+            using the byte size of the field, as required by SEC 1, instead
+            of the minimum width that fits both coordinates.
+
         :return:
             An ECPoint object
         """
 
-        x_bytes = int(math.ceil(math.log(x, 2) / 8.0))
-        y_bytes = int(math.ceil(math.log(y, 2) / 8.0))
-
-        num_bytes = max(x_bytes, y_bytes)
-
-        byte_string = b'\x04'
-        byte_string += int_to_bytes(x, width=num_bytes)
-        byte_string += int_to_bytes(y, width=num_bytes)
+        if curve is None:
+            num_bytes = ((max(x.bit_length(), y.bit_length()) + 7) // 8) or 1
+        else:
+            num_bytes = _prime_curve(curve).byte_size
 
-        return cls(byte_string)
+        point = cls(b'\x04' + ints_to_bytes([x, y], num_bytes))
+        point._coords = (point.contents, (x, y))
+        return point
 
-    def to_coords(self):
+    def to_coords(self, curve=None):
         """
         Returns the X and Y coordinates for this EC point, as native Python
-        integers
+        integers. The result is cached until the value of the point changes.
+
+        :param curve:
+            None, a unicode string of a named curve, e.g. "secp256r1", or a
+            PrimeCurve object - required to decompress a compressed point
+
+        :raises:
+            ValueError - when the point is compressed and no curve was
+            specified, or the encoding is invalid
 
         :return:
             A 2-element tuple containing integers (X, Y)
         """
 
+        if self._coords is not None and self._coords[0] is self.contents:
+            return self._coords[1]
+
         data = self.native
         first_byte = data[0:1]
 
@@ -184,23 +204,103 @@ class _ECPoint():
         if first_byte == b'\x04':
             remaining = data[1:]
             field_len = len(remaining) // 2
-            x = int_from_bytes(remaining[0:field_len])
-            y = int_from_bytes(remaining[field_len:])
-            return (x, y)
+            if field_len and len(remaining) % 2 == 0:
+                x, y = ints_from_bytes(remaining, field_len)
+            else:
+                # Malformed lengths split unevenly, as the halves are read apart
+                x = int_from_bytes(remaining[0:field_len])
+                y = int_from_bytes(remaining[field_len:])
 
-        if first_byte not in set([b'\x02', b'\x03']):
+        elif first_byte in set([b'\x02', b'\x03']):
+            if curve is None:
+                raise ValueError(unwrap(
+                    '''
+                    The curve must be specified to decompress an EC point
+                    '''
+                ))
+            x = int_from_bytes(data[1:])
+            y = _prime_curve(curve).decompress(x, first_byte == b'\x03')
+
+        else:
             raise ValueError(unwrap(
                 '''
                 Invalid EC public key - first byte is incorrect
                 '''
             ))
 
+        self._coords = (self.contents, (x, y))
+        return (x, y)
+
+    @property
+    def compressed(self):
+        """
+        :return:
+            A boolean - if the point is encoded in compressed form
+        """
+
+        return self.native[0:1] in set([b'\x02', b'\x03'])
+
+
+def _prime_curve(curve):
+    """
+    :param curve:
+        A unicode string of a named curve, e.g. "secp256r1", or a PrimeCurve
+        object
+
+    :raises:
+        ValueError - when the named curve is not supported
+
+    :return:
+        A PrimeCurve object
+    """
+
+    if isinstance(curve, PrimeCurve):
+        return curve
+    if curve not in NAMED_CURVES:
         raise ValueError(unwrap(
             '''
-            Compressed representations of EC public keys are not supported due
-            to patent US6252960
-            '''
+            Unable to decode EC point for named curve %s, parameters not
+            currently included
+            ''',
+            curve
         ))
+    return NAMED_CURVES[curve]
+
+
+def _uncompressed_ec_point(point, params):
+    """
+    Returns the uncompressed encoding of an EC point so that compressed and
+    uncompressed forms of the same public key produce the same fingerprint
+
+    :param point:
+        An ECPoint or ECPointBitString object
+
+    :param params:
+        An ECDomainParameters object
+
+    :return:
+        A byte string of the point
+    """
+
+    if not point.compressed or params.name == 'implicit_ca':
+        return point.native
+
+    if params.name == 'named':
+        curve = params.chosen.native
+        if curve not in NAMED_CURVES:
+            return point.native
+    else:
+        details = params.chosen
+        if details['field_id']['field_type'].native != 'prime_field':
+            return point.native
+        curve = PrimeCurve(
+            details['field_id']['parameters'].native,
+            int_from_bytes(details['curve']['a'].native),
+            int_from_bytes(details['curve']['b'].native)
+        )
+
+    x, y = point.to_coords(curve)
+    return b'\x04' + ints_to_bytes([x, y], _prime_curve(curve).byte_size)
 
 
 class ECPoint(OctetString, _ECPoint):
@@ -634,7 +734,7 @@ class PrivateKeyInfo(Sequence):
                     int_from_bytes(details['curve']['a']),
                     int_from_bytes(details['curve']['b'])
                 )
-                base_x, base_y = self['private_key_algorithm']['parameters'].chosen['base'].to_coords()
+                base_x, base_y = self['private_key_algorithm']['parameters'].chosen['base'].to_coords(curve)
                 base_point = PrimePoint(curve, base_x, base_y)
 
             elif curve_type == 'named':
@@ -654,9 +754,10 @@ class PrivateKeyInfo(Sequence):
                     'secp384r1': SECP384R1_BASE_POINT,
                     'secp521r1': SECP521R1_BASE_POINT,
                 }[details]
+                curve = details
 
             public_point = base_point * self['private_key'].parsed['private_key'].native
-            return ECPointBitString.from_coords(public_point.x, public_point.y)
+            return ECPointBitString.from_coords(public_point.x, public_point.y, curve)
 
     def unwrap(self):
         """
@@ -856,9 +957,10 @@ class PrivateKeyInfo(Sequence):
                 )
 
             elif self.algorithm == 'ec':
-                public_key = key['public_key'].native
-                if public_key is None:
-                    public_key = self.public_key.native
+                public_key = key['public_key']
+                if public_key.native is None:
+                    public_key = self.public_key
+                public_key = _uncompressed_ec_point(public_key, params)
 
                 if params.name == 'named':
                     to_hash = '%s:' % params.chosen.native
@@ -1141,7 +1243,11 @@ class PublicKeyInfo(Sequence):
 
         if self._bit_size is None:
             if self.algorithm == 'ec':
-                self._bit_size = ((len(self['public_key'].native) - 1) / 2) * 8
+                public_key = self['public_key']
+                if public_key.compressed:
+                    self._bit_size = (len(public_key.native) - 1) * 8
+                else:
+                    self._bit_size = ((len(public_key.native) - 1) // 2) * 8
             else:
                 if self.algorithm == 'rsa':
                     prime = self['public_key'].parsed['modulus'].native
@@ -1220,22 +1326,22 @@ class PublicKeyInfo(Sequence):
                 )
 
             elif key_type == 'ec':
-                key = self['public_key']
+                key = _uncompressed_ec_point(self['public_key'], params)
 
                 if params.name == 'named':
                     to_hash = '%s:' % params.chosen.native
                     to_hash = to_hash.encode('utf-8')
-                    to_hash += key.native
+                    to_hash += key
 
                 elif params.name == 'implicit_ca':
-                    to_hash = key.native
+                    to_hash = key
 
                 elif params.name == 'specified':
                     to_hash = '%s:' % params.chosen['field_id']['parameters'].native
                     to_hash = to_hash.encode('utf-8')
                     to_hash += b':' + params.chosen['curve']['a'].native
                     to_hash += b':' + params.chosen['curve']['b'].native
-                    to_hash += key.native
+                    to_hash += key
 
             if isinstance(to_hash, str_cls):
                 to_hash = to_hash.encode('utf-8')
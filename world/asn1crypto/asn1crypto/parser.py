@@ -287,3 +287,206 @@ def _dump_header(class_, method, tag, contents):
         header += length_bytes
 
     return header
+
+
+class _StreamReader(object):
+    """
+    Reads BER/DER-encoded data sequentially from a byte string, mmap or
+    file-like object without loading it all into memory. Objects supporting
+    the buffer protocol are sliced through a memoryview, so reading large
+    values from an mmap does not copy them.
+    """
+
+    # An integer of the number of bytes consumed from the source
+    offset = 0
+
+    def __init__(self, source):
+        """
+        :param source:
+            A byte string, mmap.mmap object or file-like object with a read()
+            method
+        """
+
+        try:
+            self._view = memoryview(source)
+            self._stream = None
+        except (TypeError):
+            self._view = None
+            self._stream = source
+        self.offset = 0
+
+    def read(self, num):
+        """
+        Reads an exact number of bytes
+
+        :param num:
+            An integer number of bytes to read
+
+        :raises:
+            ValueError - when the source does not contain enough data
+
+        :return:
+            A byte string, or a memoryview when reading from a buffer
+        """
+
+        if self._view is not None:
+            available = len(self._view) - self.offset
+            if available < num:
+                raise ValueError(_INSUFFICIENT_DATA_MESSAGE % (num, available))
+            data = self._view[self.offset:self.offset + num]
+        else:
+            data = self._stream.read(num)
+            while len(data) < num:
+                more = self._stream.read(num - len(data))
+                if not more:
+                    raise ValueError(_INSUFFICIENT_DATA_MESSAGE % (num, len(data)))
+                data += more
+        self.offset += num
+        return data
+
+    def read_bytes(self, num):
+        """
+        Reads an exact number of bytes into a byte string
+
+        :param num:
+            An integer number of bytes to read
+
+        :raises:
+            ValueError - when the source does not contain enough data
+
+        :return:
+            A byte string
+        """
+
+        data = self.read(num)
+        if isinstance(data, memoryview):
+            return data.tobytes()
+        return data
+
+    def read_header(self):
+        """
+        Reads the identifier and length octets of the next value
+
+        :raises:
+            ValueError - when the source does not contain enough data
+
+        :return:
+            A 5-element tuple:
+             - 0: integer class (0 to 3)
+             - 1: integer method
+             - 2: integer tag
+             - 3: byte string header
+             - 4: integer length of the contents, or None for indefinite length
+        """
+
+        header = self.read_bytes(1)
+        first_octet = ord(header[0]) if _PY2 else header[0]
+
+        tag = first_octet & 31
+        # Base 128 length using 8th bit as continuation indicator
+        if tag == 31:
+            tag = 0
+            while True:
+                octet = self.read_bytes(1)
+                header += octet
+                num = ord(octet[0]) if _PY2 else octet[0]
+                tag *= 128
+                tag += num & 127
+                if num >> 7 == 0:
+                    break
+
+        octet = self.read_bytes(1)
+        header += octet
+        length_octet = ord(octet[0]) if _PY2 else octet[0]
+        if length_octet >> 7 == 0:
+            length = length_octet & 127
+        elif length_octet & 127:
+            length_bytes = self.read_bytes(length_octet & 127)
+            header += length_bytes
+            length = int_from_bytes(length_bytes, signed=False)
+        else:
+            length = None
+
+        return (first_octet >> 6, (first_octet >> 5) & 1, tag, header, length)
+
+    def read_contents(self, info):
+        """
+        Reads the contents of a value whose header has already been read
+
+        :param info:
+            A 5-element tuple from read_header()
+
+        :return:
+            A 2-element tuple of (byte string contents, byte string trailer)
+        """
+
+        length = info[4]
+        if length is not None:
+            return (self.read_bytes(length), b'')
+
+        pieces = []
+        while True:
+            sub_info = self.read_header()
+            if sub_info[3] == b'\x00\x00':
+                break
+            pieces.append(sub_info[3])
+            pieces.extend(self.read_contents(sub_info))
+        return (b''.join(pieces), b'\x00\x00')
+
+    def read_value(self):
+        """
+        Reads the next value in full
+
+        :return:
+            A byte string of the encoded value, including the header and
+            trailer
+        """
+
+        info = self.read_header()
+        contents, trailer = self.read_contents(info)
+        return info[3] + contents + trailer
+
+    def iter_octets(self, info, chunk_size=65536):
+        """
+        Reads the value octets of a possibly-constructed string type whose
+        header has already been read, without merging them into a single
+        byte string
+
+        :param info:
+            A 5-element tuple from read_header()
+
+        :param chunk_size:
+            An integer of the maximum number of bytes to read at once
+
+        :return:
+            A generator yielding byte strings, or memoryviews when reading
+            from a buffer
+        """
+
+        if info[1] == 0:
+            remaining = info[4]
+            if remaining is None:
+                raise ValueError('Primitive values may not use indefinite length encoding')
+            while remaining > 0:
+                num = min(remaining, chunk_size)
+                yield self.read(num)
+                remaining -= num
+            return
+
+        end = None if info[4] is None else self.offset + info[4]
+        while end is None or self.offset < end:
+            sub_info = self.read_header()
+            if end is None and sub_info[3] == b'\x00\x00':
+                break
+            for chunk in self.iter_octets(sub_info, chunk_size):
+                yield chunk
+
+
+# The pure-Python implementation is kept available so results can be compared
+# against the optional compiled parser, which replaces it when installed
+_py_parse = _parse
+
+try:
+    from _asn1crypto_speedups import parse as _parse  # noqa
+except (ImportError):
+    pass
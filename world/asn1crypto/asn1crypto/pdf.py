@@ -3,10 +3,17 @@
 """
 ASN.1 type classes for PDF signature structures. Adds extra oid mapping and
 value parsing to asn1crypto.x509.Extension() and asn1crypto.xms.CMSAttribute().
+Also exports the following items:
+
+ - index_revocation_info()
 """
 
 from __future__ import unicode_literals, division, absolute_import, print_function
 
+import sys
+
+from ._errors import unwrap
+from .algos import DigestAlgorithmId
 from .cms import CMSAttributeType, CMSAttribute
 from .core import (
     Boolean,
@@ -18,14 +25,17 @@ from .core import (
     SequenceOf,
     SetOf,
 )
-from .crl import CertificateList
-from .ocsp import OCSPResponse
 from .x509 import (
     Extension,
     ExtensionId,
     GeneralName,
     KeyPurposeId,
+    Name,
 )
+from .parser import _parse
+from .util import int_from_bytes
+
+_PY2 = sys.version_info <= (3,)
 
 
 class AdobeArchiveRevInfo(Sequence):
@@ -50,11 +60,11 @@ class OtherRevInfo(Sequence):
 
 
 class SequenceOfCertificateList(SequenceOf):
-    _child_spec = CertificateList
+    _child_spec = '.crl.CertificateList'
 
 
 class SequenceOfOCSPResponse(SequenceOf):
-    _child_spec = OCSPResponse
+    _child_spec = '.ocsp.OCSPResponse'
 
 
 class SequenceOfOtherRevInfo(SequenceOf):
@@ -82,3 +92,243 @@ Extension._oid_specs['adobe_ppklite_credential'] = Null
 KeyPurposeId._map['1.2.840.113583.1.1.5'] = 'pdf_signing'
 CMSAttributeType._map['1.2.840.113583.1.1.8'] = 'adobe_revocation_info_archival'
 CMSAttribute._oid_specs['adobe_revocation_info_archival'] = SetOfRevocationInfoArchival
+
+
+def _walk(encoded, start, end):
+    """
+    Iterates over the values encoded between two offsets without building
+    objects or copying the data
+
+    :param encoded:
+        A byte string of BER/DER-encoded data
+
+    :param start:
+        The integer offset of the first value
+
+    :param end:
+        The integer offset where the values end
+
+    :return:
+        A generator yielding 5-element tuples of (integer identifier octet,
+        integer offset of the header, integer offset of the contents, integer
+        offset of the end of the contents, integer offset of the end of the
+        value)
+    """
+
+    pointer = start
+    while pointer < end:
+        header_end, value_end = _parse(encoded, end, pointer, lengths_only=True)
+        if value_end > end:
+            raise ValueError(unwrap(
+                '''
+                Insufficient data - %s bytes requested but only %s available
+                ''',
+                value_end,
+                end
+            ))
+        first_octet = ord(encoded[pointer]) if _PY2 else encoded[pointer]
+        length_octet = ord(encoded[header_end - 1]) if _PY2 else encoded[header_end - 1]
+        contents_end = value_end
+        if length_octet == 0x80:
+            contents_end -= 2
+        # End-of-contents marker of an indefinite-length container
+        if first_octet == 0 and header_end == value_end:
+            break
+        yield (first_octet, pointer, header_end, contents_end, value_end)
+        pointer = value_end
+
+
+def _children(encoded, parent):
+    """
+    :param encoded:
+        A byte string of BER/DER-encoded data
+
+    :param parent:
+        A 5-element tuple from _walk() of a constructed value
+
+    :return:
+        A list of 5-element tuples from _walk() for each child value
+    """
+
+    return list(_walk(encoded, parent[2], parent[3]))
+
+
+def _index_crl(encoded, crl_info, crl_index):
+    """
+    Adds the revoked serial numbers of a CRL to an index
+
+    :param encoded:
+        A byte string containing the CRL
+
+    :param crl_info:
+        A 5-element tuple from _walk() for the CertificateList
+
+    :param crl_index:
+        A dict mapping unicode strings from x509.Name.hashable to sets of
+        integer serial numbers
+    """
+
+    tbs_children = _children(encoded, _children(encoded, crl_info)[0])
+
+    # The version is optional, but is the only INTEGER field
+    index = 1 if tbs_children[0][0] == 0x02 else 0
+    issuer_info = tbs_children[index + 1]
+    issuer = Name.load(encoded[issuer_info[1]:issuer_info[4]]).hashable
+    serials = crl_index.setdefault(issuer, set())
+
+    # After this_update and the optional next_update, the revoked
+    # certificates are the only universal SEQUENCE
+    for child in tbs_children[index + 3:]:
+        if child[0] != 0x30:
+            continue
+        for entry in _walk(encoded, child[2], child[3]):
+            entry_children = _children(encoded, entry)
+            if len(entry_children) > 2:
+                # Indirect CRLs switch the issuer for this and all subsequent
+                # entries, so only entries with extensions are fully parsed
+                from .crl import CRLEntryExtensions
+
+                extensions_info = entry_children[2]
+                extensions = CRLEntryExtensions.load(encoded[extensions_info[1]:extensions_info[4]])
+                for extension in extensions:
+                    if extension['extn_id'].native != 'certificate_issuer':
+                        continue
+                    for general_name in extension['extn_value'].parsed:
+                        if general_name.name == 'directory_name':
+                            serials = crl_index.setdefault(general_name.chosen.hashable, set())
+                            break
+            serial_info = entry_children[0]
+            serials.add(int_from_bytes(encoded[serial_info[2]:serial_info[3]], signed=True))
+        break
+
+
+def _index_ocsp_response(encoded, response_info, ocsp_index, hash_algo_cache):
+    """
+    Adds the certificate statuses of an OCSP response to an index
+
+    :param encoded:
+        A byte string containing the OCSP response
+
+    :param response_info:
+        A 5-element tuple from _walk() for the OCSPResponse
+
+    :param ocsp_index:
+        A dict mapping 4-element tuples of (unicode string hash algorithm,
+        byte string issuer name hash, byte string issuer key hash, integer
+        serial number) to a unicode string of "good", "revoked" or "unknown"
+
+    :param hash_algo_cache:
+        A dict mapping encoded OIDs to hash algorithm names
+    """
+
+    response_children = _children(encoded, response_info)
+    # Only successful responses contain the explicitly tagged responseBytes
+    if len(response_children) < 2:
+        return
+    response_bytes_info = _children(encoded, response_children[1])[0]
+    response_type_info, response_info = _children(encoded, response_bytes_info)[0:2]
+    if encoded[response_type_info[2]:response_type_info[3]] != b'\x2b\x06\x01\x05\x05\x07\x30\x01\x01':
+        return
+
+    # The BasicOCSPResponse is encoded within the OCTET STRING, so it is
+    # walked in place rather than being sliced out
+    basic_info = next(_walk(encoded, response_info[2], response_info[3]))
+    response_data_children = _children(encoded, _children(encoded, basic_info)[0])
+
+    # Skip the optional explicitly tagged version, responder id and produced
+    # at, leaving the sequence of single responses
+    index = 1 if response_data_children[0][0] == 0xA0 else 0
+    responses_info = response_data_children[index + 2]
+
+    for single_response in _walk(encoded, responses_info[2], responses_info[3]):
+        cert_id_info, status_info = _children(encoded, single_response)[0:2]
+        hash_algo_info, name_hash_info, key_hash_info, serial_info = _children(encoded, cert_id_info)
+
+        oid_info = _children(encoded, hash_algo_info)[0]
+        oid_bytes = encoded[oid_info[2]:oid_info[3]]
+        hash_algo = hash_algo_cache.get(oid_bytes)
+        if hash_algo is None:
+            hash_algo = DigestAlgorithmId.load(encoded[oid_info[1]:oid_info[4]]).native
+            hash_algo_cache[oid_bytes] = hash_algo
+
+        key = (
+            hash_algo,
+            encoded[name_hash_info[2]:name_hash_info[3]],
+            encoded[key_hash_info[2]:key_hash_info[3]],
+            int_from_bytes(encoded[serial_info[2]:serial_info[3]], signed=True),
+        )
+        ocsp_index[key] = _CERT_STATUS_TAGS.get(status_info[0] & 0x1F, 'unknown')
+
+
+# Maps the implicit tags of ocsp.CertStatus to the alternative names
+_CERT_STATUS_TAGS = {
+    0: 'good',
+    1: 'revoked',
+    2: 'unknown',
+}
+
+
+def index_revocation_info(value):
+    """
+    Builds compact indexes of the CRLs and OCSP responses embedded in an
+    Adobe revocation info archival attribute. The encoded data is walked
+    once, in place, without building CertificateList, RevokedCertificate or
+    OCSPResponse objects.
+
+    :param value:
+        A RevocationInfoArchival or SetOfRevocationInfoArchival object, or a
+        byte string of either encoded
+
+    :return:
+        A 2-element tuple:
+         - 0: A dict mapping unicode strings from x509.Name.hashable of each
+           CRL issuer to a set of integer revoked serial numbers
+         - 1: A dict mapping 4-element tuples of (unicode string hash
+           algorithm, byte string issuer name hash, byte string issuer key
+           hash, integer serial number) from each ocsp.CertId to a unicode
+           string of "good", "revoked" or "unknown"
+    """
+
+    if isinstance(value, (RevocationInfoArchival, SetOfRevocationInfoArchival)):
+        value = value.dump()
+
+    crl_index = {}
+    ocsp_index = {}
+    hash_algo_cache = {}
+
+    archive_info = next(_walk(value, 0, len(value)))
+    archives = [archive_info]
+    # A SetOfRevocationInfoArchival contains universal SEQUENCEs, whereas
+    # the fields of RevocationInfoArchival are all explicitly tagged
+    children = _children(value, archive_info)
+    if archive_info[0] == 0x31 or (children and children[0][0] == 0x30):
+        archives = children
+
+    for archive in archives:
+        for field in _children(value, archive):
+            tag = field[0] & 0x1F
+            if tag == 2:
+                continue
+            sequence_info = _children(value, field)[0]
+            for item in _walk(value, sequence_info[2], sequence_info[3]):
+                if tag == 0:
+                    _index_crl(value, item, crl_index)
+                else:
+                    _index_ocsp_response(value, item, ocsp_index, hash_algo_cache)
+
+    return (crl_index, ocsp_index)
+
+
+# CertificateList and OCSPResponse are referenced by spec so that .crl and
+# .ocsp are only imported once used, but remain reachable from this module
+# on Python 3.7+, which supports module-level __getattr__()
+def __getattr__(name):
+    if name == 'CertificateList':
+        from .crl import CertificateList
+
+        return CertificateList
+    if name == 'OCSPResponse':
+        from .ocsp import OCSPResponse
+
+        return OCSPResponse
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
@@ -40,7 +40,6 @@ from .core import (
     SetOf,
     UTF8String,
 )
-from .crl import CertificateList
 from .x509 import (
     Attributes,
     CertificatePolicies,
@@ -172,7 +171,7 @@ class MetaData(Sequence):
 class TimeStampAndCRL(SequenceOf):
     _fields = [
         ('time_stamp', EncapsulatedContentInfo),
-        ('crl', CertificateList, {'optional': True}),
+        ('crl', '.crl.CertificateList', {'optional': True}),
     ]
 
 
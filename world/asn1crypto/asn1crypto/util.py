@@ -7,6 +7,8 @@ from bytes and UTC timezone. Exports the following items:
  - OrderedDict()
  - int_from_bytes()
  - int_to_bytes()
+ - ints_from_bytes()
+ - ints_to_bytes()
  - timezone.utc
  - inet_ntop()
  - inet_pton()
@@ -17,6 +19,7 @@ from bytes and UTC timezone. Exports the following items:
 from __future__ import unicode_literals, division, absolute_import, print_function
 
 import math
+import struct
 import sys
 from datetime import datetime, date, time
 
@@ -112,6 +115,67 @@ if sys.version_info <= (3,):
 
         return num
 
+    def ints_to_bytes(values, width):
+        """
+        Converts a list of unsigned integers to a single byte string of
+        fixed-width, big-endian values
+
+        :param values:
+            A list of non-negative integers
+
+        :param width:
+            An integer of the byte width of each value
+
+        :raises:
+            OverflowError - when a value does not fit in the width
+
+        :return:
+            A byte string of len(values) * width bytes
+        """
+
+        hex_width = width * 2
+        parts = []
+        for value in values:
+            if value < 0:
+                raise OverflowError('can\'t convert negative int to unsigned')
+            hex_str = '%x' % value
+            if len(hex_str) > hex_width:
+                raise OverflowError('int too big to convert')
+            parts.append('0' * (hex_width - len(hex_str)))
+            parts.append(hex_str)
+        return ''.join(parts).decode('hex')
+
+    def ints_from_bytes(value, width):
+        """
+        Converts a byte string of fixed-width, big-endian values to a list of
+        unsigned integers
+
+        :param value:
+            The byte string to convert
+
+        :param width:
+            An integer of the byte width of each value
+
+        :raises:
+            ValueError - when the length of value is not a multiple of width
+
+        :return:
+            A list of integers
+        """
+
+        if len(value) % width != 0:
+            raise ValueError(unwrap(
+                '''
+                value length, %s, is not a multiple of width, %s
+                ''',
+                len(value),
+                width
+            ))
+
+        hex_str = value.encode('hex')
+        hex_width = width * 2
+        return [long(hex_str[i:i + hex_width], 16) for i in range(0, len(hex_str), hex_width)]  # noqa
+
     class utc(tzinfo):  # noqa
 
         def tzname(self, _):
@@ -154,16 +218,16 @@ else:
         """
 
         if width is None:
+            # Small values, such as versions, tags and lengths, are by far the
+            # most common, so they are served from precomputed byte strings
+            if 0 <= value < 128:
+                return _BYTE_VALUES[value]
             if signed:
-                if value < 0:
-                    bits_required = abs(value + 1).bit_length()
-                else:
-                    bits_required = value.bit_length()
-                if bits_required % 8 == 0:
-                    bits_required += 1
+                # Two's complement needs a sign bit, so a value whose
+                # magnitude fills whole bytes needs an extra byte
+                width = ((value if value >= 0 else ~value).bit_length() >> 3) + 1
             else:
-                bits_required = value.bit_length()
-            width = math.ceil(bits_required / 8) or 1
+                width = ((value.bit_length() + 7) >> 3) or 1
         return value.to_bytes(width, byteorder='big', signed=signed)
 
     def int_from_bytes(value, signed=False):
@@ -182,6 +246,70 @@ else:
 
         return int.from_bytes(value, 'big', signed=signed)
 
+    _BYTE_VALUES = tuple(bytes([i]) for i in range(128))
+
+    def ints_to_bytes(values, width):
+        """
+        Converts a list of unsigned integers to a single byte string of
+        fixed-width, big-endian values
+
+        :param values:
+            A list of non-negative integers
+
+        :param width:
+            An integer of the byte width of each value
+
+        :raises:
+            OverflowError - when a value does not fit in the width
+
+        :return:
+            A byte string of len(values) * width bytes
+        """
+
+        return b''.join([value.to_bytes(width, 'big') for value in values])
+
+    def ints_from_bytes(value, width):
+        """
+        Converts a byte string of fixed-width, big-endian values to a list of
+        unsigned integers
+
+        :param value:
+            The byte string to convert
+
+        :param width:
+            An integer of the byte width of each value
+
+        :raises:
+            ValueError - when the length of value is not a multiple of width
+
+        :return:
+            A list of integers
+        """
+
+        if len(value) % width != 0:
+            raise ValueError(unwrap(
+                '''
+                value length, %s, is not a multiple of width, %s
+                ''',
+                len(value),
+                width
+            ))
+
+        if width == 8:
+            return list(struct.unpack('>%dQ' % (len(value) // 8), value))
+
+        view = memoryview(value)
+        from_bytes = int.from_bytes
+        return [from_bytes(view[i:i + width], 'big') for i in range(0, len(value), width)]
+
+    # Kept so the optional compiled version can be compared against it
+    _py_int_from_bytes = int_from_bytes
+
+    try:
+        from _asn1crypto_speedups import int_from_bytes  # noqa
+    except (ImportError):
+        pass
+
 
 _DAYS_PER_MONTH_YEAR_0 = {
     1: 31,
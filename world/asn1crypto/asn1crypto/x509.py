@@ -9,6 +9,7 @@ ASN.1 type classes for X.509 certificates. Exports the following items:
  - GeneralName()
  - GeneralNames()
  - Name()
+ - TrustedCertificateStore()
 
 Other type classes are defined that help compose the types listed above.
 """
@@ -40,7 +41,6 @@ from .core import (
     IA5String,
     Integer,
     Null,
-    NumericString,
     ObjectIdentifier,
     OctetBitString,
     OctetString,
@@ -48,7 +48,6 @@ from .core import (
     PrintableString,
     Sequence,
     SequenceOf,
-    Set,
     SetOf,
     TeletexString,
     UniversalString,
@@ -58,6 +57,8 @@ from .core import (
     VOID,
 )
 from .keys import PublicKeyInfo
+from .parser import _parse
+from .pem import detect as pem_detect, unarmor as pem_unarmor
 from .util import int_to_bytes, int_from_bytes, inet_ntop, inet_pton
 
 
@@ -660,6 +661,10 @@ class NameTypeAndValue(Sequence):
         if other['type'].native != self['type'].native:
             return False
 
+        # Identically-encoded values are equal without decoding them
+        if other['value'].dump() == self['value'].dump():
+            return True
+
         return other.prepped_value == self.prepped_value
 
     def _ldap_string_prep(self, string):
@@ -996,6 +1001,9 @@ class Name(Choice):
 
         if not isinstance(other, Name):
             return False
+        # Identically-encoded names are equal without decoding their values
+        if self.dump() == other.dump():
+            return True
         return self.chosen == other.chosen
 
     @property
@@ -1100,239 +1108,6 @@ class AnotherName(Sequence):
     ]
 
 
-class CountryName(Choice):
-    class_ = 1
-    tag = 1
-
-    _alternatives = [
-        ('x121_dcc_code', NumericString),
-        ('iso_3166_alpha2_code', PrintableString),
-    ]
-
-
-class AdministrationDomainName(Choice):
-    class_ = 1
-    tag = 2
-
-    _alternatives = [
-        ('numeric', NumericString),
-        ('printable', PrintableString),
-    ]
-
-
-class PrivateDomainName(Choice):
-    _alternatives = [
-        ('numeric', NumericString),
-        ('printable', PrintableString),
-    ]
-
-
-class PersonalName(Set):
-    _fields = [
-        ('surname', PrintableString, {'tag_type': 'implicit', 'tag': 0}),
-        ('given_name', PrintableString, {'tag_type': 'implicit', 'tag': 1, 'optional': True}),
-        ('initials', PrintableString, {'tag_type': 'implicit', 'tag': 2, 'optional': True}),
-        ('generation_qualifier', PrintableString, {'tag_type': 'implicit', 'tag': 3, 'optional': True}),
-    ]
-
-
-class TeletexPersonalName(Set):
-    _fields = [
-        ('surname', TeletexString, {'tag_type': 'implicit', 'tag': 0}),
-        ('given_name', TeletexString, {'tag_type': 'implicit', 'tag': 1, 'optional': True}),
-        ('initials', TeletexString, {'tag_type': 'implicit', 'tag': 2, 'optional': True}),
-        ('generation_qualifier', TeletexString, {'tag_type': 'implicit', 'tag': 3, 'optional': True}),
-    ]
-
-
-class OrganizationalUnitNames(SequenceOf):
-    _child_spec = PrintableString
-
-
-class TeletexOrganizationalUnitNames(SequenceOf):
-    _child_spec = TeletexString
-
-
-class BuiltInStandardAttributes(Sequence):
-    _fields = [
-        ('country_name', CountryName, {'optional': True}),
-        ('administration_domain_name', AdministrationDomainName, {'optional': True}),
-        ('network_address', NumericString, {'tag_type': 'implicit', 'tag': 0, 'optional': True}),
-        ('terminal_identifier', PrintableString, {'tag_type': 'implicit', 'tag': 1, 'optional': True}),
-        ('private_domain_name', PrivateDomainName, {'tag_type': 'explicit', 'tag': 2, 'optional': True}),
-        ('organization_name', PrintableString, {'tag_type': 'implicit', 'tag': 3, 'optional': True}),
-        ('numeric_user_identifier', NumericString, {'tag_type': 'implicit', 'tag': 4, 'optional': True}),
-        ('personal_name', PersonalName, {'tag_type': 'implicit', 'tag': 5, 'optional': True}),
-        ('organizational_unit_names', OrganizationalUnitNames, {'tag_type': 'implicit', 'tag': 6, 'optional': True}),
-    ]
-
-
-class BuiltInDomainDefinedAttribute(Sequence):
-    _fields = [
-        ('type', PrintableString),
-        ('value', PrintableString),
-    ]
-
-
-class BuiltInDomainDefinedAttributes(SequenceOf):
-    _child_spec = BuiltInDomainDefinedAttribute
-
-
-class TeletexDomainDefinedAttribute(Sequence):
-    _fields = [
-        ('type', TeletexString),
-        ('value', TeletexString),
-    ]
-
-
-class TeletexDomainDefinedAttributes(SequenceOf):
-    _child_spec = TeletexDomainDefinedAttribute
-
-
-class PhysicalDeliveryCountryName(Choice):
-    _alternatives = [
-        ('x121_dcc_code', NumericString),
-        ('iso_3166_alpha2_code', PrintableString),
-    ]
-
-
-class PostalCode(Choice):
-    _alternatives = [
-        ('numeric_code', NumericString),
-        ('printable_code', PrintableString),
-    ]
-
-
-class PDSParameter(Set):
-    _fields = [
-        ('printable_string', PrintableString, {'optional': True}),
-        ('teletex_string', TeletexString, {'optional': True}),
-    ]
-
-
-class PrintableAddress(SequenceOf):
-    _child_spec = PrintableString
-
-
-class UnformattedPostalAddress(Set):
-    _fields = [
-        ('printable_address', PrintableAddress, {'optional': True}),
-        ('teletex_string', TeletexString, {'optional': True}),
-    ]
-
-
-class E1634Address(Sequence):
-    _fields = [
-        ('number', NumericString, {'tag_type': 'implicit', 'tag': 0}),
-        ('sub_address', NumericString, {'tag_type': 'implicit', 'tag': 1, 'optional': True}),
-    ]
-
-
-class NAddresses(SetOf):
-    _child_spec = OctetString
-
-
-class PresentationAddress(Sequence):
-    _fields = [
-        ('p_selector', OctetString, {'tag_type': 'explicit', 'tag': 0, 'optional': True}),
-        ('s_selector', OctetString, {'tag_type': 'explicit', 'tag': 1, 'optional': True}),
-        ('t_selector', OctetString, {'tag_type': 'explicit', 'tag': 2, 'optional': True}),
-        ('n_addresses', NAddresses, {'tag_type': 'explicit', 'tag': 3}),
-    ]
-
-
-class ExtendedNetworkAddress(Choice):
-    _alternatives = [
-        ('e163_4_address', E1634Address),
-        ('psap_address', PresentationAddress, {'tag_type': 'implicit', 'tag': 0})
-    ]
-
-
-class TerminalType(Integer):
-    _map = {
-        3: 'telex',
-        4: 'teletex',
-        5: 'g3_facsimile',
-        6: 'g4_facsimile',
-        7: 'ia5_terminal',
-        8: 'videotex',
-    }
-
-
-class ExtensionAttributeType(Integer):
-    _map = {
-        1: 'common_name',
-        2: 'teletex_common_name',
-        3: 'teletex_organization_name',
-        4: 'teletex_personal_name',
-        5: 'teletex_organization_unit_names',
-        6: 'teletex_domain_defined_attributes',
-        7: 'pds_name',
-        8: 'physical_delivery_country_name',
-        9: 'postal_code',
-        10: 'physical_delivery_office_name',
-        11: 'physical_delivery_office_number',
-        12: 'extension_of_address_components',
-        13: 'physical_delivery_personal_name',
-        14: 'physical_delivery_organization_name',
-        15: 'extension_physical_delivery_address_components',
-        16: 'unformatted_postal_address',
-        17: 'street_address',
-        18: 'post_office_box_address',
-        19: 'poste_restante_address',
-        20: 'unique_postal_name',
-        21: 'local_postal_attributes',
-        22: 'extended_network_address',
-        23: 'terminal_type',
-    }
-
-
-class ExtensionAttribute(Sequence):
-    _fields = [
-        ('extension_attribute_type', ExtensionAttributeType, {'tag_type': 'implicit', 'tag': 0}),
-        ('extension_attribute_value', Any, {'tag_type': 'explicit', 'tag': 1}),
-    ]
-
-    _oid_pair = ('extension_attribute_type', 'extension_attribute_value')
-    _oid_specs = {
-        'common_name': PrintableString,
-        'teletex_common_name': TeletexString,
-        'teletex_organization_name': TeletexString,
-        'teletex_personal_name': TeletexPersonalName,
-        'teletex_organization_unit_names': TeletexOrganizationalUnitNames,
-        'teletex_domain_defined_attributes': TeletexDomainDefinedAttributes,
-        'pds_name': PrintableString,
-        'physical_delivery_country_name': PhysicalDeliveryCountryName,
-        'postal_code': PostalCode,
-        'physical_delivery_office_name': PDSParameter,
-        'physical_delivery_office_number': PDSParameter,
-        'extension_of_address_components': PDSParameter,
-        'physical_delivery_personal_name': PDSParameter,
-        'physical_delivery_organization_name': PDSParameter,
-        'extension_physical_delivery_address_components': PDSParameter,
-        'unformatted_postal_address': UnformattedPostalAddress,
-        'street_address': PDSParameter,
-        'post_office_box_address': PDSParameter,
-        'poste_restante_address': PDSParameter,
-        'unique_postal_name': PDSParameter,
-        'local_postal_attributes': PDSParameter,
-        'extended_network_address': ExtendedNetworkAddress,
-        'terminal_type': TerminalType,
-    }
-
-
-class ExtensionAttributes(SequenceOf):
-    _child_spec = ExtensionAttribute
-
-
-class ORAddress(Sequence):
-    _fields = [
-        ('built_in_standard_attributes', BuiltInStandardAttributes),
-        ('built_in_domain_defined_attributes', BuiltInDomainDefinedAttributes, {'optional': True}),
-        ('extension_attributes', ExtensionAttributes, {'optional': True}),
-    ]
-
-
 class EDIPartyName(Sequence):
     _fields = [
         ('name_assigner', DirectoryString, {'tag_type': 'implicit', 'tag': 0, 'optional': True}),
@@ -1345,7 +1120,9 @@ class GeneralName(Choice):
         ('other_name', AnotherName, {'tag_type': 'implicit', 'tag': 0}),
         ('rfc822_name', EmailAddress, {'tag_type': 'implicit', 'tag': 1}),
         ('dns_name', DNSName, {'tag_type': 'implicit', 'tag': 2}),
-        ('x400_address', ORAddress, {'tag_type': 'implicit', 'tag': 3}),
+        # The X.400 address structures are rarely used, so they are only
+        # imported once an x400_address is encountered
+        ('x400_address', '._x400.ORAddress', {'tag_type': 'implicit', 'tag': 3}),
         ('directory_name', Name, {'tag_type': 'explicit', 'tag': 4}),
         ('edi_party_name', EDIPartyName, {'tag_type': 'implicit', 'tag': 5}),
         ('uniform_resource_identifier', URI, {'tag_type': 'implicit', 'tag': 6}),
@@ -2679,3 +2456,339 @@ class CertificateAux(Sequence):
 
 class TrustedCertificate(Concat):
     _child_specs = [Certificate, CertificateAux]
+
+
+class TrustedCertificateStore(object):
+    """
+    A read-only index of an OpenSSL "TRUSTED CERTIFICATE" bundle. The
+    CertificateAux trust and reject lists of each entry are reduced to
+    integer bitmasks when the bundle is loaded, while each Certificate is
+    only constructed when requested.
+    """
+
+    # A dict mapping the encoded contents of a KeyPurposeId to a bit - shared
+    # by all stores so that masks may be compared between them
+    _purpose_bits = {}
+
+    # A dict mapping unicode string purposes to the result of _mask()
+    _purpose_masks = {}
+
+    # A list of byte strings of each encoded Certificate
+    _certificates = None
+
+    # A list of 4-element tuples of (integer trust mask, integer reject mask,
+    # unicode string alias or None, byte string keyid or None)
+    _aux = None
+
+    # A dict of integer index to Certificate objects already constructed
+    _loaded = None
+
+    def __init__(self, data):
+        """
+        :param data:
+            A byte string of one or more PEM-encoded "TRUSTED CERTIFICATE" or
+            "CERTIFICATE" blocks, or of DER-encoded certificates each followed
+            by an optional CertificateAux
+
+        :raises:
+            ValueError - when the data contains a malformed entry
+        """
+
+        self._certificates = []
+        self._aux = []
+        self._loaded = {}
+
+        if pem_detect(data):
+            for object_name, _, der_bytes in pem_unarmor(data, multiple=True):
+                if object_name not in ('TRUSTED CERTIFICATE', 'CERTIFICATE'):
+                    continue
+                self._add_entries(der_bytes, single=True)
+        else:
+            self._add_entries(data, single=False)
+
+    @classmethod
+    def _purpose_bit(cls, oid_contents):
+        """
+        :param oid_contents:
+            A byte string of the encoded contents of a KeyPurposeId
+
+        :return:
+            An integer with a single bit set
+        """
+
+        bit = cls._purpose_bits.get(oid_contents)
+        if bit is None:
+            bit = 1 << len(cls._purpose_bits)
+            cls._purpose_bits[oid_contents] = bit
+        return bit
+
+    def _add_entries(self, encoded, single):
+        """
+        Splits encoded data into certificates and their CertificateAux
+
+        :param encoded:
+            A byte string of DER-encoded data
+
+        :param single:
+            A boolean - if the data must only contain a single entry
+        """
+
+        encoded_len = len(encoded)
+        pointer = 0
+        while pointer < encoded_len:
+            _, cert_end = _parse(encoded, encoded_len, pointer, lengths_only=True)
+            self._check_end(cert_end, encoded_len)
+            self._certificates.append(encoded[pointer:cert_end])
+            pointer = cert_end
+
+            aux_bytes = None
+            if pointer < encoded_len:
+                _, aux_end = _parse(encoded, encoded_len, pointer, lengths_only=True)
+                self._check_end(aux_end, encoded_len)
+                if single or not self._is_certificate(encoded, pointer, aux_end):
+                    aux_bytes = encoded[pointer:aux_end]
+                    pointer = aux_end
+            self._aux.append(self._index_aux(aux_bytes))
+
+            if single and pointer != encoded_len:
+                raise ValueError(unwrap(
+                    '''
+                    Extra data - %d bytes of trailing data were provided after
+                    trusted certificate %d
+                    ''',
+                    encoded_len - pointer,
+                    len(self._certificates) - 1
+                ))
+
+    @staticmethod
+    def _check_end(end, encoded_len):
+        """
+        :param end:
+            The integer offset of the end of a value
+
+        :param encoded_len:
+            The integer length of the encoded data
+
+        :raises:
+            ValueError - when the value extends past the end of the data
+        """
+
+        if end > encoded_len:
+            raise ValueError(unwrap(
+                '''
+                Insufficient data - %s bytes requested but only %s available
+                ''',
+                end,
+                encoded_len
+            ))
+
+    @staticmethod
+    def _is_certificate(encoded, start, end):
+        """
+        Distinguishes a Certificate from a CertificateAux without parsing
+        either. A Certificate contains exactly a TBSCertificate SEQUENCE,
+        which starts with either the explicitly tagged version or the serial
+        number, an AlgorithmIdentifier SEQUENCE and a BIT STRING signature.
+        A CertificateAux never contains a BIT STRING.
+
+        :param encoded:
+            A byte string of DER-encoded data
+
+        :param start:
+            The integer offset of the SEQUENCE
+
+        :param end:
+            The integer offset of the end of the SEQUENCE
+
+        :return:
+            A boolean
+        """
+
+        identifiers = []
+        try:
+            pointer, _ = _parse(encoded, end, start, lengths_only=True)
+            tbs_first = None
+            while pointer < end and len(identifiers) < 3:
+                header_end, child_end = _parse(encoded, end, pointer, lengths_only=True)
+                if child_end > end:
+                    return False
+                if tbs_first is None:
+                    tbs_first = encoded[header_end:header_end + 1]
+                identifiers.append(encoded[pointer:pointer + 1])
+                pointer = child_end
+        except (ValueError, IndexError):
+            return False
+
+        if pointer != end or identifiers != [b'\x30', b'\x30', b'\x03']:
+            return False
+        return tbs_first in (b'\xa0', b'\x02')
+
+    def _index_aux(self, aux_bytes):
+        """
+        :param aux_bytes:
+            A byte string of a DER-encoded CertificateAux, or None
+
+        :return:
+            A 4-element tuple of (integer trust mask, integer reject mask,
+            unicode string alias or None, byte string keyid or None)
+        """
+
+        if aux_bytes is None:
+            return (0, 0, None, None)
+
+        aux = CertificateAux.load(aux_bytes)
+        masks = []
+        for field in ('trust', 'reject'):
+            mask = 0
+            for purpose in aux[field]:
+                mask |= self._purpose_bit(purpose.contents)
+            masks.append(mask)
+        return (masks[0], masks[1], aux['alias'].native, aux['keyid'].native)
+
+    def _mask(self, purpose):
+        """
+        :param purpose:
+            A unicode string of a KeyPurposeId name or dotted OID
+
+        :return:
+            An integer bitmask for the purpose and any_extended_key_usage
+        """
+
+        mask = self._purpose_masks.get(purpose)
+        if mask is None:
+            mask = self._purpose_bit(KeyPurposeId(purpose).contents)
+            mask |= self._purpose_bit(KeyPurposeId('any_extended_key_usage').contents)
+            self._purpose_masks[purpose] = mask
+        return mask
+
+    def __len__(self):
+        return len(self._certificates)
+
+    def __iter__(self):
+        for index in range(len(self._certificates)):
+            yield self.certificate(index)
+
+    def certificate(self, index):
+        """
+        :param index:
+            The integer index of the entry
+
+        :return:
+            A Certificate object
+        """
+
+        certificate = self._loaded.get(index)
+        if certificate is None:
+            certificate = Certificate.load(self._certificates[index])
+            self._loaded[index] = certificate
+        return certificate
+
+    def alias(self, index):
+        """
+        :param index:
+            The integer index of the entry
+
+        :return:
+            None or a unicode string of the friendly name from the
+            CertificateAux
+        """
+
+        return self._aux[index][2]
+
+    def keyid(self, index):
+        """
+        :param index:
+            The integer index of the entry
+
+        :return:
+            None or a byte string of the key identifier from the
+            CertificateAux
+        """
+
+        return self._aux[index][3]
+
+    def trust(self, index, purpose):
+        """
+        Determines the trust setting of an entry for a purpose, following
+        OpenSSL in giving rejection precedence and treating
+        any_extended_key_usage as matching every purpose
+
+        :param index:
+            The integer index of the entry
+
+        :param purpose:
+            A unicode string of a KeyPurposeId name or dotted OID, e.g.
+            "server_auth"
+
+        :return:
+            True if trusted, False if rejected or None if the CertificateAux
+            does not mention the purpose
+        """
+
+        mask = self._mask(purpose)
+        trust_mask, reject_mask, _, _ = self._aux[index]
+        if reject_mask & mask:
+            return False
+        if trust_mask & mask:
+            return True
+        return None
+
+    def trusted_for(self, purpose):
+        """
+        :param purpose:
+            A unicode string of a KeyPurposeId name or dotted OID, e.g.
+            "server_auth"
+
+        :return:
+            A list of Certificate objects explicitly trusted, and not
+            rejected, for the purpose
+        """
+
+        mask = self._mask(purpose)
+        output = []
+        for index, (trust_mask, reject_mask, _, _) in enumerate(self._aux):
+            if trust_mask & mask and not reject_mask & mask:
+                output.append(self.certificate(index))
+        return output
+
+
+# The X.400 address classes were moved to _x400 so they are only imported
+# once used, but remain reachable as attributes of this module
+_X400_NAMES = frozenset([
+    'AdministrationDomainName',
+    'BuiltInDomainDefinedAttribute',
+    'BuiltInDomainDefinedAttributes',
+    'BuiltInStandardAttributes',
+    'CountryName',
+    'E1634Address',
+    'ExtendedNetworkAddress',
+    'ExtensionAttribute',
+    'ExtensionAttributeType',
+    'ExtensionAttributes',
+    'NAddresses',
+    'ORAddress',
+    'OrganizationalUnitNames',
+    'PDSParameter',
+    'PersonalName',
+    'PhysicalDeliveryCountryName',
+    'PostalCode',
+    'PresentationAddress',
+    'PrintableAddress',
+    'PrivateDomainName',
+    'TeletexDomainDefinedAttribute',
+    'TeletexDomainDefinedAttributes',
+    'TeletexOrganizationalUnitNames',
+    'TeletexPersonalName',
+    'TerminalType',
+    'UnformattedPostalAddress',
+])
+
+
+# Module-level __getattr__() is only called by Python 3.7+. Older
+# interpreters have to import the classes from asn1crypto._x400 instead.
+def __getattr__(name):
+    if name in _X400_NAMES:
+        from . import _x400
+
+        return getattr(_x400, name)
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
@@ -0,0 +1,478 @@
+# coding: utf-8
+
+"""
+Benchmarks for the asn1crypto parse, dump and native conversion hot paths.
+
+A deterministic corpus of certificates, private keys, CRLs and CMS objects of
+increasing size is generated in memory, then each workload is timed and run
+again to count allocations and, under tracemalloc, to measure memory use. For
+every workload the report lists:
+
+ - ops/s: complete passes over the corpus per second, best of several repeats
+ - MB/s: encoded bytes processed per second
+ - peak KB: peak traced memory during one pass
+ - objects: ASN.1 value objects allocated during one pass
+
+Typical use, from the world/asn1crypto directory:
+
+    python benchmarks/bench.py --save baseline.json
+    python benchmarks/bench.py --baseline baseline.json
+
+When comparing against a baseline the script exits with a non-zero code if
+any workload is slower, or allocates more objects or peak memory, than the
+tolerance allows.
+"""
+
+from __future__ import unicode_literals, division, absolute_import, print_function
+
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')))
+
+from asn1crypto import cms, core, crl, keys, pem, x509  # noqa
+from asn1crypto.util import timezone  # noqa
+
+
+SEED = 20170101
+BASE_TIME = datetime(2017, 1, 1, tzinfo=timezone.utc)
+SIZES = [('small', 1), ('medium', 10), ('large', 100)]
+
+
+def _name(rnd, label):
+    return x509.Name.build({
+        'country_name': 'US',
+        'organization_name': 'Benchmark %s %d' % (label, rnd.randint(0, 1000)),
+        'common_name': '%s-%d.example.com' % (label, rnd.randint(0, 10 ** 6)),
+    })
+
+
+def _time(rnd):
+    return x509.Time(name='utc_time', value=BASE_TIME + timedelta(seconds=rnd.randint(0, 10 ** 8)))
+
+
+def _rsa_public_key(rnd):
+    return keys.RSAPublicKey({
+        'modulus': rnd.getrandbits(2048) | (1 << 2047) | 1,
+        'public_exponent': 65537,
+    })
+
+
+def make_certificate(rnd, scale):
+    """
+    Builds a syntactically valid, unsigned certificate
+
+    :param rnd:
+        A random.Random object
+
+    :param scale:
+        An integer controlling the number of subject alt names
+
+    :return:
+        A byte string of the DER-encoded certificate
+    """
+
+    alt_names = [
+        x509.GeneralName(name='dns_name', value='host%d.example.com' % i)
+        for i in range(scale * 5)
+    ]
+    extensions = [
+        {
+            'extn_id': 'basic_constraints',
+            'critical': True,
+            'extn_value': {'ca': False},
+        },
+        {
+            'extn_id': 'key_usage',
+            'critical': True,
+            'extn_value': set(['digital_signature', 'key_encipherment']),
+        },
+        {
+            'extn_id': 'key_identifier',
+            'extn_value': core.OctetString(bytes(bytearray(rnd.getrandbits(8) for _ in range(20)))),
+        },
+    ]
+    if alt_names:
+        extensions.append({'extn_id': 'subject_alt_name', 'extn_value': alt_names})
+
+    tbs = x509.TbsCertificate({
+        'version': 'v3',
+        'serial_number': rnd.getrandbits(128),
+        'signature': {'algorithm': 'sha256_rsa'},
+        'issuer': _name(rnd, 'issuer'),
+        'validity': {'not_before': _time(rnd), 'not_after': _time(rnd)},
+        'subject': _name(rnd, 'subject'),
+        'subject_public_key_info': {
+            'algorithm': {'algorithm': 'rsa'},
+            'public_key': _rsa_public_key(rnd),
+        },
+        'extensions': extensions,
+    })
+    return x509.Certificate({
+        'tbs_certificate': tbs,
+        'signature_algorithm': {'algorithm': 'sha256_rsa'},
+        'signature_value': bytes(bytearray(rnd.getrandbits(8) for _ in range(256))),
+    }).dump()
+
+
+def make_private_key(rnd, scale):
+    """
+    :param rnd:
+        A random.Random object
+
+    :param scale:
+        An integer controlling the number of primes, and so the modulus size
+
+    :return:
+        A byte string of a DER-encoded PKCS#8 RSA private key. The numbers are
+        random, so the key is structurally valid but mathematically useless.
+    """
+
+    bits = 1024 * (scale + 1)
+    other_prime_infos = [
+        {
+            'prime': rnd.getrandbits(1024),
+            'exponent': rnd.getrandbits(1024),
+            'coefficient': rnd.getrandbits(1024),
+        }
+        for _ in range(scale - 1)
+    ]
+    private_key = keys.RSAPrivateKey({
+        'version': 'multi' if other_prime_infos else 'two-prime',
+        'modulus': rnd.getrandbits(bits) | (1 << (bits - 1)) | 1,
+        'public_exponent': 65537,
+        'private_exponent': rnd.getrandbits(bits),
+        'prime1': rnd.getrandbits(1024),
+        'prime2': rnd.getrandbits(1024),
+        'exponent1': rnd.getrandbits(1024),
+        'exponent2': rnd.getrandbits(1024),
+        'coefficient': rnd.getrandbits(1024),
+        'other_prime_infos': other_prime_infos or None,
+    })
+    return keys.PrivateKeyInfo.wrap(private_key, 'rsa').dump()
+
+
+def make_crl(rnd, scale):
+    """
+    :param rnd:
+        A random.Random object
+
+    :param scale:
+        An integer controlling the number of revoked certificates
+
+    :return:
+        A byte string of a DER-encoded, unsigned CRL
+    """
+
+    revoked = []
+    for _ in range(scale * 100):
+        revoked.append({
+            'user_certificate': rnd.getrandbits(128),
+            'revocation_date': _time(rnd),
+        })
+    this_update = _time(rnd)
+    return crl.CertificateList({
+        'tbs_cert_list': {
+            'version': 'v2',
+            'signature': {'algorithm': 'sha256_rsa'},
+            'issuer': _name(rnd, 'issuer'),
+            'this_update': this_update,
+            'next_update': this_update,
+            'revoked_certificates': revoked,
+        },
+        'signature_algorithm': {'algorithm': 'sha256_rsa'},
+        'signature': bytes(bytearray(rnd.getrandbits(8) for _ in range(256))),
+    }).dump()
+
+
+def make_signed_data(rnd, scale, certificates):
+    """
+    :param rnd:
+        A random.Random object
+
+    :param scale:
+        An integer controlling the size of the content and number of
+        certificates
+
+    :param certificates:
+        A list of byte strings of DER-encoded certificates to embed
+
+    :return:
+        A byte string of a DER-encoded ContentInfo with SignedData
+    """
+
+    content = bytes(bytearray(rnd.getrandbits(8) for _ in range(scale * 1024)))
+    return cms.ContentInfo({
+        'content_type': 'signed_data',
+        'content': cms.SignedData({
+            'version': 'v1',
+            'digest_algorithms': [{'algorithm': 'sha256'}],
+            'encap_content_info': {'content_type': 'data', 'content': content},
+            'certificates': [x509.Certificate.load(c) for c in certificates[:scale]],
+            'signer_infos': [],
+        }),
+    }).dump()
+
+
+def build_corpus(count):
+    """
+    Generates the benchmark corpus
+
+    :param count:
+        An integer number of objects of each kind and size to generate
+
+    :return:
+        A dict mapping size labels to dicts of lists of byte strings
+    """
+
+    rnd = random.Random(SEED)
+    corpus = {}
+    for label, scale in SIZES:
+        certs = [make_certificate(rnd, scale) for _ in range(count)]
+        corpus[label] = {
+            'certificates': certs,
+            'pem': b''.join(pem.armor('CERTIFICATE', c) for c in certs),
+            'private_keys': [make_private_key(rnd, scale) for _ in range(count)],
+            'crls': [make_crl(rnd, scale) for _ in range(max(1, count // 10))],
+            'cms': [make_signed_data(rnd, scale, certs) for _ in range(count)],
+        }
+    return corpus
+
+
+def bench_certificate_native(data):
+    for encoded in data['certificates']:
+        x509.Certificate.load(encoded).native
+
+
+def bench_certificate_dump(data):
+    for encoded in data['certificates']:
+        x509.Certificate.load(encoded).dump(force=True)
+
+
+def bench_pem_unarmor(data):
+    for _ in pem.unarmor(data['pem'], multiple=True):
+        pass
+
+
+def bench_private_key_public_key(data):
+    for encoded in data['private_keys']:
+        keys.PrivateKeyInfo.load(encoded).public_key
+
+
+def bench_crl_iterate(data):
+    for encoded in data['crls']:
+        revoked = crl.CertificateList.load(encoded)['tbs_cert_list']['revoked_certificates']
+        for entry in revoked:
+            entry['user_certificate'].native
+            entry['revocation_date'].native
+
+
+def bench_cms_parse(data):
+    for encoded in data['cms']:
+        signed_data = cms.ContentInfo.load(encoded)['content']
+        signed_data['encap_content_info']['content'].native
+        for certificate in signed_data['certificates']:
+            certificate.chosen['tbs_certificate']['serial_number'].native
+
+
+# Each workload is a 3-element tuple of (name, function, corpus key that
+# determines the number of bytes processed)
+WORKLOADS = [
+    ('certificate_native', bench_certificate_native, 'certificates'),
+    ('certificate_dump_force', bench_certificate_dump, 'certificates'),
+    ('pem_unarmor_multiple', bench_pem_unarmor, 'pem'),
+    ('private_key_public_key', bench_private_key_public_key, 'private_keys'),
+    ('crl_iterate', bench_crl_iterate, 'crls'),
+    ('cms_content_info_parse', bench_cms_parse, 'cms'),
+]
+
+
+def _corpus_bytes(value):
+    if isinstance(value, bytes):
+        return len(value)
+    return sum(len(v) for v in value)
+
+
+_OBJECT_COUNT = [0]
+
+
+def _counting_new(cls, *args, **kwargs):
+    _OBJECT_COUNT[0] += 1
+    return object.__new__(cls)
+
+
+def count_objects(function, data):
+    """
+    Runs a workload once, counting every Asn1Value object it allocates. The
+    counting hook slows down object construction and can not be removed once
+    installed, so this must only be called after all timing is done.
+
+    :param function:
+        The workload function to call with the corpus data
+
+    :param data:
+        A dict of corpus data for a single size
+
+    :return:
+        An integer number of objects allocated
+    """
+
+    if core.Asn1Value.__dict__.get('__new__') is None:
+        core.Asn1Value.__new__ = staticmethod(_counting_new)
+
+    _OBJECT_COUNT[0] = 0
+    function(data)
+    return _OBJECT_COUNT[0]
+
+
+def measure(function, data, repeat):
+    """
+    Times a workload and measures its memory use
+
+    :param function:
+        The workload function to call with the corpus data
+
+    :param data:
+        A dict of corpus data for a single size
+
+    :param repeat:
+        An integer number of timed runs, the fastest of which is reported
+
+    :return:
+        A 2-element tuple of (float seconds, integer peak bytes)
+    """
+
+    function(data)
+
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        function(data)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+
+    gc.collect()
+    tracemalloc.start()
+    function(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return (best, peak)
+
+
+def run(corpus, repeat):
+    """
+    :param corpus:
+        The result of build_corpus()
+
+    :param repeat:
+        An integer number of timed runs per workload
+
+    :return:
+        A dict mapping "workload/size" names to dicts of measurements
+    """
+
+    results = {}
+    for label, _ in SIZES:
+        data = corpus[label]
+        for name, function, key in WORKLOADS:
+            seconds, peak = measure(function, data, repeat)
+            size = _corpus_bytes(data[key])
+            results['%s/%s' % (name, label)] = {
+                'ops_per_sec': 1.0 / seconds,
+                'mb_per_sec': size / seconds / 1048576.0,
+                'peak_bytes': peak,
+            }
+
+    for label, _ in SIZES:
+        for name, function, _ in WORKLOADS:
+            results['%s/%s' % (name, label)]['objects'] = count_objects(function, corpus[label])
+    return results
+
+
+def report(results, baseline, tolerance):
+    """
+    Prints a table of results, compared against a baseline when provided
+
+    :param results:
+        The result of run()
+
+    :param baseline:
+        None or a dict previously returned by run()
+
+    :param tolerance:
+        A float of the allowed relative slowdown, or allocation or peak memory
+        growth
+
+    :return:
+        A list of unicode strings describing regressions
+    """
+
+    regressions = []
+    print('%-40s %10s %10s %10s %8s %9s' % ('workload', 'ops/s', 'MB/s', 'peak KB', 'objects', 'vs base'))
+    for name in sorted(results):
+        result = results[name]
+        change = ''
+        if baseline and name in baseline:
+            base = baseline[name]
+            ratio = result['ops_per_sec'] / base['ops_per_sec']
+            change = '%+.1f%%' % ((ratio - 1.0) * 100)
+            if ratio < 1.0 - tolerance:
+                regressions.append('%s: throughput %.1f%% of baseline' % (name, ratio * 100))
+            if base['peak_bytes'] and result['peak_bytes'] > base['peak_bytes'] * (1.0 + tolerance):
+                regressions.append('%s: peak memory %d bytes, baseline %d' % (
+                    name, result['peak_bytes'], base['peak_bytes']))
+            if base.get('objects') and result['objects'] > base['objects'] * (1.0 + tolerance):
+                regressions.append('%s: %d objects allocated, baseline %d' % (
+                    name, result['objects'], base['objects']))
+        print('%-40s %10.1f %10.2f %10.1f %8d %9s' % (
+            name,
+            result['ops_per_sec'],
+            result['mb_per_sec'],
+            result['peak_bytes'] / 1024.0,
+            result['objects'],
+            change
+        ))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='asn1crypto benchmarks')
+    parser.add_argument('--count', type=int, default=20, help='objects of each kind and size in the corpus')
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs per workload, best is reported')
+    parser.add_argument('--save', help='write results to this JSON file to use as a baseline')
+    parser.add_argument('--baseline', help='compare results against this JSON file')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed relative regression')
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+
+    corpus = build_corpus(args.count)
+    results = run(corpus, args.repeat)
+    regressions = report(results, baseline, args.tolerance)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if regressions:
+        print('')
+        for regression in regressions:
+            print('REGRESSION: %s' % regression)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -7,4 +7,13 @@ MODULES = {
         'target-dir'    : 'site-packages',
         'target-name'   : 'asn1crypto.zip',
     },
+    'asn1crypto-speedups':
+    {
+        'module-type'   : 'ndk-so',
+        'home-dir'      : 'speedups',
+        'ndk-name'      : '_asn1crypto_speedups',
+        'target-type'   : 'python-so-module',
+        'target-dir'    : 'site-packages',
+        'target-name'   : '_asn1crypto_speedups',
+    },
 }
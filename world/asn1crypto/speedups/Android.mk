@@ -0,0 +1,7 @@
+LOCAL_PATH := $(call my-dir)
+include $(CLEAR_VARS)
+LOCAL_MODULE := _asn1crypto_speedups
+LOCAL_SRC_FILES := _asn1crypto_speedups.c
+LOCAL_STATIC_LIBRARIES := python_shared
+include $(BUILD_SHARED_LIBRARY)
+$(call import-module,python/3.5)
@@ -0,0 +1,464 @@
+/* Optional compiled replacements for the innermost loops of asn1crypto.
+
+   Every function here mirrors a pure-Python implementation and must return
+   exactly the same values and raise the same exception types:
+
+    - parse()          asn1crypto.parser._parse()
+    - int_from_bytes() asn1crypto.util.int_from_bytes()
+    - oid_dotted()     asn1crypto.core.ObjectIdentifier.dotted
+
+   asn1crypto imports this module when available and silently keeps the
+   Python code otherwise.
+*/
+
+#include <Python.h>
+
+#define INSUFFICIENT_DATA_FMT "Insufficient data - %zd bytes requested but only %zd available"
+
+/* Length values are accumulated in a long long until they would no longer
+   fit, at which point they are necessarily larger than any buffer */
+#define MAX_SMALL_LENGTH (((unsigned long long)1) << 55)
+
+
+static PyObject *
+slice_data(PyObject *data, const char *buf, Py_ssize_t buf_len, Py_ssize_t start, Py_ssize_t end)
+{
+    if (PyBytes_CheckExact(data)) {
+        if (start > buf_len)
+            start = buf_len;
+        if (end > buf_len)
+            end = buf_len;
+        if (end < start)
+            end = start;
+        return PyBytes_FromStringAndSize(buf + start, end - start);
+    }
+    return PySequence_GetSlice(data, start, end);
+}
+
+
+static PyObject *
+length_from_octets(const unsigned char *buf, Py_ssize_t buf_len, Py_ssize_t start, Py_ssize_t end, int *is_small, long long *small)
+{
+    /* Mirrors int_from_bytes(encoded_data[start:end]), including the
+       truncation slicing performs when the data is too short */
+    unsigned long long value = 0;
+    Py_ssize_t i;
+
+    if (end > buf_len)
+        end = buf_len;
+    *is_small = 1;
+    for (i = start; i < end; i++) {
+        if (value >= MAX_SMALL_LENGTH) {
+            *is_small = 0;
+            return _PyLong_FromByteArray(buf + start, (size_t)(end - start), 0, 0);
+        }
+        value = (value << 8) | buf[i];
+    }
+    *small = (long long)value;
+    return NULL;
+}
+
+
+static PyObject *
+parse_length(PyObject *data, const unsigned char *buf, Py_ssize_t buf_len, Py_ssize_t data_len,
+             Py_ssize_t start, Py_ssize_t pointer, unsigned char first_octet, Py_ssize_t tag,
+             PyObject *tag_obj, int lengths_only);
+
+
+static PyObject *
+parse_impl(PyObject *data, const unsigned char *buf, Py_ssize_t buf_len, Py_ssize_t data_len,
+           Py_ssize_t pointer, int lengths_only)
+{
+    Py_ssize_t start, tag;
+    unsigned char first_octet, num;
+    PyObject *tag_obj = NULL, *result;
+
+    if (data_len < pointer + 2) {
+        PyErr_Format(PyExc_ValueError, INSUFFICIENT_DATA_FMT, (Py_ssize_t)2, data_len - pointer);
+        return NULL;
+    }
+
+    start = pointer;
+    if (pointer >= buf_len)
+        goto index_error;
+    first_octet = buf[pointer];
+    pointer += 1;
+
+    tag = first_octet & 31;
+    /* Base 128 length using 8th bit as continuation indicator */
+    if (tag == 31) {
+        tag = 0;
+        while (1) {
+            if (pointer >= buf_len)
+                goto index_error;
+            num = buf[pointer];
+            pointer += 1;
+            if (tag_obj == NULL && tag > (PY_SSIZE_T_MAX >> 8)) {
+                tag_obj = PyLong_FromSsize_t(tag);
+                if (tag_obj == NULL)
+                    return NULL;
+            }
+            if (tag_obj != NULL) {
+                PyObject *shift = PyLong_FromLong(7), *low = PyLong_FromLong(num & 127), *tmp = NULL;
+                if (shift != NULL && low != NULL)
+                    tmp = PyNumber_Lshift(tag_obj, shift);
+                Py_XDECREF(shift);
+                Py_CLEAR(tag_obj);
+                if (tmp != NULL)
+                    tag_obj = PyNumber_Or(tmp, low);
+                Py_XDECREF(tmp);
+                Py_XDECREF(low);
+                if (tag_obj == NULL)
+                    return NULL;
+            }
+            else {
+                tag = tag * 128 + (num & 127);
+            }
+            if (num >> 7 == 0)
+                break;
+        }
+    }
+
+    result = parse_length(data, buf, buf_len, data_len, start, pointer, first_octet, tag, tag_obj, lengths_only);
+    Py_XDECREF(tag_obj);
+    return result;
+
+index_error:
+    Py_XDECREF(tag_obj);
+    PyErr_SetString(PyExc_IndexError, "index out of range");
+    return NULL;
+}
+
+
+/* Parses the length octets and builds the result of parse_impl(). tag_obj is
+   only set for tags too large for a Py_ssize_t. */
+static PyObject *
+parse_length(PyObject *data, const unsigned char *buf, Py_ssize_t buf_len, Py_ssize_t data_len,
+             Py_ssize_t start, Py_ssize_t pointer, unsigned char first_octet, Py_ssize_t tag,
+             PyObject *tag_obj, int lengths_only)
+{
+    Py_ssize_t contents_end, sub_header_end, length_octets;
+    unsigned char length_octet;
+    int is_small;
+    long long small_length;
+    PyObject *big_length, *result, *header, *contents, *trailer;
+
+    if (pointer >= buf_len)
+        goto index_error;
+    length_octet = buf[pointer];
+    pointer += 1;
+
+    if (length_octet >> 7 == 0) {
+        if (lengths_only)
+            return Py_BuildValue("(nn)", pointer, pointer + (length_octet & 127));
+        contents_end = pointer + (length_octet & 127);
+    }
+    else {
+        length_octets = length_octet & 127;
+        if (length_octets) {
+            pointer += length_octets;
+            big_length = length_from_octets(buf, buf_len, pointer - length_octets, pointer, &is_small, &small_length);
+            if (!is_small) {
+                PyObject *ptr_obj, *end_obj;
+                if (big_length == NULL)
+                    return NULL;
+                ptr_obj = PyLong_FromSsize_t(pointer);
+                if (ptr_obj == NULL) {
+                    Py_DECREF(big_length);
+                    return NULL;
+                }
+                end_obj = PyNumber_Add(ptr_obj, big_length);
+                Py_DECREF(big_length);
+                if (end_obj == NULL) {
+                    Py_DECREF(ptr_obj);
+                    return NULL;
+                }
+                if (lengths_only) {
+                    result = PyTuple_Pack(2, ptr_obj, end_obj);
+                }
+                else {
+                    PyErr_Format(PyExc_ValueError,
+                                 "Insufficient data - %S bytes requested but only %zd available",
+                                 end_obj, data_len);
+                    result = NULL;
+                }
+                Py_DECREF(ptr_obj);
+                Py_DECREF(end_obj);
+                return result;
+            }
+            contents_end = pointer + (Py_ssize_t)small_length;
+            if (lengths_only)
+                return Py_BuildValue("(nn)", pointer, contents_end);
+        }
+        else {
+            /* Indefinite length values are scanned by parsing nested headers
+               until an end-of-contents marker is found, the same as the
+               Python implementation */
+            contents_end = pointer;
+            if (tag == 3)
+                contents_end += 1;
+            while (contents_end < data_len) {
+                PyObject *sub = parse_impl(data, buf, buf_len, data_len, contents_end, 1);
+                if (sub == NULL)
+                    return NULL;
+                sub_header_end = PyLong_AsSsize_t(PyTuple_GET_ITEM(sub, 0));
+                contents_end = PyLong_AsSsize_t(PyTuple_GET_ITEM(sub, 1));
+                if (contents_end == -1 && PyErr_Occurred()) {
+                    /* A nested length too large for the platform, which
+                       always exceeds the available data */
+                    PyErr_Clear();
+                    if (lengths_only) {
+                        result = Py_BuildValue("(nO)", pointer, PyTuple_GET_ITEM(sub, 1));
+                        Py_DECREF(sub);
+                        return result;
+                    }
+                    PyErr_Format(PyExc_ValueError,
+                                 "Insufficient data - %S bytes requested but only %zd available",
+                                 PyTuple_GET_ITEM(sub, 1), data_len);
+                    Py_DECREF(sub);
+                    return NULL;
+                }
+                Py_DECREF(sub);
+                if (contents_end == sub_header_end && contents_end >= 2 && contents_end <= buf_len &&
+                        buf[contents_end - 2] == 0 && buf[contents_end - 1] == 0)
+                    break;
+            }
+            if (lengths_only)
+                return Py_BuildValue("(nn)", pointer, contents_end);
+            if (contents_end > data_len) {
+                PyErr_Format(PyExc_ValueError, INSUFFICIENT_DATA_FMT, contents_end, data_len);
+                return NULL;
+            }
+            header = slice_data(data, (const char *)buf, buf_len, start, pointer);
+            contents = slice_data(data, (const char *)buf, buf_len, pointer, contents_end - 2);
+            trailer = PyBytes_FromStringAndSize("\x00\x00", 2);
+            goto build;
+        }
+    }
+
+    if (contents_end > data_len) {
+        PyErr_Format(PyExc_ValueError, INSUFFICIENT_DATA_FMT, contents_end, data_len);
+        return NULL;
+    }
+    header = slice_data(data, (const char *)buf, buf_len, start, pointer);
+    contents = slice_data(data, (const char *)buf, buf_len, pointer, contents_end);
+    trailer = PyBytes_FromStringAndSize(NULL, 0);
+
+build:
+    if (header == NULL || contents == NULL || trailer == NULL) {
+        Py_XDECREF(header);
+        Py_XDECREF(contents);
+        Py_XDECREF(trailer);
+        return NULL;
+    }
+    if (tag_obj != NULL)
+        return Py_BuildValue("((iiONNN)n)", first_octet >> 6, (first_octet >> 5) & 1, tag_obj,
+                             header, contents, trailer, contents_end);
+    return Py_BuildValue("((iinNNN)n)", first_octet >> 6, (first_octet >> 5) & 1, tag,
+                         header, contents, trailer, contents_end);
+
+index_error:
+    PyErr_SetString(PyExc_IndexError, "index out of range");
+    return NULL;
+}
+
+
+PyDoc_STRVAR(parse_doc,
+"parse(encoded_data, data_len, pointer=0, lengths_only=False)\n\n"
+"Compiled equivalent of asn1crypto.parser._parse()");
+
+static PyObject *
+speedups_parse(PyObject *self, PyObject *args, PyObject *kwargs)
+{
+    static char *kwlist[] = {"encoded_data", "data_len", "pointer", "lengths_only", NULL};
+    PyObject *data, *result;
+    Py_ssize_t data_len, pointer = 0;
+    int lengths_only = 0;
+    Py_buffer view;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "On|np:parse", kwlist,
+                                     &data, &data_len, &pointer, &lengths_only))
+        return NULL;
+    if (PyObject_GetBuffer(data, &view, PyBUF_SIMPLE) < 0)
+        return NULL;
+    result = parse_impl(data, (const unsigned char *)view.buf, view.len, data_len, pointer, lengths_only);
+    PyBuffer_Release(&view);
+    return result;
+}
+
+
+PyDoc_STRVAR(int_from_bytes_doc,
+"int_from_bytes(value, signed=False)\n\n"
+"Compiled equivalent of asn1crypto.util.int_from_bytes()");
+
+static PyObject *
+speedups_int_from_bytes(PyObject *self, PyObject *args, PyObject *kwargs)
+{
+    static char *kwlist[] = {"value", "signed", NULL};
+    PyObject *value, *result;
+    int is_signed = 0;
+    Py_buffer view;
+    const unsigned char *buf;
+    unsigned long long acc = 0;
+    Py_ssize_t i;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|p:int_from_bytes", kwlist, &value, &is_signed))
+        return NULL;
+    if (PyObject_GetBuffer(value, &view, PyBUF_SIMPLE) < 0)
+        return NULL;
+
+    buf = (const unsigned char *)view.buf;
+    if (view.len > 0 && view.len <= 7) {
+        for (i = 0; i < view.len; i++)
+            acc = (acc << 8) | buf[i];
+        if (is_signed && (buf[0] & 0x80))
+            result = PyLong_FromLongLong((long long)acc - (((long long)1) << (view.len * 8)));
+        else
+            result = PyLong_FromUnsignedLongLong(acc);
+    }
+    else {
+        result = _PyLong_FromByteArray(buf, (size_t)view.len, 0, is_signed);
+    }
+    PyBuffer_Release(&view);
+    return result;
+}
+
+
+static int
+append_arc(PyObject *output, unsigned long long small, PyObject *big)
+{
+    PyObject *arc;
+    int res;
+
+    if (big != NULL)
+        arc = PyObject_Str(big);
+    else
+        arc = PyUnicode_FromFormat("%llu", small);
+    if (arc == NULL)
+        return -1;
+    res = PyList_Append(output, arc);
+    Py_DECREF(arc);
+    return res;
+}
+
+
+static int
+append_first_arcs(PyObject *output, unsigned long long small, PyObject *big)
+{
+    PyObject *forty, *pair;
+    int res;
+
+    if (big == NULL) {
+        if (append_arc(output, small / 40, NULL) < 0)
+            return -1;
+        return append_arc(output, small % 40, NULL);
+    }
+    forty = PyLong_FromLong(40);
+    if (forty == NULL)
+        return -1;
+    pair = PyNumber_Divmod(big, forty);
+    Py_DECREF(forty);
+    if (pair == NULL)
+        return -1;
+    res = append_arc(output, 0, PyTuple_GET_ITEM(pair, 0));
+    if (res == 0)
+        res = append_arc(output, 0, PyTuple_GET_ITEM(pair, 1));
+    Py_DECREF(pair);
+    return res;
+}
+
+
+PyDoc_STRVAR(oid_dotted_doc,
+"oid_dotted(contents)\n\n"
+"Compiled equivalent of asn1crypto.core.ObjectIdentifier.dotted, returning\n"
+"a unicode string of the encoded object identifier in dotted notation");
+
+static PyObject *
+speedups_oid_dotted(PyObject *self, PyObject *contents)
+{
+    Py_buffer view;
+    const unsigned char *buf;
+    PyObject *output, *big = NULL, *dot, *result = NULL;
+    unsigned long long part = 0;
+    Py_ssize_t i;
+
+    if (PyObject_GetBuffer(contents, &view, PyBUF_SIMPLE) < 0)
+        return NULL;
+    output = PyList_New(0);
+    if (output == NULL)
+        goto done;
+
+    buf = (const unsigned char *)view.buf;
+    for (i = 0; i < view.len; i++) {
+        unsigned char byte = buf[i];
+
+        if (big == NULL && part >= MAX_SMALL_LENGTH) {
+            big = PyLong_FromUnsignedLongLong(part);
+            if (big == NULL)
+                goto done;
+        }
+        if (big != NULL) {
+            PyObject *shift = PyLong_FromLong(7), *low = PyLong_FromLong(byte & 127), *tmp = NULL;
+            if (shift != NULL && low != NULL)
+                tmp = PyNumber_Lshift(big, shift);
+            Py_XDECREF(shift);
+            Py_CLEAR(big);
+            if (tmp != NULL)
+                big = PyNumber_Or(tmp, low);
+            Py_XDECREF(tmp);
+            Py_XDECREF(low);
+            if (big == NULL)
+                goto done;
+        }
+        else {
+            part = (part << 7) | (byte & 127);
+        }
+
+        /* Last byte in subidentifier has the eighth bit set to 0 */
+        if ((byte & 0x80) == 0) {
+            int res;
+            if (PyList_GET_SIZE(output) == 0)
+                res = append_first_arcs(output, part, big);
+            else
+                res = append_arc(output, part, big);
+            Py_CLEAR(big);
+            part = 0;
+            if (res < 0)
+                goto done;
+        }
+    }
+
+    dot = PyUnicode_FromString(".");
+    if (dot != NULL) {
+        result = PyUnicode_Join(dot, output);
+        Py_DECREF(dot);
+    }
+
+done:
+    Py_XDECREF(big);
+    Py_XDECREF(output);
+    PyBuffer_Release(&view);
+    return result;
+}
+
+
+static PyMethodDef speedups_methods[] = {
+    {"parse", (PyCFunction)speedups_parse, METH_VARARGS | METH_KEYWORDS, parse_doc},
+    {"int_from_bytes", (PyCFunction)speedups_int_from_bytes, METH_VARARGS | METH_KEYWORDS, int_from_bytes_doc},
+    {"oid_dotted", (PyCFunction)speedups_oid_dotted, METH_O, oid_dotted_doc},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef speedups_module = {
+    PyModuleDef_HEAD_INIT,
+    "_asn1crypto_speedups",
+    "Optional compiled speedups for asn1crypto",
+    -1,
+    speedups_methods
+};
+
+PyMODINIT_FUNC
+PyInit__asn1crypto_speedups(void)
+{
+    return PyModule_Create(&speedups_module);
+}
@@ -0,0 +1,66 @@
+# coding: utf-8
+from __future__ import unicode_literals, division, absolute_import, print_function
+
+import random
+import sys
+import unittest
+import zlib
+
+from asn1crypto import cms
+
+
+def _compressed_content_info(content):
+    """
+    :param content:
+        A byte string of the zlib-compressed content
+
+    :return:
+        A ContentInfo object containing CompressedData
+    """
+
+    return cms.ContentInfo({
+        'content_type': 'compressed_data',
+        'content': cms.CompressedData({
+            'version': 'v0',
+            'compression_algorithm': {'algorithm': 'zlib'},
+            'encap_content_info': {'content_type': 'data', 'content': content},
+        }),
+    })
+
+
+class CMSTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rand = random.Random(20261019)
+        block = bytes(bytearray(rand.randrange(256) for _ in range(1000)))
+        cls.data = block * 300
+
+    def test_decompressed_chunks_trailing_data(self):
+        info = _compressed_content_info(zlib.compress(self.data) + b'junk')
+        self.assertEqual(self.data, info['content'].decompressed)
+        self.assertEqual(self.data, b''.join(info['content'].decompressed_chunks(4096)))
+        self.assertEqual(self.data, b''.join(cms.iter_decompressed_data(info.dump(), 4096)))
+
+    def test_decompressed_chunks_bounded(self):
+        info = _compressed_content_info(zlib.compress(self.data))
+        chunks = list(info['content'].decompressed_chunks(4096))
+        self.assertEqual(self.data, b''.join(chunks))
+        self.assertTrue(all(len(chunk) <= 4096 for chunk in chunks))
+
+    @unittest.skipIf(sys.version_info < (3,), 'zlib decompressors do not report the end of the stream on Python 2')
+    def test_decompressed_chunks_truncated(self):
+        info = _compressed_content_info(zlib.compress(self.data)[:-10])
+        with self.assertRaises(zlib.error):
+            b''.join(info['content'].decompressed_chunks(4096))
+        with self.assertRaises(zlib.error):
+            b''.join(cms.iter_decompressed_data(info.dump(), 4096))
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'module __getattr__() requires Python 3.7')
+    def test_reexported(self):
+        from asn1crypto import crl, ocsp, pdf
+
+        self.assertIs(crl.CertificateList, cms.CertificateList)
+        self.assertIs(ocsp.OCSPResponse, cms.OCSPResponse)
+        self.assertIs(crl.CertificateList, pdf.CertificateList)
+        self.assertIs(ocsp.OCSPResponse, pdf.OCSPResponse)
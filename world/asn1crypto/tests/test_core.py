@@ -0,0 +1,173 @@
+# coding: utf-8
+from __future__ import unicode_literals, division, absolute_import, print_function
+
+import unittest
+from datetime import datetime
+
+from asn1crypto import core, keys, x509
+from asn1crypto.util import timezone
+
+
+def _certificate():
+    """
+    :return:
+        A byte string of a DER-encoded, unsigned certificate
+    """
+
+    def name(common_name):
+        return x509.Name.build({'organization_name': 'Org', 'common_name': common_name})
+
+    time = x509.Time(name='utc_time', value=datetime(2020, 1, 1, tzinfo=timezone.utc))
+    return x509.Certificate({
+        'tbs_certificate': {
+            'version': 'v3',
+            'serial_number': 5,
+            'signature': {'algorithm': 'sha256_rsa'},
+            'issuer': name('Issuer'),
+            'validity': {'not_before': time, 'not_after': time},
+            'subject': name('Subject'),
+            'subject_public_key_info': {
+                'algorithm': {'algorithm': 'rsa'},
+                'public_key': keys.RSAPublicKey({'modulus': 12345, 'public_exponent': 3}),
+            },
+            'extensions': [
+                {'extn_id': 'basic_constraints', 'critical': True, 'extn_value': {'ca': False}},
+            ],
+        },
+        'signature_algorithm': {'algorithm': 'sha256_rsa'},
+        'signature_value': b'\x01',
+    }).dump()
+
+
+class _BerInner(core.Sequence):
+    _fields = [
+        ('flag', core.Boolean),
+        ('name', core.UTF8String),
+    ]
+
+
+class _BerOuter(core.Sequence):
+    _fields = [
+        ('octets', core.OctetString),
+        ('number', core.Integer),
+        ('inner', _BerInner),
+        ('text', core.UTF8String),
+    ]
+
+
+# Each field of _BerOuter, encoded in a way DER does not allow
+_BER_FIELDS = [
+    # Indefinite length constructed OCTET STRING
+    b'\x24\x80\x04\x01a\x04\x02bc\x00\x00',
+    # Long form length for a short INTEGER
+    b'\x02\x81\x01\x05',
+    # Indefinite length SEQUENCE holding a TRUE that is not 0xFF and a
+    # non-minimal two byte length
+    b'\x30\x80\x01\x01\x01\x0c\x82\x00\x02hi\x00\x00',
+    # Long form length for a short UTF8String
+    b'\x0c\x81\x03xyz',
+]
+
+
+class CoreTests(unittest.TestCase):
+
+    def _set_subject_value(self, tbs, value):
+        tbs['subject'].chosen[0][0]['value'] = x509.DirectoryString(name='utf8_string', value=value)
+
+    def test_mutation_inside_choice_after_splice(self):
+        cert = x509.Certificate.load(_certificate())
+        tbs = cert['tbs_certificate']
+        tbs['extensions'].append({'extn_id': 'key_usage', 'extn_value': set(['digital_signature'])})
+        tbs.dump()
+        self._set_subject_value(tbs, 'Changed')
+        self.assertIn(b'Changed', tbs.dump())
+        self.assertIn(b'Changed', cert.dump())
+        self.assertEqual(cert.dump(), cert.dump(force=True))
+
+    def test_mutation_inside_choice_without_other_changes(self):
+        cert = x509.Certificate.load(_certificate())
+        tbs = cert['tbs_certificate']
+        self._set_subject_value(tbs, 'Changed')
+        self.assertIn(b'Changed', cert.dump())
+        self.assertEqual(cert.dump(), cert.dump(force=True))
+
+    def test_unmutated_after_force_dump(self):
+        cert = x509.Certificate.load(_certificate())
+        tbs = cert['tbs_certificate']
+        tbs['extensions'].append({'extn_id': 'key_usage', 'extn_value': set(['digital_signature'])})
+        cert.dump(force=True)
+        self.assertFalse(cert._is_mutated())
+        self.assertFalse(tbs._is_mutated())
+
+    def test_unmutated_after_set_of_change(self):
+        cert = x509.Certificate.load(_certificate())
+        rdn = cert['tbs_certificate']['subject'].chosen[0]
+        rdn.append({'type': 'common_name', 'value': x509.DirectoryString(name='utf8_string', value='Added')})
+        self.assertIn(b'Added', cert.dump())
+        self.assertFalse(rdn._is_mutated())
+        self.assertFalse(cert._is_mutated())
+
+    def _timestamp(self, cls, value):
+        # Loading from the encoding bypasses any cached native value
+        return cls.load(cls(value).dump()).timestamp
+
+    def test_timestamp(self):
+        self.assertEqual(1577836800, self._timestamp(core.UTCTime, '200101000000Z'))
+        self.assertEqual(1577836800, self._timestamp(core.UTCTime, '2001010000Z'))
+        self.assertEqual(946684800, self._timestamp(core.UTCTime, '000101000000Z'))
+        self.assertEqual(631152000, self._timestamp(core.UTCTime, '900101000000Z'))
+        self.assertEqual(1577836800, self._timestamp(core.GeneralizedTime, '20200101000000Z'))
+        self.assertEqual(1577836800, self._timestamp(core.GeneralizedTime, '2020010100Z'))
+        self.assertEqual(-62167219200, self._timestamp(core.GeneralizedTime, '00000101000000Z'))
+        self.assertIsNone(core.GeneralizedTime().timestamp)
+
+    def test_timestamp_fraction(self):
+        for fraction in ('1', '12', '123', '1234', '12345', '123456'):
+            value = '20200101000059.%sZ' % fraction
+            self.assertEqual(1577836859, self._timestamp(core.GeneralizedTime, value))
+            native = core.GeneralizedTime.load(core.GeneralizedTime(value).dump()).native
+            self.assertEqual(int(fraction.ljust(6, '0')), native.microsecond)
+
+    def test_timestamp_matches_native(self):
+        epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+        for value in ('19991231235959Z', '20200229120000.5+0100', '20380119031408-0200'):
+            time = core.GeneralizedTime.load(core.GeneralizedTime(value).dump())
+            delta = time.native - epoch
+            self.assertEqual(delta.days * 86400 + delta.seconds, time.timestamp)
+
+    def test_timestamp_unsupported(self):
+        with self.assertRaises(ValueError):
+            self._timestamp(core.GeneralizedTime, '20200101000000.1234567Z')
+
+    def test_ber_preserved_around_edit(self):
+        encoded = b'\x30\x80' + b''.join(_BER_FIELDS) + b'\x00\x00'
+        original_native = _BerOuter.load(encoded).native
+        self.assertEqual(b'abc', original_native['octets'])
+
+        edits = [
+            ('octets', b'changed'),
+            ('number', 7),
+            ('inner', {'flag': True, 'name': 'changed'}),
+            ('text', 'changed'),
+        ]
+        for index, (field, new_value) in enumerate(edits):
+            value = _BerOuter.load(encoded)
+            value[field] = new_value
+            output = value.dump()
+            for other_index, original in enumerate(_BER_FIELDS):
+                if other_index != index:
+                    self.assertIn(original, output)
+
+            expected = dict(original_native, **{field: new_value})
+            self.assertEqual(expected, dict(_BerOuter.load(output).native))
+
+    def test_ber_preserved_around_nested_edit(self):
+        encoded = b'\x30\x80' + b''.join(_BER_FIELDS) + b'\x00\x00'
+        value = _BerOuter.load(encoded)
+        value['inner']['name'] = 'changed'
+        output = value.dump()
+        for original in _BER_FIELDS[0:2] + _BER_FIELDS[3:]:
+            self.assertIn(original, output)
+        # The untouched sibling within the edited child keeps its encoding
+        self.assertIn(b'\x01\x01\x01', output)
+        self.assertEqual('changed', _BerOuter.load(output)['inner']['name'].native)
@@ -0,0 +1,152 @@
+# coding: utf-8
+from __future__ import unicode_literals, division, absolute_import, print_function
+
+import random
+import sys
+import unittest
+
+from asn1crypto import core, parser, util
+
+try:
+    import _asn1crypto_speedups as speedups
+except (ImportError):
+    speedups = None
+
+
+def _outcome(func, *args, **kwargs):
+    """
+    Runs a function, converting any exception into its type so outcomes from
+    the compiled and pure-Python implementations can be compared
+
+    :return:
+        A 2-element tuple of ('ok', return value) or ('error', exception class)
+    """
+
+    try:
+        return ('ok', func(*args, **kwargs))
+    except (Exception) as e:
+        return ('error', e.__class__)
+
+
+def _valid_corpus():
+    """
+    :return:
+        A list of byte strings, each a complete BER or DER encoded value
+    """
+
+    class Inner(core.Sequence):
+        _fields = [
+            ('flag', core.Boolean),
+            ('text', core.UTF8String),
+        ]
+
+    class Outer(core.Sequence):
+        _fields = [
+            ('id', core.ObjectIdentifier),
+            ('num', core.Integer),
+            ('inner', Inner),
+            ('blob', core.OctetString),
+            ('bits', core.BitString),
+            ('tagged', core.Integer, {'tag_type': 'explicit', 'tag': 5}),
+        ]
+
+    outer = Outer({
+        'id': '1.2.840.113549.1.1.11',
+        'num': -(2 ** 70),
+        'inner': {'flag': True, 'text': 'café'},
+        'blob': b'\x00' * 300,
+        'bits': (1, 0, 1, 1, 0, 0, 1),
+        'tagged': 12,
+    })
+
+    return [
+        b'\x05\x00',
+        b'\x02\x01\x00',
+        core.Integer(2 ** 200).dump(),
+        core.ObjectIdentifier('2.999.3').dump(),
+        core.OctetString(b'x' * 70000).dump(),
+        core.Null().dump(),
+        # High tag number and long-form length
+        b'\x9f\x81\x00\x81\x03abc',
+        # Indefinite length constructed values, including nested ones
+        b'\x24\x80\x04\x02ab\x04\x01c\x00\x00',
+        b'\x30\x80\x30\x80\x02\x01\x01\x00\x00\x00\x00',
+        outer.dump(),
+    ]
+
+
+def _mutations(data, rand):
+    """
+    :return:
+        A list of byte strings derived from data by truncating and corrupting it
+    """
+
+    output = [data[:i] for i in range(len(data))]
+    for _ in range(20):
+        mutated = bytearray(data)
+        for _ in range(rand.randint(1, 3)):
+            mutated[rand.randrange(len(mutated))] = rand.randrange(256)
+        output.append(bytes(mutated))
+    return output
+
+
+@unittest.skipIf(speedups is None, '_asn1crypto_speedups is not installed')
+class SpeedupsTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rand = random.Random(20261019)
+        cls.corpus = []
+        for data in _valid_corpus():
+            cls.corpus.append(data)
+            cls.corpus.extend(_mutations(data, rand))
+        for _ in range(500):
+            length = rand.randint(0, 40)
+            cls.corpus.append(bytes(bytearray(rand.randrange(256) for _ in range(length))))
+
+    def test_parse(self):
+        for data in self.corpus:
+            for lengths_only in (False, True):
+                for pointer in (0, 1):
+                    self.assertEqual(
+                        _outcome(parser._py_parse, data, len(data), pointer, lengths_only),
+                        _outcome(speedups.parse, data, len(data), pointer, lengths_only),
+                        (data, pointer, lengths_only)
+                    )
+
+    def test_parse_short_data_len(self):
+        for data in _valid_corpus():
+            data_len = len(data) - 1
+            self.assertEqual(
+                _outcome(parser._py_parse, data, data_len),
+                _outcome(speedups.parse, data, data_len),
+                data
+            )
+
+    def test_parse_installed(self):
+        self.assertIs(speedups.parse, parser._parse)
+
+    def test_oid_dotted(self):
+        oids = [
+            core.ObjectIdentifier(dotted).contents
+            for dotted in ('0.0', '1.2', '2.5.4.3', '1.2.840.113549.1.1.11', '2.999.3', '1.3.6.1.4.1.%d' % 2 ** 64)
+        ]
+        # Long inputs only form one huge subidentifier, which is slow to format
+        for contents in oids + [data for data in self.corpus if len(data) < 1024]:
+            self.assertEqual(
+                _outcome(core._py_oid_dotted, contents),
+                _outcome(speedups.oid_dotted, contents),
+                contents
+            )
+
+    @unittest.skipIf(sys.version_info < (3,), 'int_from_bytes() is only replaced on Python 3')
+    def test_int_from_bytes(self):
+        for data in self.corpus:
+            if len(data) >= 1024:
+                continue
+            for signed in (False, True):
+                self.assertEqual(
+                    _outcome(util._py_int_from_bytes, data, signed=signed),
+                    _outcome(speedups.int_from_bytes, data, signed=signed),
+                    (data, signed)
+                )
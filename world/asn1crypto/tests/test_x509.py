@@ -0,0 +1,51 @@
+# coding: utf-8
+from __future__ import unicode_literals, division, absolute_import, print_function
+
+import os
+import subprocess
+import sys
+import unittest
+
+from asn1crypto import _x400, x509
+
+from .test_core import _certificate
+
+
+class TrustedCertificateStoreTests(unittest.TestCase):
+
+    def test_aux_with_empty_trust_and_reject(self):
+        cert = _certificate()
+        aux = x509.CertificateAux({'trust': [], 'reject': ['server_auth']})
+        store = x509.TrustedCertificateStore(cert + aux.dump() + cert)
+        self.assertEqual(2, len(store))
+        self.assertIs(False, store.trust(0, 'server_auth'))
+        self.assertIsNone(store.trust(1, 'server_auth'))
+        self.assertEqual(cert, store.certificate(1).dump())
+
+    def test_consecutive_certificates(self):
+        cert = _certificate()
+        store = x509.TrustedCertificateStore(cert + cert + cert)
+        self.assertEqual(3, len(store))
+
+    def test_truncated_entry(self):
+        cert = _certificate()
+        with self.assertRaises(ValueError):
+            x509.TrustedCertificateStore(b'\x30\x05\x00')
+        with self.assertRaises(ValueError):
+            x509.TrustedCertificateStore(cert + cert[:-1])
+
+
+class X400Tests(unittest.TestCase):
+
+    def test_import_is_lazy(self):
+        code = 'import sys, asn1crypto.x509; print("asn1crypto._x400" in sys.modules)'
+        env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        output = subprocess.check_output([sys.executable, '-c', code], env=env)
+        self.assertEqual(b'False', output.strip())
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'module __getattr__() requires Python 3.7')
+    def test_reexported(self):
+        self.assertIs(_x400.ORAddress, x509.ORAddress)
+        self.assertIs(_x400.CountryName, x509.CountryName)
+        with self.assertRaises(AttributeError):
+            x509.NotAClass
@@ -0,0 +1,372 @@
+# This file is dual licensed under the terms of the Apache License, Version
+# 2.0, and the BSD License. See the LICENSE file in the root of this repository
+# for complete details.
+
+from __future__ import absolute_import, division, print_function
+
+import collections
+import hashlib
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import six
+
+from asn1crypto import pkcs12 as asn1_pkcs12
+from asn1crypto.keys import PrivateKeyInfo
+
+from cryptography import utils
+from cryptography.exceptions import UnsupportedAlgorithm, _Reasons
+from cryptography.hazmat.primitives import constant_time, hashes, hmac
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.padding import PKCS7
+from cryptography.hazmat.primitives.serialization import load_der_private_key
+from cryptography.x509 import load_der_x509_certificate
+
+
+PKCS12Item = collections.namedtuple(
+    "PKCS12Item", ["type", "value", "friendly_name", "local_key_id"]
+)
+
+_HASHES = {
+    "md5": hashes.MD5,
+    "sha1": hashes.SHA1,
+    "sha224": hashes.SHA224,
+    "sha256": hashes.SHA256,
+    "sha384": hashes.SHA384,
+    "sha512": hashes.SHA512,
+}
+
+# Purpose identifiers for the PKCS#12 KDF, RFC 7292 appendix B.3
+_KDF_KEY = 1
+_KDF_IV = 2
+_KDF_MAC = 3
+
+
+def _pkcs12_kdf(hash_name, password, salt, iterations, length, purpose):
+    # RFC 7292 appendix B.2, with the password already BMPString encoded
+    u = hashlib.new(hash_name).digest_size
+    v = 128 if hash_name in ("sha384", "sha512") else 64
+
+    def _fill(data):
+        if not data:
+            return b""
+        count = -(-len(data) // v) * v
+        return (data * (count // len(data) + 1))[:count]
+
+    d = six.int2byte(purpose) * v
+    i = _fill(salt) + _fill(password)
+    output = b""
+    while len(output) < length:
+        a = hashlib.new(hash_name, d + i).digest()
+        for _ in range(iterations - 1):
+            a = hashlib.new(hash_name, a).digest()
+        output += a
+
+        b = utils.int_from_bytes((a * (v // u + 1))[:v], "big") + 1
+        blocks = []
+        for j in range(0, len(i), v):
+            block = utils.int_from_bytes(i[j:j + v], "big") + b
+            blocks.append(utils.int_to_bytes(block % (1 << (v * 8)), v))
+        i = b"".join(blocks)
+
+    return output[:length]
+
+
+def _pbkdf1(hash_name, password, salt, iterations, length):
+    t = hashlib.new(hash_name, password + salt).digest()
+    for _ in range(iterations - 1):
+        t = hashlib.new(hash_name, t).digest()
+    return t[:length]
+
+
+def _completed(value):
+    future = Future()
+    future.set_result(value)
+    return future
+
+
+class PKCS12Reader(object):
+    """
+    Reads certificates and private keys from a PKCS#12 file.
+
+    Bags are decrypted concurrently in a thread pool, since the OpenSSL
+    cipher and PBKDF2 calls release the GIL. The legacy PKCS#12 KDF and
+    PBKDF1 are pure Python loops that hold the GIL, so a pool would not
+    speed them up and they are computed in the calling thread instead. Each
+    distinct key or IV derivation, identified by its algorithm, salt and
+    iteration count, is computed only once.
+
+    Bags encrypted with AES, 3DES, DES or RC4 are supported. RC2, which
+    OpenSSL 1.x uses by default to encrypt the certificates, is not
+    available in this version of cryptography. Such files raise
+    UnsupportedAlgorithm when iterated; OpenSSL can re-export them with
+    ``-certpbe PBE-SHA1-3DES`` or ``-certpbe AES-256-CBC``.
+    """
+
+    def __init__(self, data, password, backend, max_workers=None):
+        if password is not None and not isinstance(password, bytes):
+            raise TypeError("password must be bytes or None.")
+
+        self._pfx = asn1_pkcs12.Pfx.load(data)
+        self._password = password or b""
+        self._bmp_password = b""
+        if self._password:
+            self._bmp_password = (
+                self._password.decode("utf-8").encode("utf-16-be") +
+                b"\x00\x00"
+            )
+        self._backend = backend
+        self._max_workers = max_workers or 4
+        self._derivations = {}
+        self._lock = threading.Lock()
+        self._verify_mac()
+
+    def _verify_mac(self):
+        mac_data = self._pfx["mac_data"]
+        if not mac_data:
+            return
+
+        hash_name = mac_data["mac"]["digest_algorithm"]["algorithm"].native
+        if hash_name not in _HASHES:
+            raise UnsupportedAlgorithm(
+                "{0} is not supported for the PKCS12 MAC.".format(hash_name),
+                _Reasons.UNSUPPORTED_HASH
+            )
+        algorithm = _HASHES[hash_name]()
+        content = self._pfx["auth_safe"]["content"].native
+
+        # Like OpenSSL, an empty password is tried both as an empty string
+        # and as no password at all, which differ once BMPString encoded
+        candidates = [self._bmp_password]
+        if not self._password:
+            candidates.append(b"\x00\x00")
+
+        for bmp_password in candidates:
+            key = _pkcs12_kdf(
+                hash_name,
+                bmp_password,
+                mac_data["mac_salt"].native,
+                mac_data["iterations"].native,
+                algorithm.digest_size,
+                _KDF_MAC
+            )
+            h = hmac.HMAC(key, algorithm, self._backend)
+            h.update(content)
+            if constant_time.bytes_eq(
+                h.finalize(), mac_data["mac"]["digest"].native
+            ):
+                self._bmp_password = bmp_password
+                return
+
+        raise ValueError("Invalid password or PKCS12 data")
+
+    def _derive(self, executor, params):
+        with self._lock:
+            future = self._derivations.get(params)
+            if future is not None:
+                return future
+            if params[0] not in ("pkcs12_kdf", "pbkdf1"):
+                future = executor.submit(self._run_derivation, params)
+                self._derivations[params] = future
+                return future
+
+        # The pure Python derivations are run without holding the lock
+        future = _completed(self._run_derivation(params))
+        with self._lock:
+            return self._derivations.setdefault(params, future)
+
+    def _run_derivation(self, params):
+        kdf, hash_name, salt, iterations, length, purpose = params
+        if kdf == "pkcs12_kdf":
+            return _pkcs12_kdf(
+                hash_name, self._bmp_password, salt, iterations, length,
+                purpose
+            )
+        if kdf == "pbkdf1":
+            return _pbkdf1(
+                hash_name, self._password, salt, iterations, length
+            )
+        if hash_name not in _HASHES:
+            raise UnsupportedAlgorithm(
+                "{0} is not supported for PBKDF2.".format(hash_name),
+                _Reasons.UNSUPPORTED_HASH
+            )
+        return PBKDF2HMAC(
+            _HASHES[hash_name](), length, salt, iterations, self._backend
+        ).derive(self._password)
+
+    def _submit_decrypt(self, executor, encryption_algorithm, ciphertext):
+        kdf = encryption_algorithm.kdf
+        hash_name = encryption_algorithm.kdf_hmac
+        salt = encryption_algorithm.kdf_salt
+        iterations = encryption_algorithm.kdf_iterations
+        key_length = encryption_algorithm.key_length
+        cipher_name = encryption_algorithm.encryption_cipher
+        block_size = encryption_algorithm.encryption_block_size
+
+        if cipher_name not in ("aes", "tripledes", "des", "rc4"):
+            raise UnsupportedAlgorithm(
+                "{0} is not supported for PKCS12 decryption.".format(
+                    cipher_name
+                ),
+                _Reasons.UNSUPPORTED_CIPHER
+            )
+        if encryption_algorithm.encryption_mode != "cbc":
+            raise UnsupportedAlgorithm(
+                "Only CBC mode is supported for PKCS12 decryption.",
+                _Reasons.UNSUPPORTED_CIPHER
+            )
+
+        if kdf == "pkcs12_kdf":
+            key = self._derive(
+                executor,
+                (kdf, hash_name, salt, iterations, key_length, _KDF_KEY)
+            )
+            iv = None
+            if block_size:
+                iv = self._derive(
+                    executor,
+                    (kdf, hash_name, salt, iterations, block_size, _KDF_IV)
+                )
+        elif kdf == "pbkdf1":
+            # The key and IV come from a single 16 byte derivation
+            key = iv = self._derive(
+                executor, (kdf, hash_name, salt, iterations, 16, None)
+            )
+        else:
+            key = self._derive(
+                executor,
+                (kdf, hash_name, salt, iterations, key_length, None)
+            )
+            iv = _completed(encryption_algorithm.encryption_iv)
+
+        return executor.submit(
+            self._decrypt, cipher_name, block_size, key, iv, kdf, ciphertext
+        )
+
+    def _decrypt(self, cipher_name, block_size, key, iv, kdf, ciphertext):
+        # Derivations are always computed or submitted before the
+        # decryption that waits on them, so they have been picked up already
+        key = key.result()
+        if kdf == "pbkdf1":
+            key, iv = key[:8], key[8:16]
+        elif iv is not None:
+            iv = iv.result()
+
+        if cipher_name == "rc4":
+            decryptor = Cipher(
+                algorithms.ARC4(key), None, self._backend
+            ).decryptor()
+            return decryptor.update(ciphertext) + decryptor.finalize()
+
+        if cipher_name == "aes":
+            algorithm = algorithms.AES(key)
+        else:
+            algorithm = algorithms.TripleDES(key)
+        decryptor = Cipher(algorithm, modes.CBC(iv), self._backend).decryptor()
+        padded = decryptor.update(ciphertext) + decryptor.finalize()
+        unpadder = PKCS7(block_size * 8).unpadder()
+        return unpadder.update(padded) + unpadder.finalize()
+
+    def _collect_bags(self, executor, safe_contents, entries):
+        for bag in safe_contents:
+            bag_id = bag["bag_id"].native
+            bag_value = bag["bag_value"]
+
+            friendly_name = None
+            local_key_id = None
+            for attribute in bag["bag_attributes"]:
+                attribute_type = attribute["type"].native
+                if attribute_type == "friendly_name":
+                    friendly_name = attribute["values"][0].native
+                elif attribute_type == "local_key_id":
+                    local_key_id = attribute["values"][0].native
+
+            if bag_id == "safe_contents":
+                self._collect_bags(executor, bag_value, entries)
+            elif bag_id == "cert_bag":
+                if bag_value["cert_id"].native != "x509":
+                    continue
+                entries.append((
+                    "certificate",
+                    _completed(bag_value["cert_value"].parsed.dump()),
+                    friendly_name,
+                    local_key_id
+                ))
+            elif bag_id == "key_bag":
+                entries.append((
+                    "private_key",
+                    _completed(bag_value.untag().dump()),
+                    friendly_name,
+                    local_key_id
+                ))
+            elif bag_id == "pkcs8_shrouded_key_bag":
+                entries.append((
+                    "private_key",
+                    self._submit_decrypt(
+                        executor,
+                        bag_value["encryption_algorithm"],
+                        bag_value["encrypted_data"].native
+                    ),
+                    friendly_name,
+                    local_key_id
+                ))
+
+    def _load(self, item_type, data):
+        if item_type == "certificate":
+            return load_der_x509_certificate(data, self._backend)
+        # Normalize to DER that OpenSSL will parse, dropping any BER encoding
+        der = PrivateKeyInfo.load(data).dump(force=True)
+        return load_der_private_key(der, None, self._backend)
+
+    def __iter__(self):
+        with ThreadPoolExecutor(self._max_workers) as executor:
+            safes = []
+            for content_info in self._pfx.authenticated_safe:
+                content_type = content_info["content_type"].native
+                if content_type == "data":
+                    safes.append(_completed(content_info["content"].native))
+                elif content_type == "encrypted_data":
+                    encrypted_content_info = (
+                        content_info["content"]["encrypted_content_info"]
+                    )
+                    safes.append(self._submit_decrypt(
+                        executor,
+                        encrypted_content_info["content_encryption_algorithm"],
+                        encrypted_content_info["encrypted_content"].native
+                    ))
+                else:
+                    raise ValueError(
+                        "Unsupported PKCS12 safe content type: {0}".format(
+                            content_type
+                        )
+                    )
+
+            # Every key bag decryption is scheduled before the first item is
+            # produced, so they all run while the caller consumes results
+            entries = []
+            for safe in safes:
+                self._collect_bags(
+                    executor,
+                    asn1_pkcs12.SafeContents.load(safe.result()),
+                    entries
+                )
+
+            for item_type, future, friendly_name, local_key_id in entries:
+                yield PKCS12Item(
+                    item_type,
+                    self._load(item_type, future.result()),
+                    friendly_name,
+                    local_key_id
+                )
+
+    def certificates(self):
+        for item in self:
+            if item.type == "certificate":
+                yield item.value
+
+    def private_keys(self):
+        for item in self:
+            if item.type == "private_key":
+                yield item.value
@@ -0,0 +1,73 @@
+# This file is dual licensed under the terms of the Apache License, Version
+# 2.0, and the BSD License. See the LICENSE file in the root of this repository
+# for complete details.
+
+from __future__ import absolute_import, division, print_function
+
+import os
+import unittest
+
+try:
+    from cryptography.exceptions import UnsupportedAlgorithm
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives.pkcs12 import PKCS12Reader
+    from cryptography.x509.oid import NameOID
+except ImportError:
+    PKCS12Reader = None
+
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures", "pkcs12")
+PASSWORD = b"cryptography"
+
+
+def _load_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), "rb") as f:
+        return f.read()
+
+
+@unittest.skipIf(
+    PKCS12Reader is None, "the cryptography native modules are not built"
+)
+class PKCS12ReaderTests(unittest.TestCase):
+    def _check_items(self, name):
+        reader = PKCS12Reader(
+            _load_fixture(name), PASSWORD, default_backend(), max_workers=2
+        )
+        items = list(reader)
+        self.assertEqual(
+            ["certificate", "private_key"], [item.type for item in items]
+        )
+        certificate, private_key = items[0].value, items[1].value
+
+        self.assertEqual(4660, certificate.serial_number)
+        self.assertEqual(
+            u"pkcs12 test",
+            certificate.subject.get_attributes_for_oid(
+                NameOID.COMMON_NAME
+            )[0].value
+        )
+        self.assertEqual(
+            certificate.public_key().public_numbers(),
+            private_key.public_key().public_numbers()
+        )
+        for item in items:
+            self.assertEqual(u"test", item.friendly_name)
+        self.assertEqual(items[0].local_key_id, items[1].local_key_id)
+
+    def test_pbes2_aes(self):
+        self._check_items("pbes2-aes256.p12")
+
+    def test_pkcs12_kdf_3des(self):
+        self._check_items("pbe-sha1-3des.p12")
+
+    def test_wrong_password(self):
+        for name in ("pbes2-aes256.p12", "pbe-sha1-3des.p12"):
+            with self.assertRaises(ValueError):
+                PKCS12Reader(_load_fixture(name), b"wrong", default_backend())
+
+    def test_rc2_unsupported(self):
+        reader = PKCS12Reader(
+            _load_fixture("pbe-sha1-rc2.p12"), PASSWORD, default_backend()
+        )
+        with self.assertRaises(UnsupportedAlgorithm):
+            list(reader)
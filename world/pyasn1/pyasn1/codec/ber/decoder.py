@@ -4,13 +4,34 @@
 # Copyright (c) 2005-2017, Ilya Etingof <etingof@gmail.com>
 # License: http://pyasn1.sf.net/license.html
 #
+try:
+    from collections import OrderedDict
+
+except ImportError:
+    OrderedDict = dict
+
 from pyasn1.type import base, tag, univ, char, useful, tagmap
 from pyasn1.codec.ber import eoo
 from pyasn1.compat.octets import oct2int, octs2ints, isOctetsType
 from pyasn1.compat.integer import from_bytes
 from pyasn1 import debug, error
 
-__all__ = ['decode']
+__all__ = ['decode', 'decodeMany', 'decodeNative', 'StreamDecoder']
+
+LOG = debug.registerLoggee(__name__, flags=debug.flagDecoder)
+
+
+def toOctets(substrate):
+    """Return substrate as octets.
+
+    The decoder consumes its input through :py:class:`memoryview` slices, so
+    that advancing past a TLV does not copy the rest of the substrate. Value
+    decoders call this function on the part of the substrate a value is
+    actually built from.
+    """
+    if isinstance(substrate, memoryview):
+        return substrate.tobytes()
+    return substrate
 
 
 class AbstractDecoder(object):
@@ -24,6 +45,22 @@ class AbstractDecoder(object):
                              length, state, decodeFun, substrateFun):
         raise error.PyAsn1Error('Indefinite length mode decoder not implemented for %s' % (tagSet,))
 
+    def nativeValueDecoder(self, fullSubstrate, substrate, asn1Spec, tagSet,
+                           length, decodeFun, nativeFun):
+        # Builds pyasn1 object, then hands it over to native encoder;
+        # value decoders override this to produce Python objects directly
+        if length == -1:
+            value, substrate = self.indefLenValueDecoder(
+                fullSubstrate, substrate, asn1Spec, tagSet, length,
+                stGetValueDecoder, decodeFun, None
+            )
+        else:
+            value, substrate = self.valueDecoder(
+                fullSubstrate, substrate, asn1Spec, tagSet, length,
+                stGetValueDecoder, decodeFun, None
+            )
+        return nativeFun(value), substrate
+
 
 class AbstractSimpleDecoder(AbstractDecoder):
     tagFormats = (tag.tagFormatSimple,)
@@ -41,6 +78,107 @@ class AbstractSimpleDecoder(AbstractDecoder):
 
 class AbstractConstructedDecoder(AbstractDecoder):
     tagFormats = (tag.tagFormatConstructed,)
+    maxComponentTables = 256
+
+    def __init__(self):
+        self.__componentTables = {}
+
+    def _compileComponentTable(self, asn1Spec, decodeFun):
+        raise error.PyAsn1Error('Not implemented')
+
+    def _compileComponentEntries(self, candidates, decodeFun):
+        # Maps the leading tag octet of a component TLV to everything the
+        # decoder would otherwise work out through TagMap lookups for it:
+        # (position, spec, tagSet, value decoder)
+        entries = {}
+        for pos, asn1Spec in candidates:
+            tagMap = asn1Spec.getTagMap()
+            for tagSet in tagMap and tagMap.getPosMap() or ():
+                if len(tagSet) != 1:
+                    continue
+                tagClass, tagFormat, tagId = tagSet[0]
+                if tagId >= 31:
+                    continue  # long tags are not looked up by octet
+                for tagFormat in (tag.tagFormatSimple, tag.tagFormatConstructed):
+                    octet = tagClass | tagFormat | tagId
+                    if octet in entries:
+                        entries[octet] = None  # ambiguous, leave to the decoder
+                    else:
+                        entries[octet] = pos, asn1Spec, tag.TagSet(
+                            (), tag.Tag(tagClass, tagFormat, tagId)
+                        )
+        for octet, entry in list(entries.items()):
+            if entry is None:
+                continue
+            pos, asn1Spec, tagSet = entry
+            concreteDecoder = decodeFun.getSpecDecoder(asn1Spec)
+            if (len(asn1Spec.getTagSet()) != 1 or
+                    tagSet != asn1Spec.getTagSet() or concreteDecoder is None):
+                entries[octet] = None
+            else:
+                entries[octet] = pos, asn1Spec, tagSet, concreteDecoder
+        return entries
+
+    def _getComponentTable(self, asn1Spec, decodeFun):
+        # Component lookup table compiled once per component spec & codec
+        if asn1Spec is None or not isinstance(decodeFun, Decoder) or LOG:
+            return
+        key = id(asn1Spec), id(decodeFun)
+        if key in self.__componentTables:
+            return self.__componentTables[key][2]
+        if len(self.__componentTables) >= self.maxComponentTables:
+            self.__componentTables.clear()
+        table = self._compileComponentTable(asn1Spec, decodeFun)
+        # References are held to keep the ids in the key from being reused
+        self.__componentTables[key] = asn1Spec, decodeFun, table
+        return table
+
+    def _decodeComponent(self, substrate, entry, decodeFun, nativeFun=None):
+        # Same as decodeFun(substrate, asn1Spec) with TLV type known upfront,
+        # or its native encoding if nativeFun is given
+        pos, asn1Spec, tagSet, concreteDecoder = entry
+        if len(substrate) < 2:
+            raise error.SubstrateUnderrunError(
+                'Short octet stream on length decoding'
+            )
+        firstOctet = oct2int(substrate[1])
+        if firstOctet == 128:
+            size = 2
+            length = -1
+        elif firstOctet < 128:
+            length, size = firstOctet, 2
+        else:
+            size = firstOctet & 0x7F
+            lengthString = substrate[2:size + 2]
+            if len(lengthString) != size:
+                raise error.SubstrateUnderrunError(
+                    '%s<%s at %s' % (size, len(lengthString), tagSet)
+                )
+            length = 0
+            for lengthOctet in lengthString:
+                length = (length << 8) | oct2int(lengthOctet)
+            size += 2
+        fullSubstrate, substrate = substrate, substrate[size:]
+        if length == -1 and not decodeFun.supportIndefLength:
+            raise error.PyAsn1Error('Indefinite length encoding not supported by this codec')
+        if length != -1 and len(substrate) < length:
+            raise error.SubstrateUnderrunError(
+                '%d-octet short' % (length - len(substrate))
+            )
+        if nativeFun is not None:
+            return concreteDecoder.nativeValueDecoder(
+                fullSubstrate, substrate, asn1Spec, tagSet, length,
+                decodeFun, nativeFun
+            )
+        if length == -1:
+            return concreteDecoder.indefLenValueDecoder(
+                fullSubstrate, substrate, asn1Spec, tagSet, length,
+                stGetValueDecoder, decodeFun, None
+            )
+        return concreteDecoder.valueDecoder(
+            fullSubstrate, substrate, asn1Spec, tagSet, length,
+            stGetValueDecoder, decodeFun, None
+        )
 
     # noinspection PyUnusedLocal
     def _createComponent(self, asn1Spec, tagSet, value=None):
@@ -96,10 +234,25 @@ class IntegerDecoder(AbstractSimpleDecoder):
         if not head:
             return self._createComponent(asn1Spec, tagSet, 0), tail
 
-        value = from_bytes(head, signed=True)
+        value = from_bytes(toOctets(head), signed=True)
 
         return self._createComponent(asn1Spec, tagSet, value), tail
 
+    def nativeValueDecoder(self, fullSubstrate, substrate, asn1Spec, tagSet,
+                           length, decodeFun, nativeFun):
+        if length == -1 or tagSet[0][1] not in self.tagFormats:
+            return AbstractDecoder.nativeValueDecoder(
+                self, fullSubstrate, substrate, asn1Spec, tagSet, length,
+                decodeFun, nativeFun
+            )
+        head, tail = substrate[:length], substrate[length:]
+        value = self._nativeValue(head and from_bytes(toOctets(head), signed=True) or 0)
+        asn1Spec._verifySubtypeSpec(value)
+        return value, tail
+
+    def _nativeValue(self, value):
+        return int(value)
+
 
 class BooleanDecoder(IntegerDecoder):
     protoComponent = univ.Boolean(0)
@@ -107,6 +260,9 @@ class BooleanDecoder(IntegerDecoder):
     def _createComponent(self, asn1Spec, tagSet, value=None):
         return IntegerDecoder._createComponent(self, asn1Spec, tagSet, value and 1 or 0)
 
+    def _nativeValue(self, value):
+        return bool(value)
+
 
 class BitStringDecoder(AbstractSimpleDecoder):
     protoComponent = univ.BitString(())
@@ -124,7 +280,7 @@ class BitStringDecoder(AbstractSimpleDecoder):
                 raise error.PyAsn1Error(
                     'Trailing bits overflow %s' % trailingBits
                 )
-            head = head[1:]
+            head = toOctets(head[1:])
             value = self.protoComponent.fromOctetString(head, trailingBits)
             return self._createComponent(asn1Spec, tagSet, value), tail
 
@@ -166,12 +322,25 @@ class OctetStringDecoder(AbstractSimpleDecoder):
     protoComponent = univ.OctetString('')
     tagFormats = (tag.tagFormatSimple, tag.tagFormatConstructed)
     supportConstructedForm = True
+    # Tag sets of the character string types whose native value is text.
+    # nativeValueDecoder() checks the exact tag set of the spec, as the
+    # native encoder does when picking TextStringEncoder; other specs,
+    # including implicitly tagged character strings that the native
+    # encoder handles by their OCTET STRING base tag set, yield octets
+    nativeTextTagSets = frozenset(
+        [char.UTF8String.tagSet, char.NumericString.tagSet,
+         char.PrintableString.tagSet, char.TeletexString.tagSet,
+         char.VideotexString.tagSet, char.IA5String.tagSet,
+         char.GraphicString.tagSet, char.VisibleString.tagSet,
+         char.GeneralString.tagSet, char.UniversalString.tagSet,
+         char.BMPString.tagSet]
+    )
 
     def valueDecoder(self, fullSubstrate, substrate, asn1Spec, tagSet, length,
                      state, decodeFun, substrateFun):
         head, tail = substrate[:length], substrate[length:]
         if tagSet[0][1] == tag.tagFormatSimple:  # XXX what tag to check?
-            return self._createComponent(asn1Spec, tagSet, head), tail
+            return self._createComponent(asn1Spec, tagSet, toOctets(head)), tail
         if not self.supportConstructedForm:
             raise error.PyAsn1Error('Constructed encoding form prohibited at %s' % self.__class__.__name__)
         r = self._createComponent(asn1Spec, tagSet, '')
@@ -200,6 +369,20 @@ class OctetStringDecoder(AbstractSimpleDecoder):
             )
         return r, substrate
 
+    def nativeValueDecoder(self, fullSubstrate, substrate, asn1Spec, tagSet,
+                           length, decodeFun, nativeFun):
+        if length == -1 or tagSet[0][1] != tag.tagFormatSimple:
+            return AbstractDecoder.nativeValueDecoder(
+                self, fullSubstrate, substrate, asn1Spec, tagSet, length,
+                decodeFun, nativeFun
+            )
+        head, tail = toOctets(substrate[:length]), substrate[length:]
+        value = asn1Spec.prettyIn(head)
+        asn1Spec._verifySubtypeSpec(value)
+        if asn1Spec.getTagSet() in self.nativeTextTagSets:
+            return value, tail
+        return head, tail
+
 
 class NullDecoder(AbstractSimpleDecoder):
     protoComponent = univ.Null('')
@@ -212,6 +395,17 @@ class NullDecoder(AbstractSimpleDecoder):
             raise error.PyAsn1Error('Unexpected %d-octet substrate for Null' % length)
         return r, tail
 
+    def nativeValueDecoder(self, fullSubstrate, substrate, asn1Spec, tagSet,
+                           length, decodeFun, nativeFun):
+        if length == -1 or tagSet[0][1] not in self.tagFormats:
+            return AbstractDecoder.nativeValueDecoder(
+                self, fullSubstrate, substrate, asn1Spec, tagSet, length,
+                decodeFun, nativeFun
+            )
+        if length:
+            raise error.PyAsn1Error('Unexpected %d-octet substrate for Null' % length)
+        return None, substrate
+
 
 class ObjectIdentifierDecoder(AbstractSimpleDecoder):
     protoComponent = univ.ObjectIdentifier(())
@@ -219,6 +413,21 @@ class ObjectIdentifierDecoder(AbstractSimpleDecoder):
     def valueDecoder(self, fullSubstrate, substrate, asn1Spec, tagSet, length,
                      state, decodeFun, substrateFun):
         head, tail = substrate[:length], substrate[length:]
+        return self._createComponent(asn1Spec, tagSet, self._decodeArcs(head)), tail
+
+    def nativeValueDecoder(self, fullSubstrate, substrate, asn1Spec, tagSet,
+                           length, decodeFun, nativeFun):
+        if length == -1 or tagSet[0][1] not in self.tagFormats:
+            return AbstractDecoder.nativeValueDecoder(
+                self, fullSubstrate, substrate, asn1Spec, tagSet, length,
+                decodeFun, nativeFun
+            )
+        head, tail = substrate[:length], substrate[length:]
+        oid = self._decodeArcs(head)
+        asn1Spec._verifySubtypeSpec(oid)
+        return asn1Spec.prettyOut(oid), tail
+
+    def _decodeArcs(self, head):
         if not head:
             raise error.PyAsn1Error('Empty substrate')
 
@@ -262,7 +471,7 @@ class ObjectIdentifierDecoder(AbstractSimpleDecoder):
         else:
             raise error.PyAsn1Error('Malformed first OID octet: %s' % head[0])
 
-        return self._createComponent(asn1Spec, tagSet, oid), tail
+        return oid
 
 
 class RealDecoder(AbstractSimpleDecoder):
@@ -274,7 +483,7 @@ class RealDecoder(AbstractSimpleDecoder):
         if not head:
             return self._createComponent(asn1Spec, tagSet, 0.0), tail
         fo = oct2int(head[0])
-        head = head[1:]
+        head = toOctets(head[1:])
         if fo & 0x80:  # binary encoding
             if not head:
                 raise error.PyAsn1Error("Incomplete floating-point value")
@@ -336,6 +545,7 @@ class RealDecoder(AbstractSimpleDecoder):
 
 class SequenceDecoder(AbstractConstructedDecoder):
     protoComponent = univ.Sequence()
+    nativeDict = OrderedDict
 
     def _getComponentTagMap(self, r, idx):
         try:
@@ -346,6 +556,28 @@ class SequenceDecoder(AbstractConstructedDecoder):
     def _getComponentPositionByType(self, r, t, idx):
         return r.getComponentPositionNearType(t, idx)
 
+    def _getCandidatePositions(self, namedTypes, idx):
+        # Component positions a TLV met at position idx may belong to
+        positions = []
+        while idx < len(namedTypes):
+            positions.append(idx)
+            namedType = namedTypes[idx]
+            if not namedType.isOptional and not namedType.isDefaulted:
+                break
+            idx += 1
+        return positions
+
+    def _compileComponentTable(self, namedTypes, decodeFun):
+        # One set of entries per position, plus one past the last component
+        return [
+            self._compileComponentEntries(
+                [(pos, namedTypes.getTypeByPosition(pos))
+                 for pos in self._getCandidatePositions(namedTypes, idx)],
+                decodeFun
+            )
+            for idx in range(len(namedTypes) + 1)
+        ]
+
     def valueDecoder(self, fullSubstrate, substrate, asn1Spec, tagSet,
                      length, state, decodeFun, substrateFun):
         head, tail = substrate[:length], substrate[length:]
@@ -353,12 +585,18 @@ class SequenceDecoder(AbstractConstructedDecoder):
         idx = 0
         if substrateFun:
             return substrateFun(r, substrate, length)
+        table = self._getComponentTable(r.getComponentType(), decodeFun)
         while head:
-            asn1Spec = self._getComponentTagMap(r, idx)
-            component, head = decodeFun(head, asn1Spec)
-            idx = self._getComponentPositionByType(
-                r, component.getEffectiveTagSet(), idx
-            )
+            entry = table and idx < len(table) and table[idx].get(oct2int(head[0]))
+            if entry:
+                component, head = self._decodeComponent(head, entry, decodeFun)
+                idx = entry[0]
+            else:
+                asn1Spec = self._getComponentTagMap(r, idx)
+                component, head = decodeFun(head, asn1Spec)
+                idx = self._getComponentPositionByType(
+                    r, component.getEffectiveTagSet(), idx
+                )
             r.setComponentByPosition(idx, component,
                                      verifyConstraints=False,
                                      matchTags=False, matchConstraints=False)
@@ -372,16 +610,22 @@ class SequenceDecoder(AbstractConstructedDecoder):
         r = self._createComponent(asn1Spec, tagSet)
         if substrateFun:
             return substrateFun(r, substrate, length)
+        table = self._getComponentTable(r.getComponentType(), decodeFun)
         idx = 0
         while substrate:
-            asn1Spec = self._getComponentTagMap(r, idx)
-            component, substrate = decodeFun(substrate, asn1Spec, allowEoo=True)
-            if eoo.endOfOctets.isSameTypeWith(component) and \
-                    component == eoo.endOfOctets:
-                break
-            idx = self._getComponentPositionByType(
-                r, component.getEffectiveTagSet(), idx
-            )
+            entry = table and idx < len(table) and table[idx].get(oct2int(substrate[0]))
+            if entry:
+                component, substrate = self._decodeComponent(substrate, entry, decodeFun)
+                idx = entry[0]
+            else:
+                asn1Spec = self._getComponentTagMap(r, idx)
+                component, substrate = decodeFun(substrate, asn1Spec, allowEoo=True)
+                if eoo.endOfOctets.isSameTypeWith(component) and \
+                        component == eoo.endOfOctets:
+                    break
+                idx = self._getComponentPositionByType(
+                    r, component.getEffectiveTagSet(), idx
+                )
             r.setComponentByPosition(idx, component,
                                      verifyConstraints=False,
                                      matchTags=False, matchConstraints=False)
@@ -394,10 +638,55 @@ class SequenceDecoder(AbstractConstructedDecoder):
         r.verifySizeSpec()
         return r, substrate
 
+    def nativeValueDecoder(self, fullSubstrate, substrate, asn1Spec, tagSet,
+                           length, decodeFun, nativeFun):
+        namedTypes = asn1Spec.getComponentType()
+        table = self._getComponentTable(namedTypes, decodeFun)
+        if (table is None or not namedTypes or length == -1 or
+                tagSet[0][1] not in self.tagFormats or asn1Spec.getSizeSpec()):
+            return AbstractDecoder.nativeValueDecoder(
+                self, fullSubstrate, substrate, asn1Spec, tagSet, length,
+                decodeFun, nativeFun
+            )
+        head, tail = substrate[:length], substrate[length:]
+        components = {}
+        idx = 0
+        while head:
+            entry = idx < len(table) and table[idx].get(oct2int(head[0]))
+            if entry:
+                component, head = self._decodeComponent(head, entry, decodeFun, nativeFun)
+                idx = entry[0]
+            else:
+                component, head = decodeFun(head, self._getComponentTagMap(asn1Spec, idx))
+                idx = self._getComponentPositionByType(
+                    asn1Spec, component.getEffectiveTagSet(), idx
+                )
+                component = nativeFun(component)
+            components[idx] = component
+            idx += 1
+        value = self.nativeDict()
+        for idx in range(len(namedTypes)):
+            namedType = namedTypes[idx]
+            if idx in components:
+                value[namedType.getName()] = components[idx]
+            elif namedType.isDefaulted:
+                value[namedType.getName()] = nativeFun(namedType.getType().clone())
+            elif not namedType.isOptional:
+                # Rare error path: decode again into a pyasn1 object so the
+                # missing component is reported exactly as decode() does
+                return AbstractDecoder.nativeValueDecoder(
+                    self, fullSubstrate, substrate, asn1Spec, tagSet, length,
+                    decodeFun, nativeFun
+                )
+        return value, tail
+
 
 class SequenceOfDecoder(AbstractConstructedDecoder):
     protoComponent = univ.SequenceOf()
 
+    def _compileComponentTable(self, asn1Spec, decodeFun):
+        return self._compileComponentEntries([(None, asn1Spec)], decodeFun)
+
     def valueDecoder(self, fullSubstrate, substrate, asn1Spec, tagSet,
                      length, state, decodeFun, substrateFun):
         head, tail = substrate[:length], substrate[length:]
@@ -405,9 +694,14 @@ class SequenceOfDecoder(AbstractConstructedDecoder):
         if substrateFun:
             return substrateFun(r, substrate, length)
         asn1Spec = r.getComponentType()
+        table = self._getComponentTable(asn1Spec, decodeFun)
         idx = 0
         while head:
-            component, head = decodeFun(head, asn1Spec)
+            entry = table and table.get(oct2int(head[0]))
+            if entry:
+                component, head = self._decodeComponent(head, entry, decodeFun)
+            else:
+                component, head = decodeFun(head, asn1Spec)
             r.setComponentByPosition(idx, component,
                                      verifyConstraints=False,
                                      matchTags=False, matchConstraints=False)
@@ -421,12 +715,17 @@ class SequenceOfDecoder(AbstractConstructedDecoder):
         if substrateFun:
             return substrateFun(r, substrate, length)
         asn1Spec = r.getComponentType()
+        table = self._getComponentTable(asn1Spec, decodeFun)
         idx = 0
         while substrate:
-            component, substrate = decodeFun(substrate, asn1Spec, allowEoo=True)
-            if eoo.endOfOctets.isSameTypeWith(component) and \
-                    component == eoo.endOfOctets:
-                break
+            entry = table and table.get(oct2int(substrate[0]))
+            if entry:
+                component, substrate = self._decodeComponent(substrate, entry, decodeFun)
+            else:
+                component, substrate = decodeFun(substrate, asn1Spec, allowEoo=True)
+                if eoo.endOfOctets.isSameTypeWith(component) and \
+                        component == eoo.endOfOctets:
+                    break
             r.setComponentByPosition(idx, component,
                                      verifyConstraints=False,
                                      matchTags=False, matchConstraints=False)
@@ -438,9 +737,32 @@ class SequenceOfDecoder(AbstractConstructedDecoder):
         r.verifySizeSpec()
         return r, substrate
 
+    def nativeValueDecoder(self, fullSubstrate, substrate, asn1Spec, tagSet,
+                           length, decodeFun, nativeFun):
+        componentSpec = asn1Spec.getComponentType()
+        table = self._getComponentTable(componentSpec, decodeFun)
+        if table is None or length == -1 or tagSet[0][1] not in self.tagFormats:
+            return AbstractDecoder.nativeValueDecoder(
+                self, fullSubstrate, substrate, asn1Spec, tagSet, length,
+                decodeFun, nativeFun
+            )
+        head, tail = substrate[:length], substrate[length:]
+        value = []
+        while head:
+            entry = table.get(oct2int(head[0]))
+            if entry:
+                component, head = self._decodeComponent(head, entry, decodeFun, nativeFun)
+            else:
+                component, head = decodeFun(head, componentSpec)
+                component = nativeFun(component)
+            value.append(component)
+        asn1Spec.getSizeSpec()(value)
+        return value, tail
+
 
 class SetDecoder(SequenceDecoder):
     protoComponent = univ.Set()
+    nativeDict = dict
 
     def _getComponentTagMap(self, r, idx):
         return r.getComponentTagMap()
@@ -452,6 +774,9 @@ class SetDecoder(SequenceDecoder):
         else:
             return nextIdx
 
+    def _getCandidatePositions(self, namedTypes, idx):
+        return range(len(namedTypes))
+
 
 class SetOfDecoder(SequenceOfDecoder):
     protoComponent = univ.SetOf()
@@ -526,7 +851,7 @@ class AnyDecoder(AbstractSimpleDecoder):
             return substrateFun(self._createComponent(asn1Spec, tagSet),
                                 substrate, length)
         head, tail = substrate[:length], substrate[length:]
-        return self._createComponent(asn1Spec, tagSet, value=head), tail
+        return self._createComponent(asn1Spec, tagSet, value=toOctets(head)), tail
 
     def indefLenValueDecoder(self, fullSubstrate, substrate, asn1Spec, tagSet,
                              length, state, decodeFun, substrateFun):
@@ -535,7 +860,7 @@ class AnyDecoder(AbstractSimpleDecoder):
             header = ''
         else:
             # untagged Any, recover header substrate
-            header = fullSubstrate[:-len(substrate)]
+            header = toOctets(fullSubstrate[:-len(substrate)])
 
         r = self._createComponent(asn1Spec, tagSet, header)
 
@@ -665,6 +990,7 @@ class Decoder(object):
     #    defaultErrorState = stDumpRawValue
     defaultRawDecoder = AnyDecoder()
     supportIndefLength = True
+    maxTagCacheSize = 1024
 
     # noinspection PyDefaultArgument
     def __init__(self, tagMap, typeMap={}):
@@ -673,12 +999,101 @@ class Decoder(object):
         # Tag & TagSet objects caches
         self.__tagCache = {}
         self.__tagSetCache = {}
+        self.__taggedTagSetCache = {}
+        # Walks concatenated records the way SEQUENCE OF contents are
+        self.__recordDecoder = SequenceOfDecoder()
+
+    def getSpecDecoder(self, asn1Spec):
+        """Return value decoder for values of *asn1Spec* type or `None`."""
+        if asn1Spec.typeId is not None and asn1Spec.typeId in self.__typeMap:
+            return self.__typeMap[asn1Spec.typeId]
+        return self.__tagMap.get(asn1Spec.baseTagSet)
+
+    def __prepareRecords(self, substrate, asn1Spec):
+        if isinstance(substrate, univ.OctetString):
+            substrate = substrate.asOctets()
+        elif not isOctetsType(substrate) and not isinstance(substrate, memoryview):
+            raise error.PyAsn1Error('Bad octet stream type')
+        if asn1Spec is not None and not isinstance(asn1Spec, (base.Asn1Item, tagmap.TagMap)):
+            raise error.PyAsn1Error(
+                'asn1Spec is not valid (should be an instance of an ASN.1 Item, not %s)' % asn1Spec.__class__.__name__)
+        if isinstance(asn1Spec, base.Asn1Item):
+            table = self.__recordDecoder._getComponentTable(asn1Spec, self)
+        else:
+            table = None
+        return memoryview(substrate), table
+
+    def __decodeRecord(self, substrate, asn1Spec, table, nativeFun):
+        entry = table and substrate and table.get(oct2int(substrate[0]))
+        if entry:
+            return self.__recordDecoder._decodeComponent(
+                substrate, entry, self, nativeFun
+            )
+        value, substrate = self(substrate, asn1Spec)
+        if nativeFun is not None:
+            value = nativeFun(value)
+        return value, substrate
+
+    def decodeMany(self, substrate, asn1Spec=None, asNative=False):
+        substrate, table = self.__prepareRecords(substrate, asn1Spec)
+        if asNative:
+            from pyasn1.codec.native import encoder as nativeEncoder
+            nativeFun = nativeEncoder.encode
+        else:
+            nativeFun = None
+        while substrate:
+            value, substrate = self.__decodeRecord(
+                substrate, asn1Spec, table, nativeFun
+            )
+            yield value
+
+    def decodeNative(self, substrate, asn1Spec=None):
+        from pyasn1.codec.native import encoder as nativeEncoder
+        octetString = isinstance(substrate, univ.OctetString) and substrate or None
+        substrate, table = self.__prepareRecords(substrate, asn1Spec)
+        value, substrate = self.__decodeRecord(
+            substrate, asn1Spec, table, nativeEncoder.encode
+        )
+        substrate = toOctets(substrate)
+        if octetString is not None:
+            substrate = octetString.clone(substrate)
+        return value, substrate
 
     def __call__(self, substrate, asn1Spec=None, tagSet=None,
                  length=None, state=stDecodeTag, recursiveFlag=1,
                  substrateFun=None, allowEoo=False):
-        if debug.logger & debug.flagDecoder:
-            debug.logger('decoder called at scope %s with state %d, working with up to %d octets of substrate: %s' % (debug.scope, state, len(substrate), debug.hexdump(substrate)))
+        if not isinstance(substrate, memoryview):
+            octetString = None
+            if isinstance(substrate, univ.OctetString):
+                octetString = substrate
+                substrate = substrate.asOctets()
+            elif not isOctetsType(substrate):
+                if not substrate:
+                    raise error.SubstrateUnderrunError(
+                        'Short octet stream on tag decoding'
+                    )
+                raise error.PyAsn1Error('Bad octet stream type')
+
+            if substrateFun:
+                userSubstrateFun = substrateFun
+
+                def substrateFun(asn1Object, substrate, length):
+                    return userSubstrateFun(asn1Object, toOctets(substrate), length)
+
+            # Value decoders are handed memoryview slices, which are only
+            # copied into octets when a value is built, so each TLV costs
+            # the same regardless of how much substrate follows it
+            value, substrate = self(
+                memoryview(substrate), asn1Spec, tagSet, length, state,
+                recursiveFlag, substrateFun, allowEoo
+            )
+            substrate = toOctets(substrate)
+            if octetString is not None:
+                substrate = octetString.clone(substrate)
+            return value, substrate
+
+        if LOG:
+            LOG('decoder called at scope %s with state %d, working with up to %d octets of substrate' % (debug.scope, state, len(substrate)))
         if asn1Spec is not None and not isinstance(asn1Spec, (base.Asn1Item, tagmap.TagMap)):
             raise error.PyAsn1Error(
                 'asn1Spec is not valid (should be an instance of an ASN.1 Item, not %s)' % asn1Spec.__class__.__name__)
@@ -692,11 +1107,8 @@ class Decoder(object):
                     raise error.SubstrateUnderrunError(
                         'Short octet stream on tag decoding'
                     )
-                if not isOctetsType(substrate) and \
-                        not isinstance(substrate, univ.OctetString):
-                    raise error.PyAsn1Error('Bad octet stream type')
                 # Decode tag
-                firstOctet = substrate[0]
+                firstOctet = tagKey = substrate[0]
                 substrate = substrate[1:]
                 if firstOctet in self.__tagCache:
                     lastTag = self.__tagCache[firstOctet]
@@ -706,7 +1118,7 @@ class Decoder(object):
                     if t == 0:
                         if substrate and oct2int(substrate[0]) == 0:
                             if allowEoo and self.supportIndefLength:
-                                debug.logger and debug.logger & debug.flagDecoder and debug.logger(
+                                LOG and LOG(
                                     'end-of-octets sentinel found')
                                 value, substrate = eoo.endOfOctets, substrate[1:]
                                 state = stStop
@@ -718,38 +1130,60 @@ class Decoder(object):
                     tagClass = t & 0xC0
                     tagFormat = t & 0x20
                     tagId = t & 0x1F
-                    short = True
                     if tagId == 0x1F:
-                        short = False
-                        tagId = 0
+                        # long tags are cached by their raw octets
+                        size = 1
                         while True:
-                            if not substrate:
+                            if len(substrate) < size:
                                 raise error.SubstrateUnderrunError(
                                     'Short octet stream on long tag decoding'
                                 )
-                            t = oct2int(substrate[0])
-                            tagId = tagId << 7 | (t & 0x7F)
-                            substrate = substrate[1:]
-                            if not t & 0x80:
+                            if not oct2int(substrate[size - 1]) & 0x80:
                                 break
-                    lastTag = tag.Tag(
-                        tagClass=tagClass, tagFormat=tagFormat, tagId=tagId
-                    )
-                    if short:
-                        # cache short tags
+                            size += 1
+                        tagKey = toOctets(fullSubstrate[:size + 1])
+                        substrate = substrate[size:]
+                        if tagKey in self.__tagCache:
+                            lastTag = self.__tagCache[tagKey]
+                        else:
+                            tagId = 0
+                            for t in octs2ints(tagKey[1:]):
+                                tagId = tagId << 7 | (t & 0x7F)
+                            lastTag = tag.Tag(
+                                tagClass=tagClass, tagFormat=tagFormat, tagId=tagId
+                            )
+                            if len(self.__tagCache) >= self.maxTagCacheSize:
+                                self.__tagCache.clear()
+                            self.__tagCache[tagKey] = lastTag
+                    else:
+                        lastTag = tag.Tag(
+                            tagClass=tagClass, tagFormat=tagFormat, tagId=tagId
+                        )
                         self.__tagCache[firstOctet] = lastTag
                 if tagSet is None:
-                    if firstOctet in self.__tagSetCache:
-                        tagSet = self.__tagSetCache[firstOctet]
+                    if tagKey in self.__tagSetCache:
+                        tagSet = self.__tagSetCache[tagKey]
                     else:
                         # base tag not recovered
                         tagSet = tag.TagSet((), lastTag)
-                        if firstOctet in self.__tagCache:
-                            self.__tagSetCache[firstOctet] = tagSet
+                        if len(self.__tagSetCache) >= self.maxTagCacheSize:
+                            self.__tagSetCache.clear()
+                        self.__tagSetCache[tagKey] = tagSet
                 else:
-                    tagSet = lastTag + tagSet
+                    # TagSet equality disregards tag format, so outer tags
+                    # are told apart by identity; they come from these
+                    # caches for anything but the outermost tag anyway
+                    key = tagKey, id(tagSet)
+                    if key in self.__taggedTagSetCache and \
+                            self.__taggedTagSetCache[key][0] is tagSet:
+                        tagSet = self.__taggedTagSetCache[key][1]
+                    else:
+                        if len(self.__taggedTagSetCache) >= self.maxTagCacheSize:
+                            self.__taggedTagSetCache.clear()
+                        self.__taggedTagSetCache[key] = tagSet, lastTag + tagSet
+                        tagSet = self.__taggedTagSetCache[key][1]
                 state = stDecodeLength
-                debug.logger and debug.logger & debug.flagDecoder and debug.logger(
+                LOG and LOG(
                     'tag decoded into %s, decoding length' % tagSet)
             if state == stDecodeLength:
                 # Decode length
@@ -775,8 +1209,8 @@ class Decoder(object):
                             '%s<%s at %s' %
                             (size, len(lengthString), tagSet)
                         )
-                    for char in lengthString:
-                        length = (length << 8) | oct2int(char)
+                    for lengthOctet in lengthString:
+                        length = (length << 8) | oct2int(lengthOctet)
                     size += 1
                 substrate = substrate[size:]
                 if length != -1 and len(substrate) < length:
@@ -786,8 +1220,8 @@ class Decoder(object):
                 if length == -1 and not self.supportIndefLength:
                     raise error.PyAsn1Error('Indefinite length encoding not supported by this codec')
                 state = stGetValueDecoder
-                debug.logger and debug.logger & debug.flagDecoder and debug.logger(
-                    'value length decoded into %d, payload substrate is: %s' % (length, debug.hexdump(length == -1 and substrate or substrate[:length]))
+                LOG and LOG(
+                    'value length decoded into %d, payload substrate is: %s' % (length, length == -1 and '<indefinite>' or debug.hexdump(substrate[:length]))
                 )
             if state == stGetValueDecoder:
                 if asn1Spec is None:
@@ -827,8 +1261,8 @@ class Decoder(object):
                         state = stDecodeValue
                     else:
                         state = stTryAsExplicitTag
-                if debug.logger and debug.logger & debug.flagDecoder:
-                    debug.logger('codec %s chosen by a built-in type, decoding %s' % (concreteDecoder and concreteDecoder.__class__.__name__ or "<none>", state == stDecodeValue and 'value' or 'as explicit tag'))
+                if LOG:
+                    LOG('codec %s chosen by a built-in type, decoding %s' % (concreteDecoder and concreteDecoder.__class__.__name__ or "<none>", state == stDecodeValue and 'value' or 'as explicit tag'))
                     debug.scope.push(
                         concreteDecoder is None and '?' or concreteDecoder.protoComponent.__class__.__name__)
             if state == stGetValueDecoderByAsn1Spec:
@@ -837,18 +1271,18 @@ class Decoder(object):
                         __chosenSpec = asn1Spec[tagSet]
                     else:
                         __chosenSpec = None
-                    if debug.logger and debug.logger & debug.flagDecoder:
-                        debug.logger('candidate ASN.1 spec is a map of:')
+                    if LOG:
+                        LOG('candidate ASN.1 spec is a map of:')
                         for t, v in asn1Spec.getPosMap().items():
-                            debug.logger('  %s -> %s' % (t, v.__class__.__name__))
+                            LOG('  %s -> %s' % (t, v.__class__.__name__))
                         if asn1Spec.getNegMap():
-                            debug.logger('but neither of: ')
+                            LOG('but neither of: ')
                             for t, v in asn1Spec.getNegMap().items():
-                                debug.logger('  %s -> %s' % (t, v.__class__.__name__))
-                        debug.logger('new candidate ASN.1 spec is %s, chosen by %s' % (__chosenSpec is None and '<none>' or __chosenSpec.prettyPrintType(), tagSet))
+                                LOG('  %s -> %s' % (t, v.__class__.__name__))
+                        LOG('new candidate ASN.1 spec is %s, chosen by %s' % (__chosenSpec is None and '<none>' or __chosenSpec.prettyPrintType(), tagSet))
                 else:
                     __chosenSpec = asn1Spec
-                    debug.logger and debug.logger & debug.flagDecoder and debug.logger(
+                    LOG and LOG(
                         'candidate ASN.1 spec is %s' % asn1Spec.__class__.__name__)
                 if __chosenSpec is not None and (tagSet == __chosenSpec.getTagSet() or
                                                  tagSet in __chosenSpec.getTagMap()):
@@ -858,12 +1292,12 @@ class Decoder(object):
                             __chosenSpec.typeId in self.__typeMap:
                         # ambiguous type
                         concreteDecoder = self.__typeMap[__chosenSpec.typeId]
-                        debug.logger and debug.logger & debug.flagDecoder and debug.logger(
+                        LOG and LOG(
                             'value decoder chosen for an ambiguous type by type ID %s' % (__chosenSpec.typeId,))
                     elif baseTagSet in self.__tagMap:
                         # base type or tagged subtype
                         concreteDecoder = self.__tagMap[baseTagSet]
-                        debug.logger and debug.logger & debug.flagDecoder and debug.logger(
+                        LOG and LOG(
                             'value decoder chosen by base %s' % (baseTagSet,))
                     else:
                         concreteDecoder = None
@@ -875,8 +1309,8 @@ class Decoder(object):
                 else:
                     concreteDecoder = None
                     state = stTryAsExplicitTag
-                if debug.logger and debug.logger & debug.flagDecoder:
-                    debug.logger('codec %s chosen by ASN.1 spec, decoding %s' % (state == stDecodeValue and concreteDecoder.__class__.__name__ or "<none>", state == stDecodeValue and 'value' or 'as explicit tag'))
+                if LOG:
+                    LOG('codec %s chosen by ASN.1 spec, decoding %s' % (state == stDecodeValue and concreteDecoder.__class__.__name__ or "<none>", state == stDecodeValue and 'value' or 'as explicit tag'))
                     debug.scope.push(__chosenSpec is None and '?' or __chosenSpec.__class__.__name__)
             if state == stTryAsExplicitTag:
                 if tagSet and tagSet[0][1] == tag.tagFormatConstructed and \
@@ -887,10 +1321,10 @@ class Decoder(object):
                 else:
                     concreteDecoder = None
                     state = self.defaultErrorState
-                debug.logger and debug.logger & debug.flagDecoder and debug.logger('codec %s chosen, decoding %s' % (concreteDecoder and concreteDecoder.__class__.__name__ or "<none>", state == stDecodeValue and 'value' or 'as failure'))
+                LOG and LOG('codec %s chosen, decoding %s' % (concreteDecoder and concreteDecoder.__class__.__name__ or "<none>", state == stDecodeValue and 'value' or 'as failure'))
             if state == stDumpRawValue:
                 concreteDecoder = self.defaultRawDecoder
-                debug.logger and debug.logger & debug.flagDecoder and debug.logger(
+                LOG and LOG(
                     'codec %s chosen, decoding value' % concreteDecoder.__class__.__name__)
                 state = stDecodeValue
             if state == stDecodeValue:
@@ -908,15 +1342,15 @@ class Decoder(object):
                         stGetValueDecoder, self, substrateFun
                     )
                 state = stStop
-                debug.logger and debug.logger & debug.flagDecoder and debug.logger(
-                    'codec %s yields type %s, value:\n%s\n...remaining substrate is: %s' % (concreteDecoder.__class__.__name__, value.__class__.__name__, value.prettyPrint(), substrate and debug.hexdump(substrate) or '<none>'))
+                LOG and LOG(
+                    'codec %s yields type %s, value:\n%s\n...remaining substrate is %d octets' % (concreteDecoder.__class__.__name__, value.__class__.__name__, value.prettyPrint(), len(substrate)))
             if state == stErrorCondition:
                 raise error.PyAsn1Error(
                     '%s not in asn1Spec: %s' % (tagSet, asn1Spec)
                 )
-        if debug.logger and debug.logger & debug.flagDecoder:
+        if LOG:
             debug.scope.pop()
-            debug.logger('decoder left scope %s, call completed' % debug.scope)
+            LOG('decoder left scope %s, call completed' % debug.scope)
         return value, substrate
 
 
@@ -948,5 +1382,235 @@ class Decoder(object):
 #:     On decoding errors
 decode = Decoder(tagMap, typeMap)
 
+#: Turns a series of concatenated BER encodings into ASN.1 objects.
+#:
+#: Iterates over *substrate* decoding one top-level value after another,
+#: all of them of the same *asn1Spec*, until the substrate is exhausted.
+#: Type lookups are done once for the whole series, which makes it
+#: cheaper than calling :py:func:`decode` on each value in turn.
+#:
+#: Parameters
+#: ----------
+#: substrate: :py:class:`bytes` (Python 3) or :py:class:`str` (Python 2)
+#:     Concatenated BER octetstreams
+#:
+#: asn1Spec: any pyasn1 type object e.g. :py:class:`~pyasn1.type.base.PyAsn1Item` derivative
+#:     A pyasn1 type object to act as a template guiding the decoder
+#:
+#: asNative: :py:class:`bool`
+#:     If `True`, yield Python built-in objects as produced by
+#:     :py:mod:`pyasn1.codec.native.encoder` instead of pyasn1 objects
+#:
+#: Returns
+#: -------
+#: : iterator
+#:     Generator of pyasn1 objects (:py:class:`~pyasn1.type.base.PyAsn1Item` derivatives)
+#:     or Python built-in objects recovered from BER substrate
+#:
+#: Raises
+#: ------
+#: : :py:class:`pyasn1.error.PyAsn1Error`
+#:     On decoding errors, including a truncated last value
+decodeMany = decode.decodeMany
+
+#: Turns BER octet stream into Python built-in type object(s).
+#:
+#: Produces the same Python objects as decoding *substrate* with
+#: :py:func:`decode` and passing the outcome to
+#: :py:func:`pyasn1.codec.native.encoder.encode`, but mostly does so
+#: without building the intermediate pyasn1 objects. Components whose type
+#: can be told from their leading tag octet are converted right off the
+#: substrate, anything else (e.g. CHOICE or explicitly tagged components)
+#: goes through the regular decoder.
+#:
+#: Parameters
+#: ----------
+#: substrate: :py:class:`bytes` (Python 3) or :py:class:`str` (Python 2)
+#:     BER octetstream
+#:
+#: asn1Spec: any pyasn1 type object e.g. :py:class:`~pyasn1.type.base.PyAsn1Item` derivative
+#:     A pyasn1 type object to act as a template guiding the decoder
+#:
+#: Returns
+#: -------
+#: : :py:class:`tuple`
+#:     A tuple of Python built-in type object (or a tree of them) recovered
+#:     from BER substrate and the unprocessed trailing portion of the
+#:     *substrate* (may be empty)
+#:
+#: Raises
+#: ------
+#: : :py:class:`pyasn1.error.PyAsn1Error`
+#:     On decoding errors
+decodeNative = decode.decodeNative
+
+
+class StreamDecoder(object):
+    """Decode a sequence of top-level values from an octet stream.
+
+    Octets come either from :py:meth:`feed` calls or from a *stream*, which
+    may be a file-like object (anything with `read()` or `recv()`) or an
+    iterable of octet chunks. Iterating over the decoder yields values as
+    they complete; without a *stream* iteration stops once the fed octets
+    are used up. Only the tag and length octets are inspected
+    until a whole top-level value, including indefinite length ones, has
+    been buffered; the value is then handed over to the decoder.
+
+    When more octets are needed than are available,
+    :py:class:`~pyasn1.error.SubstrateUnderrunError` is raised. The
+    partially read value is kept, so decoding can be resumed once more
+    data arrives.
+
+    Parameters
+    ----------
+    stream: file-like object or iterable of :py:class:`bytes` (Python 3) or :py:class:`str` (Python 2)
+        Source of octets (may be omitted if :py:meth:`feed` is used)
+
+    asn1Spec: any pyasn1 type object e.g. :py:class:`~pyasn1.type.base.PyAsn1Item` derivative
+        A pyasn1 type object to act as a template guiding the decoder
+
+    maxBufferSize: :py:class:`int`
+        Maximum size in octets of a single top-level value (0 denotes unlimited)
+    """
+    decodeFun = decode
+
+    def __init__(self, stream=None, asn1Spec=None, maxBufferSize=0):
+        self.__read = None
+        self.__chunks = None
+        if stream is not None:
+            self.__read = getattr(stream, 'read', None) or getattr(stream, 'recv', None)
+            if self.__read is None:
+                self.__chunks = iter(stream)
+        self.__asn1Spec = asn1Spec
+        self.__maxBufferSize = maxBufferSize
+        self.__buffer = bytearray()
+        # Scanning state of the top-level value being buffered
+        self.__offset = 0
+        self.__depth = 0
+        self.__needed = 1
+
+    def feed(self, substrate):
+        """Append octets to the internal buffer."""
+        self.__buffer.extend(substrate)
+
+    def __parseHeader(self, offset):
+        # Returns (header size, value length) or (None, octets missing)
+        buf = self.__buffer
+        end = len(buf)
+        pos = offset
+        if pos >= end:
+            return None, 1
+        if buf[pos] & 0x1F == 0x1F:
+            while True:
+                pos += 1
+                if pos >= end:
+                    return None, 1
+                if not buf[pos] & 0x80:
+                    break
+        pos += 1
+        if pos >= end:
+            return None, 1
+        firstOctet = buf[pos]
+        pos += 1
+        if firstOctet == 128:
+            length = -1
+        elif firstOctet < 128:
+            length = firstOctet
+        else:
+            size = firstOctet & 0x7F
+            if pos + size > end:
+                return None, pos + size - end
+            length = 0
+            for octet in buf[pos:pos + size]:
+                length = (length << 8) | octet
+            pos += size
+        return pos - offset, length
+
+    def __scan(self):
+        # Advances over the headers of the buffered top-level value,
+        # returns its size once it is complete
+        offset, depth = self.__offset, self.__depth
+        try:
+            while True:
+                if offset > len(self.__buffer):
+                    self.__needed = offset - len(self.__buffer)
+                    return
+                if offset and not depth:
+                    return offset
+                size, length = self.__parseHeader(offset)
+                if size is None:
+                    self.__needed = length
+                    return
+                if length == -1:
+                    depth += 1
+                    offset += size
+                elif depth and not length and not self.__buffer[offset]:
+                    depth -= 1  # end-of-contents octets
+                    offset += size
+                else:
+                    offset += size + length
+                if self.__maxBufferSize and offset > self.__maxBufferSize:
+                    raise error.PyAsn1Error(
+                        'Value exceeds %d octets buffer limit' % self.__maxBufferSize
+                    )
+        finally:
+            self.__offset, self.__depth = offset, depth
+
+    def decodeNext(self):
+        """Decode next top-level value from the buffered octets.
+
+        Returns
+        -------
+        : :py:class:`~pyasn1.type.base.PyAsn1Item` derivative
+            Decoded value
+
+        Raises
+        ------
+        : :py:class:`~pyasn1.error.SubstrateUnderrunError`
+            If no complete value is buffered yet
+        """
+        size = self.__scan()
+        if size is None:
+            raise error.SubstrateUnderrunError(
+                '%d more octet(s) needed' % self.__needed
+            )
+        substrate = bytes(self.__buffer[:size])
+        del self.__buffer[:size]
+        self.__offset = self.__depth = 0
+        self.__needed = 1
+        value, rest = self.decodeFun(substrate, asn1Spec=self.__asn1Spec)
+        return value
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while True:
+            try:
+                return self.decodeNext()
+            except error.SubstrateUnderrunError:
+                if self.__read is None and self.__chunks is None:
+                    raise StopIteration  # wait for more feed() calls
+            if self.__read is not None:
+                substrate = self.__read(self.__needed)
+                if substrate is None:  # non-blocking stream has no data
+                    raise error.SubstrateUnderrunError(
+                        '%d more octet(s) needed' % self.__needed
+                    )
+            else:
+                substrate = next(self.__chunks, None)
+                if substrate is not None and not substrate:
+                    continue
+            if not substrate:  # end of stream
+                if self.__buffer:
+                    raise error.SubstrateUnderrunError(
+                        'Stream ended %d octet(s) short' % self.__needed
+                    )
+                raise StopIteration
+            self.feed(substrate)
+
+    next = __next__
+
+
 # XXX
 # non-recursive decoding; return position rather than substrate
@@ -10,7 +10,9 @@ from pyasn1.compat.octets import int2oct, oct2int, ints2octs, null, str2octs
 from pyasn1.compat.integer import to_bytes
 from pyasn1 import debug, error
 
-__all__ = ['encode']
+__all__ = ['encode', 'encodeInto']
+
+LOG = debug.registerLoggee(__name__, flags=debug.flagEncoder)
 
 
 class AbstractItemEncoder(object):
@@ -50,27 +52,50 @@ class AbstractItemEncoder(object):
     def encodeValue(self, encodeFun, value, defMode, maxChunkSize):
         raise error.PyAsn1Error('Not implemented')
 
+    def encodeValueInto(self, encodeFun, value, defMode, maxChunkSize, chunks):
+        # Constructed types override this to append their components to
+        # chunks one by one instead of building the whole value first
+        substrate, isConstructed = self.encodeValue(
+            encodeFun, value, defMode, maxChunkSize
+        )
+        chunks.append(substrate)
+        return len(substrate), isConstructed
+
     def _encodeEndOfOctets(self, encodeFun, defMode):
         if defMode or not self.supportIndefLenMode:
             return null
         else:
             return encodeFun(eoo.endOfOctets, defMode)
 
-    def encode(self, encodeFun, value, defMode, maxChunkSize):
-        substrate, isConstructed = self.encodeValue(
-            encodeFun, value, defMode, maxChunkSize
-        )
+    def encodeInto(self, encodeFun, value, defMode, maxChunkSize, chunks):
         tagSet = value.getTagSet()
-        if tagSet:
-            if not isConstructed:  # primitive form implies definite mode
-                defMode = True
-            return self.encodeTag(
-                tagSet[-1], isConstructed
-            ) + self.encodeLength(
-                len(substrate), defMode
-            ) + substrate + self._encodeEndOfOctets(encodeFun, defMode)
-        else:
-            return substrate  # untagged value
+        if not tagSet:  # untagged value
+            return self.encodeValueInto(
+                encodeFun, value, defMode, maxChunkSize, chunks
+            )[0]
+        # Reserve a slot for the header until the length is known
+        headerIdx = len(chunks)
+        chunks.append(null)
+        length, isConstructed = self.encodeValueInto(
+            encodeFun, value, defMode, maxChunkSize, chunks
+        )
+        if not isConstructed:  # primitive form implies definite mode
+            defMode = True
+        header = self.encodeTag(
+            tagSet[-1], isConstructed
+        ) + self.encodeLength(
+            length, defMode
+        )
+        chunks[headerIdx] = header
+        endOfOctets = self._encodeEndOfOctets(encodeFun, defMode)
+        if endOfOctets:
+            chunks.append(endOfOctets)
+        return len(header) + length + len(endOfOctets)
+
+    def encode(self, encodeFun, value, defMode, maxChunkSize):
+        chunks = []
+        self.encodeInto(encodeFun, value, defMode, maxChunkSize, chunks)
+        return null.join(chunks)
 
 
 class EndOfOctetsEncoder(AbstractItemEncoder):
@@ -80,12 +105,19 @@ class EndOfOctetsEncoder(AbstractItemEncoder):
 
 class ExplicitlyTaggedItemEncoder(AbstractItemEncoder):
     def encodeValue(self, encodeFun, value, defMode, maxChunkSize):
+        chunks = []
+        length, isConstructed = self.encodeValueInto(
+            encodeFun, value, defMode, maxChunkSize, chunks
+        )
+        return null.join(chunks), isConstructed
+
+    def encodeValueInto(self, encodeFun, value, defMode, maxChunkSize, chunks):
         if isinstance(value, base.AbstractConstructedAsn1Item):
             value = value.clone(tagSet=value.getTagSet()[:-1],
                                 cloneValueFlag=1)
         else:
             value = value.clone(tagSet=value.getTagSet()[:-1])
-        return encodeFun(value, defMode, maxChunkSize), 1
+        return encodeFun.encodeInto(value, chunks, defMode, maxChunkSize), 1
 
 
 explicitlyTaggedItemEncoder = ExplicitlyTaggedItemEncoder()
@@ -128,12 +160,12 @@ class BitStringEncoder(AbstractItemEncoder):
             return int2oct(len(substrate) * 8 - len(value)) + substrate, 0
 
         stop = 0
-        substrate = null
+        chunks = []
         while stop < len(value):
             start = stop
             stop = min(start + maxChunkSize * 8, len(value))
-            substrate += encodeFun(alignedValue[start:stop], defMode, maxChunkSize)
-        return substrate, 1
+            encodeFun.encodeInto(alignedValue[start:stop], chunks, defMode, maxChunkSize)
+        return null.join(chunks), 1
 
 
 class OctetStringEncoder(AbstractItemEncoder):
@@ -142,14 +174,14 @@ class OctetStringEncoder(AbstractItemEncoder):
             return value.asOctets(), 0
         else:
             pos = 0
-            substrate = null
+            chunks = []
             while True:
                 v = value.clone(value[pos:pos + maxChunkSize])
                 if not v:
                     break
-                substrate = substrate + encodeFun(v, defMode, maxChunkSize)
+                encodeFun.encodeInto(v, chunks, defMode, maxChunkSize)
                 pos += maxChunkSize
-            return substrate, 1
+            return null.join(chunks), 1
 
 
 class NullEncoder(AbstractItemEncoder):
@@ -326,41 +358,49 @@ class RealEncoder(AbstractItemEncoder):
             raise error.PyAsn1Error('Prohibited Real base %s' % b)
 
 
-class SequenceEncoder(AbstractItemEncoder):
+class AbstractConstructedEncoder(AbstractItemEncoder):
     def encodeValue(self, encodeFun, value, defMode, maxChunkSize):
+        chunks = []
+        length, isConstructed = self.encodeValueInto(
+            encodeFun, value, defMode, maxChunkSize, chunks
+        )
+        return null.join(chunks), isConstructed
+
+
+class SequenceEncoder(AbstractConstructedEncoder):
+    def encodeValueInto(self, encodeFun, value, defMode, maxChunkSize, chunks):
         value.setDefaultComponents()
         value.verifySizeSpec()
-        substrate = null
-        idx = len(value)
-        while idx > 0:
-            idx -= 1
-            if value[idx] is None:  # Optional component
+        length = 0
+        for idx in range(len(value)):
+            component = value[idx]
+            if component is None:  # Optional component
                 continue
-            component = value.getDefaultComponentByPosition(idx)
-            if component is not None and component == value[idx]:
+            if encodeFun.isDefaultComponent(
+                    component, value.getDefaultComponentByPosition(idx)):
                 continue
-            substrate = encodeFun(
-                value[idx], defMode, maxChunkSize
-            ) + substrate
-        return substrate, 1
+            length += encodeFun.encodeInto(
+                component, chunks, defMode, maxChunkSize
+            )
+        return length, 1
 
 
-class SequenceOfEncoder(AbstractItemEncoder):
-    def encodeValue(self, encodeFun, value, defMode, maxChunkSize):
+class SequenceOfEncoder(AbstractConstructedEncoder):
+    def encodeValueInto(self, encodeFun, value, defMode, maxChunkSize, chunks):
         value.verifySizeSpec()
-        substrate = null
-        idx = len(value)
-        while idx > 0:
-            idx -= 1
-            substrate = encodeFun(
-                value[idx], defMode, maxChunkSize
-            ) + substrate
-        return substrate, 1
+        length = 0
+        for idx in range(len(value)):
+            length += encodeFun.encodeInto(
+                value[idx], chunks, defMode, maxChunkSize
+            )
+        return length, 1
 
 
-class ChoiceEncoder(AbstractItemEncoder):
-    def encodeValue(self, encodeFun, value, defMode, maxChunkSize):
-        return encodeFun(value.getComponent(), defMode, maxChunkSize), 1
+class ChoiceEncoder(AbstractConstructedEncoder):
+    def encodeValueInto(self, encodeFun, value, defMode, maxChunkSize, chunks):
+        return encodeFun.encodeInto(
+            value.getComponent(), chunks, defMode, maxChunkSize
+        ), 1
 
 
 class AnyEncoder(OctetStringEncoder):
@@ -412,19 +452,75 @@ typeMap = {
 
 
 class Encoder(object):
+    """Encode pyasn1 objects with the given value encoders.
+
+    Parameters
+    ----------
+    tagMap: :py:class:`dict`
+        Value encoders by ASN.1 tag
+
+    typeMap: :py:class:`dict`
+        Value encoders for ambiguous ASN.1 types by type ID
+
+    cacheSize: :py:class:`int`
+        If non-zero, memoize the substrate of up to this many simple
+        (hence immutable) pyasn1 objects, so that objects encoded
+        over and over, e.g. the unchanged parts of a structure being
+        re-encoded, are only serialized once. The cached objects are
+        held by the encoder. Disabled by default.
+    """
     supportIndefLength = True
 
     # noinspection PyDefaultArgument
-    def __init__(self, tagMap, typeMap={}):
+    def __init__(self, tagMap, typeMap={}, cacheSize=0):
         self.__tagMap = tagMap
         self.__typeMap = typeMap
+        self.__cacheSize = cacheSize
+        # Keyed by object ids, the objects are kept in the entries
+        # so that the ids can not be reused while cached
+        self.__valueCache = {}
+        self.__defaultCache = {}
+
+    def isDefaultComponent(self, component, defaultComponent):
+        """Tell if *component* has the value of its DEFAULT and is to be left out."""
+        if defaultComponent is None:
+            return False
+        if not self.__cacheSize or not isinstance(component, base.AbstractSimpleAsn1Item):
+            return defaultComponent == component
+        key = id(component), id(defaultComponent)
+        if key in self.__defaultCache:
+            return self.__defaultCache[key][2]
+        if len(self.__defaultCache) >= self.__cacheSize:
+            self.__defaultCache.clear()
+        isDefault = defaultComponent == component
+        self.__defaultCache[key] = component, defaultComponent, isDefault
+        return isDefault
 
     def __call__(self, value, defMode=True, maxChunkSize=0):
+        chunks = []
+        self.encodeInto(value, chunks, defMode, maxChunkSize)
+        return null.join(chunks)
+
+    def encodeInto(self, value, buffer, defMode=True, maxChunkSize=0):
+        if isinstance(buffer, list):
+            chunks = buffer
+        else:
+            chunks = []
         if not isinstance(value, base.Asn1Item):
             raise error.PyAsn1Error('value is not valid (should be an instance of an ASN.1 Item)')
         if not defMode and not self.supportIndefLength:
             raise error.PyAsn1Error('Indefinite length encoding not supported by this codec')
-        debug.logger & debug.flagEncoder and debug.logger(
+        cacheKey = None
+        if self.__cacheSize and not LOG and isinstance(value, base.AbstractSimpleAsn1Item):
+            cacheKey = id(value), defMode, maxChunkSize
+            if cacheKey in self.__valueCache:
+                substrate = self.__valueCache[cacheKey][1]
+                if chunks is buffer:
+                    chunks.append(substrate)
+                else:
+                    buffer.extend(substrate)
+                return len(substrate)
+        LOG and LOG(
             'encoder called in %sdef mode, chunk size %s for type %s, value:\n%s' % (
                 not defMode and 'in' or '', maxChunkSize, value.prettyPrintType(), value.prettyPrint()))
         tagSet = value.getTagSet()
@@ -441,14 +537,24 @@ class Encoder(object):
                     concreteEncoder = self.__tagMap[tagSet]
                 else:
                     raise error.PyAsn1Error('No encoder for %s' % (value,))
-        debug.logger & debug.flagEncoder and debug.logger(
+        LOG and LOG(
             'using value codec %s chosen by %s' % (concreteEncoder.__class__.__name__, tagSet))
-        substrate = concreteEncoder.encode(
-            self, value, defMode, maxChunkSize
+        startIdx = len(chunks)
+        length = concreteEncoder.encodeInto(
+            self, value, defMode, maxChunkSize, chunks
         )
-        debug.logger & debug.flagEncoder and debug.logger(
-            'built %s octets of substrate: %s\nencoder completed' % (len(substrate), debug.hexdump(substrate)))
-        return substrate
+        if cacheKey is not None:
+            substrate = null.join(chunks[startIdx:])
+            chunks[startIdx:] = [substrate]
+            if len(self.__valueCache) >= self.__cacheSize:
+                self.__valueCache.clear()
+            self.__valueCache[cacheKey] = value, substrate
+        if LOG:
+            substrate = null.join(chunks[startIdx:])
+            LOG('built %s octets of substrate: %s\nencoder completed' % (len(substrate), debug.hexdump(substrate)))
+        if chunks is not buffer:
+            buffer.extend(null.join(chunks))
+        return length
 
 #: Turns ASN.1 object into BER octet stream.
 #:
@@ -476,3 +582,35 @@ class Encoder(object):
 #: : :py:class:`pyasn1.error.PyAsn1Error`
 #:     On encoding errors
 encode = Encoder(tagMap, typeMap)
+
+#: Turns ASN.1 object into BER octet stream, appending it to a buffer.
+#:
+#: Works like :py:func:`encode`, but writes the encoding into *buffer*
+#: rather than returning it, so that several values can be serialized into
+#: one output without intermediate copies.
+#:
+#: Parameters
+#: ----------
+#  value: any pyasn1 object (e.g. :py:class:`~pyasn1.type.base.PyAsn1Item` derivative)
+#:     A pyasn1 object to encode
+#:
+#: buffer: :py:class:`bytearray` or :py:class:`list`
+#:     The encoding is appended to a :py:class:`bytearray`, or added to a
+#:     :py:class:`list` as a number of octet chunks to be joined by the caller
+#:
+#: defMode: :py:class:`bool`
+#:     If `False`, produces indefinite length encoding
+#:
+#: maxChunkSize: :py:class:`int`
+#:     Maximum chunk size in chunked encoding mode (0 denotes unlimited chunk size)
+#:
+#: Returns
+#: -------
+#: : :py:class:`int`
+#:     The number of octets added to *buffer*
+#:
+#: Raises
+#: ------
+#: : :py:class:`pyasn1.error.PyAsn1Error`
+#:     On encoding errors
+encodeInto = encode.encodeInto
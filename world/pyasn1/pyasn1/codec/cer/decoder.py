@@ -9,7 +9,7 @@ from pyasn1.codec.ber import decoder
 from pyasn1.compat.octets import oct2int
 from pyasn1 import error
 
-__all__ = ['decode']
+__all__ = ['decode', 'decodeMany', 'decodeNative', 'StreamDecoder']
 
 
 class BooleanDecoder(decoder.AbstractSimpleDecoder):
@@ -79,3 +79,22 @@ class Decoder(decoder.Decoder):
 #: : :py:class:`pyasn1.error.PyAsn1Error`
 #:     On decoding errors
 decode = Decoder(tagMap, decoder.typeMap)
+
+
+#: Turns a series of concatenated CER encodings into ASN.1 objects.
+#:
+#: See :py:func:`pyasn1.codec.ber.decoder.decodeMany`.
+decodeMany = decode.decodeMany
+
+#: Turns CER octet stream into Python built-in type object(s).
+#:
+#: See :py:func:`pyasn1.codec.ber.decoder.decodeNative`.
+decodeNative = decode.decodeNative
+
+
+class StreamDecoder(decoder.StreamDecoder):
+    """Decode a sequence of top-level values from a CER octet stream.
+
+    See :py:class:`pyasn1.codec.ber.decoder.StreamDecoder`.
+    """
+    decodeFun = decode
@@ -7,10 +7,10 @@
 from pyasn1.type import univ
 from pyasn1.type import useful
 from pyasn1.codec.ber import encoder
-from pyasn1.compat.octets import int2oct, str2octs, null
+from pyasn1.compat.octets import int2oct, null, str2octs
 from pyasn1 import error
 
-__all__ = ['encode']
+__all__ = ['encode', 'encodeInto']
 
 
 class BooleanEncoder(encoder.IntegerEncoder):
@@ -85,11 +85,19 @@ class UTCTimeEncoder(encoder.OctetStringEncoder):
 
 
 class SetOfEncoder(encoder.SequenceOfEncoder):
-    def encodeValue(self, encodeFun, client, defMode, maxChunkSize):
+    @staticmethod
+    def _componentSortKey(component):
+        # Canonical order of tags, an untagged CHOICE goes by the
+        # lowest tag among its alternatives
+        if isinstance(component, univ.Choice):
+            return component.getMinTagSet().uniq
+        return component.getTagSet().uniq
+
+    def encodeValueInto(self, encodeFun, client, defMode, maxChunkSize, chunks):
         if isinstance(client, univ.SequenceAndSetBase):
             client.setDefaultComponents()
         client.verifySizeSpec()
-        substrate = null
+        length = 0
         idx = len(client)
         # This is certainly a hack but how else do I distinguish SetOf
         # from Set if they have the same tags&constraints?
@@ -100,25 +108,28 @@ class SetOfEncoder(encoder.SequenceOfEncoder):
                 idx -= 1
                 if client[idx] is None:  # Optional component
                     continue
-                if client.getDefaultComponentByPosition(idx) == client[idx]:
+                if encodeFun.isDefaultComponent(
+                        client[idx], client.getDefaultComponentByPosition(idx)):
                     continue
                 comps.append(client[idx])
-            comps.sort(key=lambda x: isinstance(x, univ.Choice) and x.getMinTagSet() or x.getTagSet())
+            comps.sort(key=self._componentSortKey)
             for c in comps:
-                substrate += encodeFun(c, defMode, maxChunkSize)
+                length += encodeFun.encodeInto(c, chunks, defMode, maxChunkSize)
         else:
-            # SetOf
+            # SetOf, components are ordered by their encodings. Each one
+            # is joined on its own, a single chunk (e.g. a cached one) is
+            # taken as is
             compSubs = []
             while idx > 0:
                 idx -= 1
-                compSubs.append(
-                    encodeFun(client[idx], defMode, maxChunkSize)
+                compChunks = []
+                length += encodeFun.encodeInto(
+                    client[idx], compChunks, defMode, maxChunkSize
                 )
+                compSubs.append(null.join(compChunks))
             compSubs.sort()  # perhaps padding's not needed
-            substrate = null
-            for compSub in compSubs:
-                substrate += compSub
-        return substrate, 1
+            chunks.extend(compSubs)
+        return length, 1
 
 
 tagMap = encoder.tagMap.copy()
@@ -143,6 +154,9 @@ class Encoder(encoder.Encoder):
     def __call__(self, client, defMode=False, maxChunkSize=0):
         return encoder.Encoder.__call__(self, client, defMode, maxChunkSize)
 
+    def encodeInto(self, client, buffer, defMode=False, maxChunkSize=0):
+        return encoder.Encoder.encodeInto(self, client, buffer, defMode, maxChunkSize)
+
 
 #: Turns ASN.1 object into CER octet stream.
 #:
@@ -171,4 +185,35 @@ class Encoder(encoder.Encoder):
 #:     On encoding errors
 encode = Encoder(tagMap, typeMap)
 
+#: Turns ASN.1 object into CER octet stream, appending it to a buffer.
+#:
+#: Works like :py:func:`encode`, but writes the encoding into *buffer*
+#: rather than returning it.
+#:
+#: Parameters
+#: ----------
+#  value: any pyasn1 object (e.g. :py:class:`~pyasn1.type.base.PyAsn1Item` derivative)
+#:     A pyasn1 object to encode
+#:
+#: buffer: :py:class:`bytearray` or :py:class:`list`
+#:     The encoding is appended to a :py:class:`bytearray`, or added to a
+#:     :py:class:`list` as a number of octet chunks to be joined by the caller
+#:
+#: defMode: :py:class:`bool`
+#:     If `False`, produces indefinite length encoding
+#:
+#: maxChunkSize: :py:class:`int`
+#:     Maximum chunk size in chunked encoding mode (0 denotes unlimited chunk size)
+#:
+#: Returns
+#: -------
+#: : :py:class:`int`
+#:     The number of octets added to *buffer*
+#:
+#: Raises
+#: ------
+#: : :py:class:`pyasn1.error.PyAsn1Error`
+#:     On encoding errors
+encodeInto = encode.encodeInto
+
 # EncoderFactory queries class instance and builds a map of tags -> encoders
@@ -7,7 +7,7 @@
 from pyasn1.type import univ
 from pyasn1.codec.cer import decoder
 
-__all__ = ['decode']
+__all__ = ['decode', 'decodeMany', 'decodeNative', 'StreamDecoder']
 
 
 class BitStringDecoder(decoder.BitStringDecoder):
@@ -61,3 +61,22 @@ class Decoder(decoder.Decoder):
 #: : :py:class:`pyasn1.error.PyAsn1Error`
 #:     On decoding errors
 decode = Decoder(tagMap, typeMap)
+
+
+#: Turns a series of concatenated DER encodings into ASN.1 objects.
+#:
+#: See :py:func:`pyasn1.codec.ber.decoder.decodeMany`.
+decodeMany = decode.decodeMany
+
+#: Turns DER octet stream into Python built-in type object(s).
+#:
+#: See :py:func:`pyasn1.codec.ber.decoder.decodeNative`.
+decodeNative = decode.decodeNative
+
+
+class StreamDecoder(decoder.StreamDecoder):
+    """Decode a sequence of top-level values from a DER octet stream.
+
+    See :py:class:`pyasn1.codec.ber.decoder.StreamDecoder`.
+    """
+    decodeFun = decode
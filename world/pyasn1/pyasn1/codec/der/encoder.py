@@ -8,7 +8,7 @@ from pyasn1.type import univ
 from pyasn1.codec.cer import encoder
 from pyasn1 import error
 
-__all__ = ['encode']
+__all__ = ['encode', 'encodeInto']
 
 
 class SetOfEncoder(encoder.SetOfEncoder):
@@ -39,6 +39,11 @@ class Encoder(encoder.Encoder):
             raise error.PyAsn1Error('DER forbids indefinite length mode')
         return encoder.Encoder.__call__(self, client, defMode, maxChunkSize)
 
+    def encodeInto(self, client, buffer, defMode=True, maxChunkSize=0):
+        if not defMode or maxChunkSize:
+            raise error.PyAsn1Error('DER forbids indefinite length mode')
+        return encoder.Encoder.encodeInto(self, client, buffer, defMode, maxChunkSize)
+
 #: Turns ASN.1 object into DER octet stream.
 #:
 #: Takes any ASN.1 object (e.g. :py:class:`~pyasn1.type.base.PyAsn1Item` derivative)
@@ -65,3 +70,28 @@ class Encoder(encoder.Encoder):
 #: : :py:class:`pyasn1.error.PyAsn1Error`
 #:     On encoding errors
 encode = Encoder(tagMap, typeMap)
+
+#: Turns ASN.1 object into DER octet stream, appending it to a buffer.
+#:
+#: Works like :py:func:`encode`, but writes the encoding into *buffer*
+#: rather than returning it.
+#:
+#: Parameters
+#: ----------
+#  value: any pyasn1 object (e.g. :py:class:`~pyasn1.type.base.PyAsn1Item` derivative)
+#:     A pyasn1 object to encode
+#:
+#: buffer: :py:class:`bytearray` or :py:class:`list`
+#:     The encoding is appended to a :py:class:`bytearray`, or added to a
+#:     :py:class:`list` as a number of octet chunks to be joined by the caller
+#:
+#: Returns
+#: -------
+#: : :py:class:`int`
+#:     The number of octets added to *buffer*
+#:
+#: Raises
+#: ------
+#: : :py:class:`pyasn1.error.PyAsn1Error`
+#:     On encoding errors
+encodeInto = encode.encodeInto
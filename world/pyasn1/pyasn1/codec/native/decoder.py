@@ -9,6 +9,8 @@ from pyasn1 import debug, error
 
 __all__ = ['decode']
 
+LOG = debug.registerLoggee(__name__, flags=debug.flagDecoder)
+
 
 class AbstractScalarDecoder(object):
     def __call__(self, pyObject, asn1Spec, decoderFunc=None):
@@ -106,9 +108,9 @@ class Decoder(object):
         self.__typeMap = typeMap
 
     def __call__(self, pyObject, asn1Spec):
-        if debug.logger & debug.flagDecoder:
+        if LOG:
             debug.scope.push(type(pyObject).__name__)
-            debug.logger('decoder called at scope %s, working with type %s' % (debug.scope, type(pyObject).__name__))
+            LOG('decoder called at scope %s, working with type %s' % (debug.scope, type(pyObject).__name__))
 
         if asn1Spec is None or not isinstance(asn1Spec, base.Asn1Item):
             raise error.PyAsn1Error('asn1Spec is not valid (should be an instance of an ASN.1 Item, not %s)' % asn1Spec.__class__.__name__)
@@ -120,13 +122,13 @@ class Decoder(object):
         else:
             raise error.PyAsn1Error('Unknown ASN.1 tag %s' % asn1Spec.tagSet)
 
-        if debug.logger & debug.flagDecoder:
-            debug.logger('calling decoder %s on Python type %s <%s>' % (type(valueDecoder).__name__, type(pyObject).__name__, repr(pyObject)))
+        if LOG:
+            LOG('calling decoder %s on Python type %s <%s>' % (type(valueDecoder).__name__, type(pyObject).__name__, repr(pyObject)))
 
         value = valueDecoder(pyObject, asn1Spec, self)
 
-        if debug.logger & debug.flagDecoder:
-            debug.logger('decoder %s produced ASN.1 type %s <%s>' % (type(valueDecoder).__name__, type(value).__name__, repr(value)))
+        if LOG:
+            LOG('decoder %s produced ASN.1 type %s <%s>' % (type(valueDecoder).__name__, type(value).__name__, repr(value)))
             debug.scope.pop()
 
         return value
@@ -15,6 +15,8 @@ from pyasn1 import debug, error
 
 __all__ = ['encode']
 
+LOG = debug.registerLoggee(__name__, flags=debug.flagEncoder)
+
 
 class AbstractItemEncoder(object):
     def encode(self, encodeFun, value):
@@ -158,9 +160,9 @@ class Encoder(object):
         if not isinstance(asn1Value, base.Asn1Item):
             raise error.PyAsn1Error('value is not valid (should be an instance of an ASN.1 Item)')
 
-        if debug.logger & debug.flagEncoder:
+        if LOG:
             debug.scope.push(type(asn1Value).__name__)
-            debug.logger('encoder called for type %s <%s>' % (type(asn1Value).__name__, asn1Value.prettyPrint()))
+            LOG('encoder called for type %s <%s>' % (type(asn1Value).__name__, asn1Value.prettyPrint()))
 
         tagSet = asn1Value.getTagSet()
         if len(tagSet) > 1:
@@ -177,12 +179,12 @@ class Encoder(object):
                 else:
                     raise error.PyAsn1Error('No encoder for %s' % (asn1Value,))
 
-        debug.logger & debug.flagEncoder and debug.logger('using value codec %s chosen by %s' % (type(concreteEncoder).__name__, tagSet))
+        LOG and LOG('using value codec %s chosen by %s' % (type(concreteEncoder).__name__, tagSet))
 
         pyObject = concreteEncoder.encode(self, asn1Value)
 
-        if debug.logger & debug.flagEncoder:
-            debug.logger('encoder %s produced: %s' % (type(concreteEncoder).__name__, repr(pyObject)))
+        if LOG:
+            LOG('encoder %s produced: %s' % (type(concreteEncoder).__name__, repr(pyObject)))
             debug.scope.pop()
 
         return pyObject
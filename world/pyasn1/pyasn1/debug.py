@@ -5,11 +5,12 @@
 # License: http://pyasn1.sf.net/license.html
 #
 import logging
+import sys
 from pyasn1.compat.octets import octs2ints
 from pyasn1 import error
 from pyasn1 import __version__
 
-__all__ = ['Debug', 'setLogger', 'hexdump']
+__all__ = ['Debug', 'setLogger', 'registerLoggee', 'hexdump']
 
 flagNone = 0x0000
 flagEncoder = 0x0001
@@ -101,10 +102,36 @@ class Debug(object):
 
 logger = 0
 
+# (module name, attribute name) -> debug flags
+loggees = {}
+
+
+def getLoggerFor(flags):
+    if logger and logger & flags:
+        return logger
+
 
 def setLogger(l):
     global logger
     logger = l
+    for (module, name), flags in loggees.items():
+        setattr(sys.modules[module], name, getLoggerFor(flags))
+
+
+def registerLoggee(module, name='LOG', flags=flagNone):
+    """Have a module attribute track the logger for given debug flags.
+
+    The *name* attribute of *module* is set to the current logger whenever
+    :py:func:`setLogger` enables any of *flags*, and to `None` otherwise,
+    so that hot code paths only need to test a single global.
+
+    Returns
+    -------
+    : :py:class:`Debug` or `None`
+        Initial value of the attribute
+    """
+    loggees[(module, name)] = flags
+    return getLoggerFor(flags)
 
 
 def hexdump(octets):
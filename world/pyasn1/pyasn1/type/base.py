@@ -529,6 +529,9 @@ class AbstractConstructedAsn1Item(Asn1ItemBase):
     def verifySizeSpec(self):
         self._sizeSpec(self)
 
+    def getSizeSpec(self):
+        return self._sizeSpec
+
     def getComponentByPosition(self, idx):
         raise error.PyAsn1Error('Method not implemented')
 
@@ -0,0 +1,226 @@
+#
+# This file is part of pyasn1 software.
+#
+# Copyright (c) 2005-2017, Ilya Etingof <etingof@gmail.com>
+# License: http://pyasn1.sf.net/license.html
+#
+import io
+import sys
+
+try:
+    import unittest2 as unittest
+
+except ImportError:
+    import unittest
+
+from pyasn1.type import tag, namedtype, univ, char, useful
+from pyasn1.codec.ber import encoder, decoder
+from pyasn1.codec.cer import decoder as cerDecoder
+from pyasn1.codec.der import encoder as derEncoder, decoder as derDecoder
+from pyasn1.codec.native import encoder as nativeEncoder
+from pyasn1.compat.octets import ints2octs, null
+from pyasn1.error import PyAsn1Error, SubstrateUnderrunError
+
+
+class Alternative(univ.Choice):
+    componentType = namedtype.NamedTypes(
+        namedtype.NamedType('number', univ.Integer()),
+        namedtype.NamedType('text', char.PrintableString())
+    )
+
+
+class Record(univ.Sequence):
+    componentType = namedtype.NamedTypes(
+        namedtype.NamedType('id', univ.Integer()),
+        namedtype.OptionalNamedType('name', char.UTF8String()),
+        namedtype.DefaultedNamedType('flag', univ.Boolean(False)),
+        namedtype.OptionalNamedType('label', char.UTF8String().subtype(
+            implicitTag=tag.Tag(tag.tagClassContext, tag.tagFormatSimple, 0))),
+        namedtype.OptionalNamedType('version', univ.Integer().subtype(
+            explicitTag=tag.Tag(tag.tagClassContext, tag.tagFormatSimple, 1))),
+        namedtype.NamedType('oid', univ.ObjectIdentifier()),
+        namedtype.OptionalNamedType('alternative', Alternative()),
+        namedtype.OptionalNamedType('list', univ.SequenceOf(componentType=univ.Integer())),
+        namedtype.OptionalNamedType('data', univ.OctetString()),
+        namedtype.OptionalNamedType('when', useful.UTCTime())
+    )
+
+
+def makeRecord(index):
+    record = Record()
+    record['id'] = index * 37 - 500
+    if index % 2:
+        record['name'] = 'name %d' % index
+    if index % 3:
+        record['flag'] = bool(index % 2)
+    if index % 4:
+        record['label'] = 'label %d' % index
+    if index % 5:
+        record['version'] = index % 3
+    record['oid'] = '1.2.840.113549.1.1.%d' % (index % 13)
+    alternative = Alternative()
+    if index % 2:
+        alternative['number'] = index
+    else:
+        alternative['text'] = 'text%d' % index
+    record['alternative'] = alternative
+    if index % 3:
+        record.setComponentByName('list')
+        record['list'].extend(range(index % 4))
+    if index % 4:
+        record['data'] = ints2octs([index % 256] * (index * 50))
+    if index % 5:
+        record['when'] = '170101000000Z'
+    return record
+
+
+class DecodeNativeTestCase(unittest.TestCase):
+    def testParity(self):
+        for index in range(20):
+            record = makeRecord(index)
+            for substrate in (encoder.encode(record),
+                              encoder.encode(record, defMode=False, maxChunkSize=16),
+                              derEncoder.encode(record)):
+                value, rest = decoder.decode(substrate, asn1Spec=Record())
+                native, nativeRest = decoder.decodeNative(substrate, asn1Spec=Record())
+                assert native == nativeEncoder.encode(value)
+                assert nativeRest == rest == null
+
+    def testParityWithoutSpec(self):
+        # Without a spec only untagged components can be decoded
+        substrate = derEncoder.encode(makeRecord(20))
+        value, rest = decoder.decode(substrate)
+        assert decoder.decodeNative(substrate) == (nativeEncoder.encode(value), rest)
+
+    def testText(self):
+        record = makeRecord(1)
+        native, rest = decoder.decodeNative(encoder.encode(record), asn1Spec=Record())
+        assert native['name'] == record['name'].prettyPrint()
+        # The native encoder treats implicitly tagged character strings
+        # as their OCTET STRING base type
+        assert native['label'] == nativeEncoder.encode(record['label'])
+        assert native['label'] == record['label'].asOctets()
+
+    def testTrailingSubstrate(self):
+        substrate = derEncoder.encode(makeRecord(2))
+        native, rest = decoder.decodeNative(substrate + ints2octs((5, 0)), asn1Spec=Record())
+        assert rest == ints2octs((5, 0))
+
+    def testMissingComponent(self):
+        substrate = ints2octs((48, 3, 2, 1, 5))
+        for decodeFun in (decoder.decode, decoder.decodeNative):
+            try:
+                decodeFun(substrate, asn1Spec=Record())
+            except PyAsn1Error:
+                pass
+            else:
+                assert 0, 'missing mandatory component tolerated'
+
+
+class DecodeManyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.records = [makeRecord(index) for index in range(30)]
+        self.substrate = null.join([derEncoder.encode(x) for x in self.records])
+
+    def decodeEach(self, codec):
+        values = []
+        substrate = self.substrate
+        while substrate:
+            value, substrate = codec.decode(substrate, asn1Spec=Record())
+            values.append(value)
+        return values
+
+    def testValues(self):
+        for codec in (decoder, derDecoder, cerDecoder):
+            values = list(codec.decodeMany(self.substrate, Record()))
+            assert len(values) == len(self.records)
+            assert values == self.decodeEach(codec)
+
+    def testNative(self):
+        natives = list(decoder.decodeMany(self.substrate, Record(), asNative=True))
+        assert natives == [nativeEncoder.encode(x) for x in self.decodeEach(decoder)]
+
+    def testEmpty(self):
+        assert list(decoder.decodeMany(null, Record())) == []
+
+    def testTruncated(self):
+        try:
+            list(decoder.decodeMany(self.substrate[:-1], Record()))
+        except PyAsn1Error:
+            pass
+        else:
+            assert 0, 'truncated substrate tolerated'
+
+
+class StreamDecoderTestCase(unittest.TestCase):
+    def setUp(self):
+        sequenceOf = univ.SequenceOf(componentType=univ.Integer())
+        sequenceOf.extend([1, 2, 3])
+        self.values = [
+            univ.Integer(12345),
+            univ.OctetString(ints2octs(range(200))),
+            sequenceOf,
+            char.UTF8String('text')
+        ]
+        self.substrate = null.join([
+            encoder.encode(self.values[0]),
+            encoder.encode(self.values[1], defMode=False, maxChunkSize=50),
+            encoder.encode(self.values[2], defMode=False),
+            encoder.encode(self.values[3])
+        ])
+
+    def testPartialFeed(self):
+        streamDecoder = decoder.StreamDecoder()
+        values = []
+        for octet in range(len(self.substrate)):
+            streamDecoder.feed(self.substrate[octet:octet + 1])
+            values.extend(streamDecoder)
+        assert values == self.values
+
+    def testIncompleteValue(self):
+        streamDecoder = decoder.StreamDecoder()
+        streamDecoder.feed(self.substrate[:10])
+        assert list(streamDecoder) == [self.values[0]]
+        try:
+            streamDecoder.decodeNext()
+        except SubstrateUnderrunError:
+            pass
+        else:
+            assert 0, 'incomplete value decoded'
+        streamDecoder.feed(self.substrate[10:])
+        assert list(streamDecoder) == self.values[1:]
+
+    def testFileStream(self):
+        assert list(decoder.StreamDecoder(io.BytesIO(self.substrate))) == self.values
+
+    def testChunkedStream(self):
+        chunks = [self.substrate[x:x + 7] for x in range(0, len(self.substrate), 7)]
+        assert list(decoder.StreamDecoder(chunks)) == self.values
+
+    def testTruncatedStream(self):
+        try:
+            list(decoder.StreamDecoder(io.BytesIO(self.substrate[:-1])))
+        except SubstrateUnderrunError:
+            pass
+        else:
+            assert 0, 'truncated stream tolerated'
+
+    def testBufferLimit(self):
+        try:
+            list(decoder.StreamDecoder(io.BytesIO(self.substrate), maxBufferSize=100))
+        except PyAsn1Error:
+            pass
+        else:
+            assert 0, 'buffer limit ignored'
+
+    def testSpec(self):
+        substrate = null.join([derEncoder.encode(makeRecord(x)) for x in range(5)])
+        values = list(derDecoder.StreamDecoder(io.BytesIO(substrate), asn1Spec=Record()))
+        assert values == list(derDecoder.decodeMany(substrate, Record()))
+        assert len(values) == 5
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,112 @@
+#
+# This file is part of pyasn1 software.
+#
+# Copyright (c) 2005-2017, Ilya Etingof <etingof@gmail.com>
+# License: http://pyasn1.sf.net/license.html
+#
+import sys
+
+try:
+    import unittest2 as unittest
+
+except ImportError:
+    import unittest
+
+from pyasn1.type import tag, namedtype, univ, char, useful
+from pyasn1.codec.ber import encoder
+from pyasn1.codec.cer import encoder as cerEncoder
+from pyasn1.codec.der import encoder as derEncoder
+from pyasn1.compat.octets import ints2octs, null
+
+
+class Record(univ.Sequence):
+    componentType = namedtype.NamedTypes(
+        namedtype.NamedType('id', univ.Integer()),
+        namedtype.DefaultedNamedType('flag', univ.Boolean(False)),
+        namedtype.DefaultedNamedType('version', univ.Integer(1).subtype(
+            explicitTag=tag.Tag(tag.tagClassContext, tag.tagFormatSimple, 0))),
+        namedtype.NamedType('oid', univ.ObjectIdentifier()),
+        namedtype.NamedType('data', univ.OctetString()),
+        namedtype.OptionalNamedType('when', useful.UTCTime()),
+        namedtype.OptionalNamedType('names', univ.SetOf(componentType=char.PrintableString()))
+    )
+
+
+class Records(univ.SequenceOf):
+    componentType = Record()
+
+
+def makeRecords(count):
+    records = Records()
+    for index in range(count):
+        record = Record()
+        record['id'] = index
+        record['flag'] = bool(index % 2)
+        record['version'] = index % 3
+        record['oid'] = '1.2.840.113549.1.1.%d' % (index % 13)
+        record['data'] = ints2octs([index % 256] * (index * 40))
+        if index % 3:
+            record['when'] = '170101000000Z'
+        if index % 4:
+            record.setComponentByName('names')
+            record['names'].extend(['b%d' % index, 'a'])
+        records.append(record)
+    return records
+
+
+class EncodeIntoTestCase(unittest.TestCase):
+    def setUp(self):
+        self.records = makeRecords(20)
+
+    def testBytearray(self):
+        for codec in (encoder, cerEncoder, derEncoder):
+            buffer = bytearray(ints2octs((5, 0)))
+            length = codec.encodeInto(self.records, buffer)
+            substrate = codec.encode(self.records)
+            assert bytes(buffer) == ints2octs((5, 0)) + substrate
+            assert length == len(substrate)
+
+    def testList(self):
+        chunks = []
+        length = encoder.encodeInto(self.records, chunks, defMode=False, maxChunkSize=30)
+        substrate = encoder.encode(self.records, defMode=False, maxChunkSize=30)
+        assert null.join(chunks) == substrate
+        assert length == len(substrate)
+
+    def testSeveralValues(self):
+        buffer = bytearray()
+        for record in self.records:
+            derEncoder.encodeInto(record, buffer)
+        assert bytes(buffer) == null.join([derEncoder.encode(x) for x in self.records])
+
+
+class CachedEncoderTestCase(unittest.TestCase):
+    def setUp(self):
+        self.records = makeRecords(30)
+
+    def testParity(self):
+        for codec, options in ((encoder, {}),
+                               (encoder, {'defMode': False, 'maxChunkSize': 100}),
+                               (cerEncoder, {}),
+                               (derEncoder, {})):
+            cached = codec.Encoder(codec.tagMap, codec.typeMap, cacheSize=50)
+            substrate = codec.encode(self.records, **options)
+            for attempt in range(3):
+                assert cached(self.records, **options) == substrate
+            buffer = bytearray()
+            cached.encodeInto(self.records, buffer, **options)
+            assert bytes(buffer) == substrate
+
+    def testChangedValues(self):
+        cached = derEncoder.Encoder(derEncoder.tagMap, derEncoder.typeMap, cacheSize=1000)
+        cached(self.records)
+        self.records[5]['id'] = 77
+        self.records[7]['flag'] = False
+        self.records[8]['version'] = 1
+        assert cached(self.records) == derEncoder.encode(self.records)
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,44 @@
+#
+# This file is part of pyasn1 software.
+#
+# Copyright (c) 2005-2017, Ilya Etingof <etingof@gmail.com>
+# License: http://pyasn1.sf.net/license.html
+#
+import sys
+
+try:
+    import unittest2 as unittest
+
+except ImportError:
+    import unittest
+
+from pyasn1.type import univ
+from pyasn1.codec.cer import encoder
+from pyasn1.codec.der import encoder as derEncoder
+from pyasn1.compat.octets import ints2octs
+
+
+class SetOfEncoderTestCase(unittest.TestCase):
+    def setUp(self):
+        self.setOf = univ.SetOf(componentType=univ.OctetString())
+        self.setOf.extend([ints2octs((2,)), ints2octs((1, 1)), ints2octs((1,)), ints2octs(())])
+
+    def testOrder(self):
+        assert encoder.encode(self.setOf) == ints2octs(
+            (49, 128, 4, 0, 4, 1, 1, 4, 1, 2, 4, 2, 1, 1, 0, 0))
+        assert derEncoder.encode(self.setOf) == ints2octs(
+            (49, 12, 4, 0, 4, 1, 1, 4, 1, 2, 4, 2, 1, 1))
+
+    def testCached(self):
+        cached = derEncoder.Encoder(derEncoder.tagMap, derEncoder.typeMap, cacheSize=10)
+        for attempt in range(2):
+            assert cached(self.setOf) == derEncoder.encode(self.setOf)
+
+    def testEmpty(self):
+        assert derEncoder.encode(univ.SetOf(componentType=univ.Integer())) == ints2octs((49, 0))
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite)